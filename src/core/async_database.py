@@ -0,0 +1,103 @@
+"""
+Async facade for DatabaseManager.
+
+Every call runs on one dedicated DB thread that owns a persistent SQLite
+connection, so coroutines can ``await`` queries without stalling the event loop
+(the update pipeline today, a Kivy UI on the asyncio loop later).
+"""
+
+import asyncio
+import functools
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from core.database import DatabaseManager
+
+
+class _KeepAliveConnection(sqlite3.Connection):
+    """Connection that survives the ``conn.close()`` calls inside DatabaseManager."""
+
+    def close(self):
+        pass
+
+    def really_close(self):
+        super().close()
+
+
+class _ThreadBoundDatabase(DatabaseManager):
+    """DatabaseManager that reuses a single connection instead of opening one per call."""
+
+    def __init__(self, db_path: str):
+        self._conn = None
+        super().__init__(db_path)
+
+    def _get_connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, detect_types=sqlite3.PARSE_DECLTYPES|sqlite3.PARSE_COLNAMES,
+                                         factory=_KeepAliveConnection)
+        return self._conn
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run ``func`` on this thread; if it raises, roll back the transaction it
+        left open, so the shared connection never keeps holding the write lock.
+        """
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            if self._conn is not None and self._conn.in_transaction:
+                self._conn.rollback()
+            raise
+
+    def shutdown(self):
+        if self._conn is not None:
+            self._conn.really_close()
+            self._conn = None
+
+
+class AsyncDatabaseManager:
+    """
+    Same surface as DatabaseManager, but every method is a coroutine.
+
+    Example:
+        adb = AsyncDatabaseManager("data/app.db")
+        members = await adb.get_all_members()
+        await adb.upsert_videos(videos)
+    """
+
+    def __init__(self, db_path: str = "data/app.db"):
+        self.db_path = db_path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+        self._lock = threading.Lock()
+        # Create the connection (and schema) on the DB thread itself
+        self._db = self._executor.submit(_ThreadBoundDatabase, db_path).result()
+
+    async def run(self, func: Callable[[DatabaseManager], Any]) -> Any:
+        """Run ``func(db)`` on the DB thread, e.g. for ad-hoc queries or multi-step work."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._db.call, func, self._db)
+
+    def __getattr__(self, name: str):
+        target = getattr(_ThreadBoundDatabase, name, None)
+        if name.startswith("_") or not callable(target):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            bound = functools.partial(self._db.call, getattr(self._db, name), *args, **kwargs)
+            return await loop.run_in_executor(self._executor, bound)
+
+        call.__name__ = name
+        call.__doc__ = target.__doc__
+        return call
+
+    def close(self):
+        """Close the persistent connection and stop the DB thread."""
+        with self._lock:
+            if self._executor is None:
+                return
+            self._executor.submit(self._db.shutdown).result()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
@@ -0,0 +1,127 @@
+"""
+Long-lived asyncio loop on a background thread.
+
+The desktop app submits its async work (updates, housekeeping) here instead
+of spinning up an event loop per run, so state bound to a loop — the shared
+aiohttp session, caches, periodic jobs — survives between updates.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncService:
+    """
+    One event loop running forever on a daemon thread.
+
+    Example:
+        service = AsyncService.instance()
+        future = service.submit(manager.run_job(job))   # concurrent.futures.Future
+        service.every(600, manager.housekeeping)
+        ...
+        service.stop()
+
+    submit() is thread-safe; results come back on the loop thread, so GUI
+    code should go through ui.async_bridge.AsyncBridge.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "AsyncService":
+        """The application's shared service, started on first use."""
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.running:
+                cls._instance = AsyncService()
+                cls._instance.start()
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls):
+        """Stop the shared service if it was ever started."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop()
+                cls._instance = None
+
+    def __init__(self, name: str = "async-service"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._periodic = []
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self.loop is not None \
+            and not self.loop.is_closed()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            # Let cancelled tasks unwind before the loop goes away
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Schedule ``coro`` on the loop from any thread; returns a concurrent.futures.Future."""
+        if not self.running:
+            raise RuntimeError(f"{self.name} is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None):
+        """submit() and block for the result (not from the loop thread itself)."""
+        return self.submit(coro).result(timeout)
+
+    def every(self, interval: float, job: Callable[[], Awaitable], first_delay: Optional[float] = None) -> Future:
+        """
+        Run ``job()`` every ``interval`` seconds until the service stops (or the
+        returned future is cancelled). A failing run is logged and does not
+        stop the schedule.
+        """
+        async def periodic():
+            await asyncio.sleep(interval if first_delay is None else first_delay)
+            while True:
+                try:
+                    await job()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Periodic job {getattr(job, '__qualname__', job)} failed: {e}", exc_info=True)
+                await asyncio.sleep(interval)
+
+        future = self.submit(periodic())
+        self._periodic.append(future)
+        return future
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel periodic jobs, stop the loop and join the thread."""
+        if not self.running:
+            return
+        for future in self._periodic:
+            future.cancel()
+        self._periodic.clear()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
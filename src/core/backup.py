@@ -0,0 +1,258 @@
+"""
+Online snapshots of app.db with the SQLite backup API.
+
+Copying app.db (plus -wal/-shm) while an update is writing can produce a
+torn copy. Connection.backup() copies pages through SQLite itself, so a
+snapshot is always a consistent database, and in WAL mode the reader it
+uses never blocks the updater.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+from core.database import DatabaseManager
+from core.jobs import CancellationToken
+from models.progress import BackupResult, ExportProgress
+
+logger = logging.getLogger(__name__)
+
+# Pages copied per backup step (4 MB with the default page size), and the pause between steps
+BACKUP_PAGES = 1024
+BACKUP_SLEEP = 0.05
+# Snapshots kept by rotate(), and how old the newest may get before backup_if_due() takes another
+KEEP_SNAPSHOTS = 7
+BACKUP_INTERVAL = timedelta(hours=24)
+# A write from another connection restarts a stepped backup; after this many restarts the
+# remaining attempt copies everything in one step (one read transaction, still not blocking writers)
+MAX_RESTARTS = 3
+
+SNAPSHOT_PREFIX = "app-"
+SNAPSHOT_SUFFIX = ".db"
+# Tables a file must have to be restored over app.db
+_REQUIRED_TABLES = {"members", "videos", "change_log", "settings"}
+
+# Receives an ExportProgress (pages copied / pages in the database) after each step
+BackupProgressCallback = Callable[[ExportProgress], None]
+
+
+class BackupError(Exception):
+    """A snapshot could not be taken, or a file is not a restorable snapshot."""
+
+
+class _BackupCancelled(Exception):
+    pass
+
+
+class _BackupRestarted(Exception):
+    pass
+
+
+class BackupManager:
+    """
+    Takes, lists, rotates and restores snapshots of the application database.
+
+    Snapshots are plain single-file databases (journal_mode=DELETE) named
+    app-YYYYmmdd-HHMMSS.db in ``backup_dir`` (default: data/backups next to
+    app.db), and can be opened by any SQLite tool.
+    """
+
+    def __init__(self, db: DatabaseManager, backup_dir: Optional[str] = None, keep: int = KEEP_SNAPSHOTS):
+        self.db = db
+        self.backup_dir = backup_dir or os.path.join(os.path.dirname(os.path.abspath(db.db_path)), "backups")
+        self.keep = keep
+
+    # --- Snapshots ---
+    def create_snapshot(self, pages: int = BACKUP_PAGES, sleep: float = BACKUP_SLEEP,
+                        progress: Optional[BackupProgressCallback] = None,
+                        token: Optional[CancellationToken] = None, rotate: bool = True) -> BackupResult:
+        """
+        Copy the live database into a new snapshot, ``pages`` at a time, then
+        check it and (with ``rotate``) delete snapshots beyond the newest ``keep``.
+
+        The copy goes to "<snapshot>.part" and is renamed once it passed
+        PRAGMA quick_check, so a crashed or cancelled backup leaves no
+        half-written snapshot behind.
+        """
+        os.makedirs(self.backup_dir, exist_ok=True)
+        path = self._new_snapshot_path()
+        partial = path + ".part"
+        result = BackupResult(path)
+        start = time.perf_counter()
+        try:
+            result.pages = self._copy(partial, pages, sleep, progress, token)
+            self._finalize(partial)
+            os.replace(partial, path)
+        except _BackupCancelled:
+            result.cancelled = True
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        result.seconds = time.perf_counter() - start
+        if result.cancelled:
+            logger.info("Database backup cancelled")
+            return result
+
+        result.bytes = os.path.getsize(path)
+        logger.info(f"Database snapshot {path}: {result.pages} pages, {result.bytes / 1e6:.1f} MB "
+                    f"in {result.seconds:.1f}s")
+        if rotate:
+            self.rotate()
+        return result
+
+    def _new_snapshot_path(self) -> str:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.backup_dir, f"{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}")
+        n = 1
+        while os.path.exists(path):  # Two snapshots within a second
+            path = os.path.join(self.backup_dir, f"{SNAPSHOT_PREFIX}{stamp}-{n}{SNAPSHOT_SUFFIX}")
+            n += 1
+        return path
+
+    def _copy(self, target: str, pages: int, sleep: float, progress: Optional[BackupProgressCallback],
+              token: Optional[CancellationToken]) -> int:
+        # Returns the number of pages copied
+        restarts = 0
+        last_remaining = None
+        copied = 0
+
+        def on_step(status, remaining, total):
+            nonlocal restarts, last_remaining, copied
+            if token is not None and token.cancelled:
+                raise _BackupCancelled()
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > MAX_RESTARTS:
+                    raise _BackupRestarted()
+            last_remaining = remaining
+            copied = total
+            if progress:
+                progress(ExportProgress(total - remaining, total))
+
+        source = sqlite3.connect(self.db.db_path)
+        try:
+            try:
+                self._backup_to(source, target, pages, sleep, on_step)
+            except _BackupRestarted:
+                logger.info(f"Database backup restarted {restarts} times by concurrent writes; copying in one step")
+                last_remaining = None
+                self._backup_to(source, target, -1, sleep, on_step)
+        finally:
+            source.close()
+        return copied
+
+    @staticmethod
+    def _backup_to(source: sqlite3.Connection, target: str, pages: int, sleep: float, on_step):
+        if os.path.exists(target):
+            os.remove(target)
+        dest = sqlite3.connect(target)
+        try:
+            source.backup(dest, pages=pages, progress=on_step, sleep=sleep)
+        finally:
+            dest.close()
+
+    def _finalize(self, path: str):
+        # Self-contained file (no -wal needed to read it), verified before it counts as a snapshot
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+        self.check(path)
+
+    def list_snapshots(self) -> List[str]:
+        """Snapshot paths, newest first."""
+        try:
+            names = os.listdir(self.backup_dir)
+        except FileNotFoundError:
+            return []
+        paths = [os.path.join(self.backup_dir, n) for n in names
+                 if n.startswith(SNAPSHOT_PREFIX) and n.endswith(SNAPSHOT_SUFFIX)]
+        # By mtime, not name: "app-…-HHMMSS-1.db" (second snapshot within a second) sorts before "app-…-HHMMSS.db"
+        return sorted(paths, key=lambda path: (os.path.getmtime(path), path), reverse=True)
+
+    def rotate(self, keep: Optional[int] = None) -> List[str]:
+        """Delete all but the newest ``keep`` snapshots; returns the deleted paths."""
+        keep = self.keep if keep is None else keep
+        removed = []
+        for path in self.list_snapshots()[max(keep, 1):]:
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError as e:
+                logger.warning(f"Could not remove old snapshot {path}: {e}")
+        if removed:
+            logger.info(f"Removed {len(removed)} old database snapshots")
+        return removed
+
+    def last_snapshot_time(self) -> Optional[datetime]:
+        snapshots = self.list_snapshots()
+        return datetime.fromtimestamp(os.path.getmtime(snapshots[0])) if snapshots else None
+
+    def backup_if_due(self, interval: timedelta = BACKUP_INTERVAL,
+                      progress: Optional[BackupProgressCallback] = None,
+                      token: Optional[CancellationToken] = None) -> Optional[BackupResult]:
+        """Take a snapshot if the newest one is older than ``interval`` (for schedulers); None otherwise."""
+        last = self.last_snapshot_time()
+        if last is not None and datetime.now() - last < interval:
+            return None
+        return self.create_snapshot(progress=progress, token=token)
+
+    # --- Restore ---
+    def check(self, path: str):
+        """Raise BackupError unless ``path`` is an intact database with the app's tables."""
+        if not os.path.isfile(path):
+            raise BackupError(f"{path} does not exist")
+        try:
+            conn = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+            try:
+                problems = [row[0] for row in conn.execute("PRAGMA quick_check")]
+                tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError as e:
+            raise BackupError(f"{path} is not a usable database: {e}") from e
+        if problems != ["ok"]:
+            raise BackupError(f"{path} failed quick_check: {'; '.join(problems[:5])}")
+        missing = _REQUIRED_TABLES - tables
+        if missing:
+            raise BackupError(f"{path} is not an app database (missing {', '.join(sorted(missing))})")
+
+    def restore(self, path: str, progress: Optional[BackupProgressCallback] = None) -> BackupResult:
+        """
+        Replace the live database's contents with snapshot ``path``.
+
+        The snapshot is checked first, and the current database is saved as
+        a new snapshot before it is overwritten. The copy goes through the
+        backup API into the live database (one write transaction), so other
+        connections see either the old or the restored data. Callers should
+        hold DataManager.update_lock() so no update writes meanwhile.
+        """
+        self.check(path)
+        safety = self.create_snapshot(rotate=False)  # Rotating here could delete ``path`` itself
+        logger.info(f"Restoring database from {path} (previous contents saved to {safety.path})")
+
+        result = BackupResult(path)
+        start = time.perf_counter()
+        source = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True)
+        dest = sqlite3.connect(self.db.db_path)
+        try:
+            def on_step(status, remaining, total):
+                result.pages = total
+                if progress:
+                    progress(ExportProgress(total - remaining, total))
+
+            source.backup(dest, progress=on_step)
+            problems = [row[0] for row in dest.execute("PRAGMA quick_check")]
+        finally:
+            source.close()
+            dest.close()
+        if problems != ["ok"]:
+            raise BackupError(f"Restored database failed quick_check: {'; '.join(problems[:5])} "
+                              f"(previous contents are in {safety.path})")
+        result.seconds = time.perf_counter() - start
+        result.bytes = os.path.getsize(self.db.db_path)
+        logger.info(f"Database restored from {path} in {result.seconds:.1f}s")
+        return result
@@ -0,0 +1,318 @@
+"""
+Headless command line entry point.
+
+Runs the same ingestion pipeline as the GUI without Qt or Kivy, so updates can
+be driven from cron or a server while the desktop app only reads app.db.
+
+Usage (from the ``src`` directory):
+    python -m core.cli update                      # members + videos
+    python -m core.cli update --only videos --group hololive
+    python -m core.cli update --only favorites
+    python -m core.cli update --only stale --max-age 6       # channels not fetched for 6 hours
+    python -m core.cli update --channel UCxxxxxxxxxxxxxxxxxxxxxx
+    python -m core.cli update --watch --interval 3600
+    python -m core.cli stats
+    python -m core.cli export videos archive.parquet           # format from the extension
+    python -m core.cli export members members.txt --format jsonl --group nijisanji
+    python -m core.cli export videos daily.csv --delta nightly   # only videos new/updated since the last run
+    python -m core.cli backup --keep 7 --if-older-than 24    # snapshot app.db (cron-friendly)
+    python -m core.cli backup --list
+    python -m core.cli restore data/backups/app-20250101-030000.db
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from core.backup import KEEP_SNAPSHOTS, BackupError, BackupManager
+from core.export_manager import EXPORT_FORMATS, ExportManager
+from core.jobs import UpdateJob
+from core.log_buffer import LogBuffer
+from core.manager import DataManager
+from core.lock import LockHeldError
+
+logger = logging.getLogger(__name__)
+
+GROUPS = ("hololive", "nijisanji")
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_LOCKED = 3
+
+
+def _out(message: str):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+async def _timed(label: str, coro):
+    _out(f"{label}...")
+    start = time.perf_counter()
+    result = await coro
+    _out(f"{label} done in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+def _progress(event):
+    """Print channels that brought new videos or failed, plus a tally every 10%."""
+    step = max(1, event.total // 10)
+    if event.new_videos or event.error:
+        detail = f"{event.new_videos} new" if not event.error else f"failed: {event.error}"
+        _out(f"  [{event.done}/{event.total}] {event.name}: {detail}")
+    elif event.done % step == 0 or event.done == event.total:
+        _out(f"  [{event.done}/{event.total}] {event.new_total} new videos, {event.errors} errors so far")
+
+
+async def run_update(manager: DataManager, only: str = None, group: str = None,
+                     channel: str = None, max_age: float = 1.0) -> int:
+    """Run one update pass for the requested scope; returns the number of videos that could not be saved."""
+    seq_before = manager.db.get_change_seq()
+    log_seq = LogBuffer.install().last_seq
+    start = time.perf_counter()
+    result = None
+
+    try:
+        if channel:
+            result = await _timed(f"Updating videos of {channel}",
+                                  manager.run_job(UpdateJob("member", channel_id=channel), progress=_progress))
+        elif only == "stale":
+            job = UpdateJob("stale", group=group, max_age=timedelta(hours=max_age))
+            result = await _timed(f"Updating {job.describe()}", manager.run_job(job, progress=_progress))
+        else:
+            if only in (None, "members"):
+                await _timed("Updating members", manager.update_members())
+            if only in (None, "videos"):
+                result = await _timed(f"Updating videos ({group or 'all groups'})",
+                                      manager.update_recent_videos(group, progress=_progress))
+            elif only == "favorites":
+                result = await _timed(f"Updating favorite videos ({group or 'all groups'})",
+                                      manager.update_favorite_videos(group, progress=_progress))
+        await manager.prune_change_log()
+    finally:
+        # The shared HTTP session belongs to this asyncio.run() loop
+        await manager.close_http_session()
+
+    changes = manager.db.changes_since(seq_before)
+    new_videos = sum(1 for c in changes if c.entity == "video" and c.op == "insert")
+    updated_videos = sum(1 for c in changes if c.entity == "video" and c.op == "update")
+    members = len({c.entity_id for c in changes if c.entity == "member"})
+    _out(f"Update finished in {time.perf_counter() - start:.1f}s "
+         f"({new_videos} new videos, {updated_videos} updated, {members} members changed)")
+    _print_failures(log_seq)
+    lost = result.lost_videos if result is not None else 0
+    if lost:
+        _out(f"{lost} fetched videos could not be saved to the database")
+    return lost
+
+
+def _print_failures(after_seq: int):
+    """Summarise the warnings/errors logged during the run, grouped by channel."""
+    failures = LogBuffer.install().query(level=logging.WARNING, after_seq=after_seq)
+    if not failures:
+        return
+    by_channel = {}
+    for entry in failures:
+        by_channel.setdefault(entry.channel_id, []).append(entry)
+    _out(f"{len(failures)} warnings/errors during the update:")
+    for channel_id, entries in by_channel.items():
+        for entry in entries:
+            stage = f"[{entry.stage}] " if entry.stage else ""
+            print(f"  {channel_id or '-'}: {stage}{entry.level_name} {entry.message}")
+
+
+def update_once(manager: DataManager, only: str = None, group: str = None,
+                channel: str = None, max_age: float = 1.0) -> int:
+    try:
+        with manager.update_lock():
+            lost = asyncio.run(run_update(manager, only, group, channel, max_age))
+    except LockHeldError as e:
+        _out(f"Skipped: {e}")
+        return EXIT_LOCKED
+    except Exception as e:
+        logger.error(f"Update failed: {e}", exc_info=True)
+        _out(f"Update failed: {e}")
+        return EXIT_FAILED
+    return EXIT_FAILED if lost else EXIT_OK
+
+
+def watch(manager: DataManager, interval: float, only: str = None, group: str = None,
+          channel: str = None, max_age: float = 1.0) -> int:
+    """Repeat the update every ``interval`` seconds until interrupted."""
+    _out(f"Watching: updating every {interval:.0f}s (Ctrl+C to stop)")
+    try:
+        while True:
+            started = time.monotonic()
+            update_once(manager, only, group, channel, max_age)
+            delay = max(0.0, interval - (time.monotonic() - started))
+            _out(f"Next update in {delay:.0f}s")
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        _out("Stopped")
+    return EXIT_OK
+
+
+def print_stats(manager: DataManager, group: str = None) -> int:
+    db = manager.db
+    groups = (group,) if group else GROUPS
+    last_member_update = db.get_setting("last_member_update", "never")
+
+    _out(f"Database: {db.db_path}")
+    print(f"  Last member update: {last_member_update}")
+    print(f"  {'group':<12}{'members':>10}{'favorites':>11}{'videos':>10}{'collabs':>10}")
+    for g in groups:
+        print(f"  {g:<12}{db.count_members(g):>10}{len(db.get_favorite_members(g)):>11}"
+              f"{db.count_videos(g):>10}{db.count_videos(g, collabs_only=True):>10}")
+    if not group:
+        print(f"  {'total':<12}{db.count_members():>10}{len(db.get_favorite_members()):>11}"
+              f"{db.count_videos():>10}{db.count_videos(collabs_only=True):>10}")
+    return EXIT_OK
+
+
+def run_export(manager: DataManager, what: str, filepath: str, fmt: str = None, group: str = None,
+               delta: str = None, reset: bool = False) -> int:
+    """
+    Stream members or videos to ``filepath``, printing progress and throughput.
+    With ``delta`` (a checkpoint name), only videos changed since that checkpoint.
+    """
+    exporter = ExportManager(manager.db)
+    last_report = time.monotonic()
+
+    def progress(event):
+        nonlocal last_report
+        if time.monotonic() - last_report >= 5:
+            last_report = time.monotonic()
+            total = f" / {event.total:,}" if event.total else ""
+            _out(f"  {event.rows:,}{total} rows written")
+
+    try:
+        if delta:
+            if reset:
+                exporter.reset_checkpoint(delta)
+            result = exporter.export_videos_delta(filepath, fmt, delta, group, progress=progress)
+        elif what == "videos":
+            result = exporter.export_videos(filepath, fmt, group, progress=progress)
+        else:
+            result = exporter.export_members(filepath, fmt, group, progress=progress)
+    except (OSError, ValueError, RuntimeError) as e:
+        _out(f"Export failed: {e}")
+        return EXIT_FAILED
+    checkpoint = f", checkpoint {delta}={result.checkpoint}" if delta else ""
+    _out(f"Exported {result.rows:,} {what} to {result.path} ({result.format}) in {result.seconds:.3f}s "
+         f"({result.rows_per_second:,.0f} rows/s{checkpoint})")
+    return EXIT_OK
+
+
+def run_backup(manager: DataManager, keep: int, if_older_than: float = None, list_only: bool = False) -> int:
+    """Take a snapshot of app.db (and rotate old ones), or list the snapshots."""
+    backups = BackupManager(manager.db, keep=keep)
+    if list_only:
+        snapshots = backups.list_snapshots()
+        _out(f"{len(snapshots)} snapshots in {backups.backup_dir}")
+        for path in snapshots:
+            print(f"  {os.path.basename(path)}  {os.path.getsize(path) / 1e6:8.1f} MB")
+        return EXIT_OK
+    try:
+        if if_older_than is not None:
+            result = backups.backup_if_due(timedelta(hours=if_older_than))
+            if result is None:
+                _out(f"Newest snapshot is less than {if_older_than:g}h old; nothing to do")
+                return EXIT_OK
+        else:
+            result = backups.create_snapshot()
+    except (OSError, sqlite3.Error, BackupError) as e:
+        _out(f"Backup failed: {e}")
+        return EXIT_FAILED
+    _out(f"Snapshot {result.path}: {result.bytes / 1e6:.1f} MB in {result.seconds:.1f}s "
+         f"(keeping the newest {keep})")
+    return EXIT_OK
+
+
+def run_restore(manager: DataManager, path: str) -> int:
+    """Replace app.db's contents with snapshot ``path`` (checked first; the current data is snapshotted)."""
+    try:
+        with manager.update_lock():
+            result = BackupManager(manager.db).restore(path)
+    except LockHeldError as e:
+        _out(f"Skipped: {e}")
+        return EXIT_LOCKED
+    except (OSError, sqlite3.Error, BackupError) as e:
+        _out(f"Restore failed: {e}")
+        return EXIT_FAILED
+    _out(f"Restored {manager.db.db_path} from {result.path} in {result.seconds:.1f}s")
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m core.cli", description="HoloNiji headless updater")
+    parser.add_argument("--db", default="data/app.db", help="Path to app.db (default: data/app.db)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show INFO logs from the pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="Fetch members and/or videos")
+    update.add_argument("--only", choices=("members", "videos", "favorites", "stale"),
+                        help="Restrict the update (default: members + videos)")
+    update.add_argument("--group", choices=GROUPS, help="Restrict video updates to one group")
+    update.add_argument("--channel", help="Only update the videos of this channel ID")
+    update.add_argument("--max-age", type=float, default=1.0,
+                        help="With --only stale: hours since a channel's last successful fetch (default: 1)")
+    update.add_argument("--watch", action="store_true", help="Keep running and update periodically")
+    update.add_argument("--interval", type=float, default=3600, help="Seconds between updates with --watch")
+
+    stats = sub.add_parser("stats", help="Print database statistics")
+    stats.add_argument("--group", choices=GROUPS)
+
+    export = sub.add_parser("export", help="Stream members or the whole video archive to a file")
+    export.add_argument("what", choices=("videos", "members"))
+    export.add_argument("path", help="Output file")
+    export.add_argument("--format", choices=EXPORT_FORMATS,
+                        help="Output format (default: from the file extension, else csv; parquet needs pyarrow)")
+    export.add_argument("--group", choices=GROUPS)
+    export.add_argument("--delta", metavar="NAME",
+                        help="Videos only: export what changed since the last run with this checkpoint name")
+    export.add_argument("--reset", action="store_true", help="With --delta: start over with a full export")
+
+    backup = sub.add_parser("backup", help="Snapshot app.db into data/backups (online, via the SQLite backup API)")
+    backup.add_argument("--keep", type=int, default=KEEP_SNAPSHOTS,
+                        help=f"Snapshots to keep (default: {KEEP_SNAPSHOTS})")
+    backup.add_argument("--if-older-than", type=float, metavar="HOURS",
+                        help="Only take a snapshot if the newest one is older than this")
+    backup.add_argument("--list", action="store_true", help="List the snapshots instead")
+
+    restore = sub.add_parser("restore", help="Replace app.db's contents with a snapshot")
+    restore.add_argument("path", help="Snapshot file")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        force=True
+    )
+    # The log buffer keeps INFO records for the failure summary; the console only shows them with -v
+    logging.getLogger().handlers[0].setLevel(logging.INFO if args.verbose else logging.WARNING)
+    LogBuffer.install()
+
+    manager = DataManager(args.db)
+    if args.command == "stats":
+        return print_stats(manager, args.group)
+    if args.command == "export":
+        if args.delta and args.what != "videos":
+            build_parser().error("--delta only applies to videos")
+        return run_export(manager, args.what, args.path, args.format, args.group, args.delta, args.reset)
+    if args.command == "backup":
+        return run_backup(manager, args.keep, args.if_older_than, args.list)
+    if args.command == "restore":
+        return run_restore(manager, args.path)
+    if args.watch:
+        return watch(manager, args.interval, args.only, args.group, args.channel, args.max_age)
+    return update_once(manager, args.only, args.group, args.channel, args.max_age)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
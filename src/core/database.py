@@ -1,9 +1,13 @@
 import sqlite3
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from models.member import Member
 from models.video import Video
+from models.change import Change
+
+# Stored in PRAGMA user_version; bump when the change_log triggers' watched columns change
+CHANGE_TRIGGERS_VERSION = 1
 
 def _adapt_datetime(dt: datetime) -> str:
     return dt.isoformat()
@@ -43,9 +47,14 @@ class DatabaseManager:
                 youtube_url TEXT NOT NULL,
                 twitter_url TEXT,
                 is_favorite INTEGER DEFAULT 0,
-                icon_url TEXT
+                icon_url TEXT,
+                en_name TEXT
             )
         ''')
+        # Columns added after the first release (ALTER TABLE appends, matching Member's field order)
+        member_columns = {row[1] for row in cursor.execute('PRAGMA table_info(members)')}
+        if 'en_name' not in member_columns:
+            cursor.execute('ALTER TABLE members ADD COLUMN en_name TEXT')
 
         # Videos Table
         cursor.execute('''
@@ -62,6 +71,31 @@ class DatabaseManager:
             )
         ''')
 
+        # Newest-first listings and exports walk this instead of sorting the whole table
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_published_at ON videos(published_at)')
+
+        # Change Log (filled by triggers; consumers read deltas with changes_since)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                entity TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                op TEXT NOT NULL,
+                changed_at TIMESTAMP NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime'))
+            )
+        ''')
+        self._create_change_triggers(cursor)
+
+        # Per-channel fetch bookkeeping (stale-only updates refetch what has not succeeded recently)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS channel_fetch_state (
+                channel_id TEXT PRIMARY KEY,
+                last_attempt_at TIMESTAMP NOT NULL,
+                last_success_at TIMESTAMP,
+                last_error TEXT
+            )
+        ''')
+
         # Settings Table (for app metadata like last update dates)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -73,6 +107,82 @@ class DatabaseManager:
         conn.commit()
         conn.close()
 
+    def _create_change_triggers(self, cursor):
+        # Upserts of unchanged rows (every hourly RSS refetch) hit the UPDATE
+        # triggers too, so updates are only logged when a column really changed.
+        watched = {
+            ("videos", "video", "video_id"): ("title", "url", "channel_id", "published_at",
+                                              "thumbnail_url", "description", "is_collab"),
+            ("members", "member", "channel_id"): ("name", "group_name", "generation", "channel_id",
+                                                  "youtube_url", "twitter_url", "is_favorite", "icon_url",
+                                                  "en_name"),
+        }
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version < CHANGE_TRIGGERS_VERSION:
+            # Triggers from an older version watch fewer columns; CREATE ... IF NOT EXISTS would keep them
+            for table, _, _ in watched:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {table}_log_update')
+        for (table, entity, key), columns in watched.items():
+            changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns)
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_log_insert AFTER INSERT ON {table}
+                BEGIN
+                    INSERT INTO change_log (entity, entity_id, op) VALUES ('{entity}', NEW.{key}, 'insert');
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_log_update AFTER UPDATE ON {table}
+                WHEN {changed}
+                BEGIN
+                    INSERT INTO change_log (entity, entity_id, op) VALUES ('{entity}', NEW.{key}, 'update');
+                END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_log_delete AFTER DELETE ON {table}
+                BEGIN
+                    INSERT INTO change_log (entity, entity_id, op) VALUES ('{entity}', OLD.{key}, 'delete');
+                END
+            ''')
+        if version < CHANGE_TRIGGERS_VERSION:
+            cursor.execute(f'PRAGMA user_version = {CHANGE_TRIGGERS_VERSION}')
+
+    # --- Change Log ---
+    def get_change_seq(self) -> int:
+        """Latest change_log sequence number (0 when nothing was logged yet)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT COALESCE(MAX(seq), 0) FROM change_log')
+        seq = cursor.fetchone()[0]
+        conn.close()
+        return seq
+
+    def changes_since(self, seq: int, limit: Optional[int] = None) -> List[Change]:
+        """Changes logged after ``seq``, oldest first"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT seq, entity, entity_id, op, changed_at FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?',
+                       (seq, limit if limit is not None else -1))
+        rows = cursor.fetchall()
+        conn.close()
+        return [Change(*row) for row in rows]
+
+    def prune_change_log(self, before: datetime, up_to_seq: Optional[int] = None) -> int:
+        """
+        Delete changes logged before ``before`` with seq <= ``up_to_seq`` (any
+        seq when None); returns the number deleted. The newest row is always
+        kept, so get_change_seq() never goes backwards.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            DELETE FROM change_log
+            WHERE seq <= COALESCE(?, seq) AND seq < (SELECT MAX(seq) FROM change_log) AND changed_at < ?
+        ''', (up_to_seq, before.strftime('%Y-%m-%dT%H:%M:%S')))
+        deleted = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+
     # --- Settings ---
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         conn = self._get_connection()
@@ -82,6 +192,14 @@ class DatabaseManager:
         conn.close()
         return row[0] if row else default
 
+    def get_settings_with_prefix(self, prefix: str) -> Dict[str, str]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT key, value FROM settings WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+        rows = cursor.fetchall()
+        conn.close()
+        return dict(rows)
+
     def set_setting(self, key: str, value: str):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -97,17 +215,18 @@ class DatabaseManager:
         conn = self._get_connection()
         cursor = conn.cursor()
         cursor.execute('''
-            INSERT INTO members (name, group_name, generation, channel_id, youtube_url, twitter_url, icon_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO members (name, group_name, generation, channel_id, youtube_url, twitter_url, icon_url, en_name)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(channel_id) DO UPDATE SET
                 name=excluded.name,
                 group_name=excluded.group_name,
                 generation=excluded.generation,
                 youtube_url=excluded.youtube_url,
                 twitter_url=excluded.twitter_url,
-                icon_url=excluded.icon_url
+                icon_url=excluded.icon_url,
+                en_name=COALESCE(excluded.en_name, members.en_name)
         ''', (member.name, member.group_name, member.generation, member.channel_id, 
-              member.youtube_url, member.twitter_url, member.icon_url))
+              member.youtube_url, member.twitter_url, member.icon_url, member.en_name))
         conn.commit()
         conn.close()
 
@@ -119,6 +238,89 @@ class DatabaseManager:
         conn.close()
         return [Member(*row) for row in rows]
 
+    def get_member(self, channel_id: str) -> Optional[Member]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM members WHERE channel_id = ?', (channel_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return Member(*row) if row else None
+
+    def get_favorite_members(self, group_name: Optional[str] = None) -> List[Member]:
+        """Get favorite members, optionally restricted to one group"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        if group_name:
+            cursor.execute('SELECT * FROM members WHERE is_favorite = 1 AND group_name = ? ORDER BY generation, name', (group_name,))
+        else:
+            cursor.execute('SELECT * FROM members WHERE is_favorite = 1 ORDER BY group_name, generation, name')
+        rows = cursor.fetchall()
+        conn.close()
+        return [Member(*row) for row in rows]
+
+    def get_stats(self, group_name: Optional[str] = None) -> dict:
+        """
+        Aggregates for the stats dashboard, optionally restricted to one group.
+
+        Returns member totals (overall, per group, favorites), video and collab
+        counts, member counts per "[group] generation" (largest first) and
+        (name, video count, group) per member (most videos first).
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        where, params = ('WHERE group_name = ?', (group_name,)) if group_name else ('', ())
+        cursor.execute(f'''
+            SELECT group_name, generation, COUNT(*), SUM(is_favorite) FROM members {where}
+            GROUP BY group_name, generation
+        ''', params)
+        generations = cursor.fetchall()
+
+        # One pass over videos; members without videos count as 0
+        cursor.execute('SELECT channel_id, COUNT(*), SUM(is_collab) FROM videos GROUP BY channel_id')
+        per_channel = {channel_id: (count, collabs or 0) for channel_id, count, collabs in cursor.fetchall()}
+        cursor.execute(f'SELECT channel_id, name, group_name FROM members {where}', params)
+        members = cursor.fetchall()
+        conn.close()
+
+        by_group = {}
+        for group, _, count, _ in generations:
+            by_group[group] = by_group.get(group, 0) + count
+        if group_name:
+            channels = [channel_id for channel_id, _, _ in members]
+        else:
+            channels = list(per_channel)  # Also counts videos of channels that are no longer members
+        return {
+            "members": sum(by_group.values()),
+            "by_group": by_group,
+            "favorites": sum(fav or 0 for _, _, _, fav in generations),
+            "videos": sum(per_channel.get(c, (0, 0))[0] for c in channels),
+            "collabs": sum(per_channel.get(c, (0, 0))[1] for c in channels),
+            "generations": sorted(((f"[{group}] {gen}", count) for group, gen, count, _ in generations),
+                                  key=lambda x: x[1], reverse=True),
+            "member_videos": sorted(((name, per_channel.get(channel_id, (0, 0))[0], group)
+                                     for channel_id, name, group in members), key=lambda x: x[1], reverse=True),
+        }
+
+    def count_members(self, group_name: Optional[str] = None) -> int:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        if group_name:
+            cursor.execute('SELECT COUNT(*) FROM members WHERE group_name = ?', (group_name,))
+        else:
+            cursor.execute('SELECT COUNT(*) FROM members')
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    def update_channel_id(self, old_id: str, new_id: str):
+        """Rename a member's channel ID (e.g. niji_ slug -> UC ID) and re-point its videos"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('UPDATE members SET channel_id = ? WHERE channel_id = ?', (new_id, old_id))
+        cursor.execute('UPDATE videos SET channel_id = ? WHERE channel_id = ?', (new_id, old_id))
+        conn.commit()
+        conn.close()
+
     def toggle_favorite(self, channel_id: str, is_favorite: bool):
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -126,6 +328,50 @@ class DatabaseManager:
         conn.commit()
         conn.close()
 
+    # --- Channel Fetch State ---
+    def record_channel_fetch(self, channel_id: str, error: Optional[str] = None):
+        """Remember that ``channel_id`` was just fetched (successfully unless ``error``)"""
+        now = datetime.now()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO channel_fetch_state (channel_id, last_attempt_at, last_success_at, last_error)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(channel_id) DO UPDATE SET
+                last_attempt_at = excluded.last_attempt_at,
+                last_success_at = COALESCE(excluded.last_success_at, channel_fetch_state.last_success_at),
+                last_error = excluded.last_error
+        ''', (channel_id, now, None if error else now, error))
+        conn.commit()
+        conn.close()
+
+    def get_stale_members(self, fetched_before: datetime, group_name: Optional[str] = None) -> List[Member]:
+        """Members whose channel has not been fetched successfully since ``fetched_before``"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        query = '''
+            SELECT m.* FROM members m
+            LEFT JOIN channel_fetch_state s ON s.channel_id = m.channel_id
+            WHERE (s.last_success_at IS NULL OR s.last_success_at < ?)
+        '''
+        params = [fetched_before]
+        if group_name:
+            query += ' AND m.group_name = ?'
+            params.append(group_name)
+        cursor.execute(query + ' ORDER BY m.group_name, m.generation, m.name', params)
+        rows = cursor.fetchall()
+        conn.close()
+        return [Member(*row) for row in rows]
+
+    def get_fetched_channel_ids(self, since: datetime) -> set:
+        """channel_ids fetched successfully at or after ``since``"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT channel_id FROM channel_fetch_state WHERE last_success_at >= ?', (since,))
+        ids = {row[0] for row in cursor.fetchall()}
+        conn.close()
+        return ids
+
     # --- Videos ---
     def upsert_video(self, video: Video):
         conn = self._get_connection()
@@ -143,6 +389,36 @@ class DatabaseManager:
         conn.commit()
         conn.close()
 
+    def upsert_videos(self, videos: List[Video]):
+        """Upsert a batch of videos in a single transaction"""
+        if not videos:
+            return
+        conn = self._get_connection()
+        with conn:
+            conn.executemany('''
+                INSERT INTO videos (video_id, title, url, channel_id, published_at, thumbnail_url, description, is_collab)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(video_id) DO UPDATE SET
+                    title=excluded.title,
+                    thumbnail_url=excluded.thumbnail_url,
+                    description=excluded.description,
+                    is_collab=excluded.is_collab
+            ''', [(v.video_id, v.title, v.url, v.channel_id, v.published_at,
+                   v.thumbnail_url, v.description, 1 if v.is_collab else 0) for v in videos])
+        conn.close()
+
+    def get_existing_video_ids(self, video_ids: List[str]) -> set:
+        """The given video_ids that are already stored (to tell new uploads from known ones)"""
+        existing = set()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        for i in range(0, len(video_ids), 500):
+            chunk = video_ids[i:i + 500]
+            cursor.execute(f'SELECT video_id FROM videos WHERE video_id IN ({",".join("?" * len(chunk))})', chunk)
+            existing.update(row[0] for row in cursor.fetchall())
+        conn.close()
+        return existing
+
     def get_videos(self, limit: int = 50, offset: int = 0) -> List[Video]:
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -151,6 +427,38 @@ class DatabaseManager:
         conn.close()
         return [Video(*row) for row in rows]
     
+    def count_videos(self, group_name: Optional[str] = None, collabs_only: bool = False) -> int:
+        """Count stored videos, optionally per group and/or collabs only"""
+        query = 'SELECT COUNT(*) FROM videos v'
+        conditions, params = [], []
+        if group_name:
+            query += ' JOIN members m ON v.channel_id = m.channel_id'
+            conditions.append('m.group_name = ?')
+            params.append(group_name)
+        if collabs_only:
+            conditions.append('v.is_collab = 1')
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    def get_videos_by_ids(self, video_ids: List[str]) -> List[Video]:
+        """Get the given videos (missing IDs are skipped), newest first"""
+        videos = []
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        for i in range(0, len(video_ids), 500):
+            chunk = video_ids[i:i + 500]
+            cursor.execute(f'SELECT * FROM videos WHERE video_id IN ({",".join("?" * len(chunk))})', chunk)
+            videos.extend(Video(*row) for row in cursor.fetchall())
+        conn.close()
+        return sorted(videos, key=lambda v: v.published_at, reverse=True)
+
     def get_videos_by_channel(self, channel_id: str, limit: int = 20) -> List[Video]:
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -159,6 +467,66 @@ class DatabaseManager:
         conn.close()
         return [Video(*row) for row in rows]
 
+    # --- Streaming (exports) ---
+    def _iter_chunks(self, query: str, params=(), chunk_size: int = 5000) -> Iterator[List[tuple]]:
+        # One statement stepped with fetchmany: a single WAL read snapshot, memory bounded by
+        # chunk_size. The connection closes when the generator is exhausted or closed.
+        # Values come back as stored (no TIMESTAMP conversion: published_at stays ISO text).
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
+
+    def iter_video_rows(self, columns: List[str], group_name: Optional[str] = None, limit: Optional[int] = None,
+                        chunk_size: int = 5000) -> Iterator[List[tuple]]:
+        """Yield ``columns`` of videos (optionally of one group), newest first, ``chunk_size`` rows at a time"""
+        query = f'SELECT {", ".join("v." + c for c in columns)} FROM videos v'
+        params = []
+        if group_name:
+            query += ' JOIN members m ON v.channel_id = m.channel_id WHERE m.group_name = ?'
+            params.append(group_name)
+        query += ' ORDER BY v.published_at DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+        return self._iter_chunks(query, params, chunk_size)
+
+    def iter_changed_video_rows(self, columns: List[str], after_seq: int, until_seq: int,
+                                group_name: Optional[str] = None, chunk_size: int = 5000) -> Iterator[List[tuple]]:
+        """
+        Like iter_video_rows, but only videos inserted or updated by changes
+        after_seq < seq <= until_seq (a range scan of change_log's primary key)
+        """
+        query = f'''
+            SELECT {", ".join("v." + c for c in columns)} FROM videos v
+            JOIN (SELECT DISTINCT entity_id FROM change_log
+                  WHERE seq > ? AND seq <= ? AND entity = 'video' AND op != 'delete') c
+              ON c.entity_id = v.video_id
+        '''
+        params = [after_seq, until_seq]
+        if group_name:
+            query += ' JOIN members m ON v.channel_id = m.channel_id WHERE m.group_name = ?'
+            params.append(group_name)
+        query += ' ORDER BY v.published_at DESC'
+        return self._iter_chunks(query, params, chunk_size)
+
+    def iter_member_rows(self, columns: List[str], group_name: Optional[str] = None,
+                         chunk_size: int = 5000) -> Iterator[List[tuple]]:
+        """Yield ``columns`` of members (optionally of one group) in get_all_members order"""
+        query = f'SELECT {", ".join(columns)} FROM members'
+        params = []
+        if group_name:
+            query += ' WHERE group_name = ?'
+            params.append(group_name)
+        query += ' ORDER BY group_name, generation, name'
+        return self._iter_chunks(query, params, chunk_size)
+
     # --- Group-based queries ---
     def get_members_by_group(self, group_name: str) -> List[Member]:
         """Get all members from a specific group (hololive or nijisanji)"""
@@ -184,7 +552,7 @@ class DatabaseManager:
         conn.close()
         return [Video(*row) for row in rows]
 
-    def get_collabs_by_group(self, group_name: str, limit: int = 50) -> List[Video]:
+    def get_collabs_by_group(self, group_name: str, limit: int = 50, offset: int = 0) -> List[Video]:
         """Get collaboration videos from members of a specific group"""
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -193,13 +561,13 @@ class DatabaseManager:
             JOIN members m ON v.channel_id = m.channel_id
             WHERE m.group_name = ? AND v.is_collab = 1
             ORDER BY v.published_at DESC
-            LIMIT ?
-        ''', (group_name, limit))
+            LIMIT ? OFFSET ?
+        ''', (group_name, limit, offset))
         rows = cursor.fetchall()
         conn.close()
         return [Video(*row) for row in rows]
 
-    def get_favorites_by_group(self, group_name: str, limit: int = 50) -> List[Video]:
+    def get_favorites_by_group(self, group_name: str, limit: int = 50, offset: int = 0) -> List[Video]:
         """Get videos from favorite members of a specific group"""
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -208,9 +576,32 @@ class DatabaseManager:
             JOIN members m ON v.channel_id = m.channel_id
             WHERE m.group_name = ? AND m.is_favorite = 1
             ORDER BY v.published_at DESC
-            LIMIT ?
-        ''', (group_name, limit))
+            LIMIT ? OFFSET ?
+        ''', (group_name, limit, offset))
         rows = cursor.fetchall()
         conn.close()
         return [Video(*row) for row in rows]
 
+    def get_collabs(self, limit: int = 50, offset: int = 0) -> List[Video]:
+        """Get collaboration videos across all groups"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM videos WHERE is_collab = 1 ORDER BY published_at DESC LIMIT ? OFFSET ?', (limit, offset))
+        rows = cursor.fetchall()
+        conn.close()
+        return [Video(*row) for row in rows]
+
+    def get_favorite_videos(self, limit: int = 50, offset: int = 0) -> List[Video]:
+        """Get videos from favorite members across all groups"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT v.* FROM videos v
+            JOIN members m ON v.channel_id = m.channel_id
+            WHERE m.is_favorite = 1
+            ORDER BY v.published_at DESC
+            LIMIT ? OFFSET ?
+        ''', (limit, offset))
+        rows = cursor.fetchall()
+        conn.close()
+        return [Video(*row) for row in rows]
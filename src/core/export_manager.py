@@ -1,14 +1,136 @@
 """
 Export utilities for backing up and exporting data from the application.
+
+Every export writes to "<path>.part" and renames it over ``path`` once it is
+complete, so a failed or cancelled export never leaves a truncated file.
 """
 
 import csv
 import json
+import logging
+import os
+import time
 from datetime import datetime
-from typing import List
-from models.member import Member
-from models.video import Video
+from typing import Callable, Iterator, List, Optional
 from core.database import DatabaseManager
+from core.jobs import CancellationToken
+from models.progress import ExportProgress, ExportResult
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+VIDEO_COLUMNS = ['video_id', 'title', 'url', 'channel_id', 'published_at', 'is_collab']
+MEMBER_COLUMNS = ['name', 'group_name', 'generation', 'channel_id', 'youtube_url', 'twitter_url', 'is_favorite']
+# Stored as 0/1: written as 1/0 in CSV, as booleans in JSON Lines and Parquet
+_FLAG_COLUMNS = {'is_collab', 'is_favorite'}
+
+# Rows fetched from SQLite per step, and rows per Parquet row group
+CHUNK_SIZE = 5000
+PARQUET_ROW_GROUP = 100_000
+
+# Settings key of a delta export's checkpoint (last change_log seq it covered)
+CHECKPOINT_KEY = "export_checkpoint:{name}"
+
+# Receives an ExportProgress after each chunk (called on the exporting thread)
+ExportProgressCallback = Callable[[ExportProgress], None]
+
+
+def _partial_path(filepath: str) -> str:
+    return filepath + ".part"
+
+
+def _discard(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def parquet_available() -> bool:
+    """Parquet export needs the optional pyarrow package."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def export_format(filepath: str, fmt: Optional[str] = None) -> str:
+    """``fmt``, or the format named by ``filepath``'s extension (CSV when it names none)."""
+    if fmt is None:
+        extension = os.path.splitext(filepath)[1].lstrip('.').lower()
+        fmt = extension if extension in EXPORT_FORMATS else "csv"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})")
+    if fmt == "parquet" and not parquet_available():
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+    return fmt
+
+
+class _CsvSink:
+    def __init__(self, filepath: str, columns: List[str]):
+        self.file = open(filepath, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, rows: List[tuple]):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class _JsonLinesSink:
+    def __init__(self, filepath: str, columns: List[str]):
+        self.file = open(filepath, 'w', encoding='utf-8')
+        self.columns = columns
+        self.flags = [i for i, c in enumerate(columns) if c in _FLAG_COLUMNS]
+
+    def write(self, rows: List[tuple]):
+        lines = []
+        for row in rows:
+            record = dict(zip(self.columns, row))
+            for i in self.flags:
+                record[self.columns[i]] = bool(row[i])
+            lines.append(json.dumps(record, ensure_ascii=False))
+        lines.append('')
+        self.file.write('\n'.join(lines))
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetSink:
+    def __init__(self, filepath: str, columns: List[str]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.columns = columns
+        self.schema = pa.schema([(c, pa.bool_() if c in _FLAG_COLUMNS else pa.string()) for c in columns])
+        self.writer = pq.ParquetWriter(filepath, self.schema)
+        self.pending = []  # Rows buffered up to one row group
+
+    def write(self, rows: List[tuple]):
+        self.pending.extend(rows)
+        if len(self.pending) >= PARQUET_ROW_GROUP:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        values = list(zip(*self.pending))
+        arrays = [self.pa.array([bool(v) for v in values[i]] if c in _FLAG_COLUMNS else values[i], type=field.type)
+                  for i, (c, field) in enumerate(zip(self.columns, self.schema))]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+        self.pending = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+_SINKS = {"csv": _CsvSink, "jsonl": _JsonLinesSink, "parquet": _ParquetSink}
 
 
 class ExportManager:
@@ -16,8 +138,128 @@ class ExportManager:
     
     def __init__(self, db: DatabaseManager):
         self.db = db
-    
-    def export_members_csv(self, filepath: str, group_filter: str = None):
+
+    def export_videos(self, filepath: str, fmt: Optional[str] = None, group_filter: Optional[str] = None,
+                      limit: Optional[int] = None, progress: Optional[ExportProgressCallback] = None,
+                      token: Optional[CancellationToken] = None) -> ExportResult:
+        """
+        Export videos (newest first) to CSV, JSON Lines or Parquet.
+
+        Rows are streamed from the database in chunks, so memory use does not
+        grow with the archive.
+
+        Args:
+            filepath: Path to save the file
+            fmt: "csv", "jsonl" or "parquet" (default: from the file extension)
+            group_filter: Optional group filter
+            limit: Maximum number of videos to export (default: all)
+            progress: Called with an ExportProgress after each chunk
+            token: Checked between chunks; a cancelled export leaves ``filepath`` untouched
+
+        Returns:
+            ExportResult (``cancelled`` set if ``token`` was cancelled)
+        """
+        fmt = export_format(filepath, fmt)
+        total = self.db.count_videos(group_filter)
+        if limit is not None:
+            total = min(total, limit)
+        chunks = self.db.iter_video_rows(VIDEO_COLUMNS, group_filter, limit, chunk_size=CHUNK_SIZE)
+        return self._export(chunks, VIDEO_COLUMNS, filepath, fmt, total, progress, token)
+
+    def export_videos_delta(self, filepath: str, fmt: Optional[str] = None, name: str = "videos",
+                            group_filter: Optional[str] = None, progress: Optional[ExportProgressCallback] = None,
+                            token: Optional[CancellationToken] = None) -> ExportResult:
+        """
+        Export only the videos inserted or updated since the last delta export
+        called ``name`` (everything on the first run).
+
+        The checkpoint is the change_log sequence number read before the
+        export; it is stored in the settings table (one transaction) after the
+        file was renamed into place, so a crash in between re-exports the same
+        rows next time rather than skipping any. Being in the same database as
+        the change_log, it also travels with backups and restores.
+
+        Args:
+            filepath: Path to save the file
+            fmt: "csv", "jsonl" or "parquet" (default: from the file extension)
+            name: Checkpoint name; use one per downstream consumer (and group filter)
+            group_filter: Optional group filter
+            progress: Called with an ExportProgress after each chunk
+            token: Checked between chunks; a cancelled export keeps the old checkpoint
+
+        Returns:
+            ExportResult with ``checkpoint`` set to the new high-water mark
+        """
+        fmt = export_format(filepath, fmt)
+        key = CHECKPOINT_KEY.format(name=name)
+        since = int(self.db.get_setting(key, "0"))
+        until = self.db.get_change_seq()
+        if since > until:
+            logger.warning(f"Export checkpoint {name} ({since}) is ahead of the change log ({until}); "
+                           f"exporting everything")
+            since = 0
+
+        if since == 0:
+            chunks = self.db.iter_video_rows(VIDEO_COLUMNS, group_filter, chunk_size=CHUNK_SIZE)
+            total = self.db.count_videos(group_filter)
+        else:
+            chunks = self.db.iter_changed_video_rows(VIDEO_COLUMNS, since, until, group_filter, chunk_size=CHUNK_SIZE)
+            total = None
+        result = self._export(chunks, VIDEO_COLUMNS, filepath, fmt, total, progress, token)
+        if not result.cancelled:
+            self.db.set_setting(key, str(until))
+            result.checkpoint = until
+            logger.info(f"Export checkpoint {name}: {since} -> {until}")
+        return result
+
+    def reset_checkpoint(self, name: str = "videos"):
+        """Make the next delta export called ``name`` export everything."""
+        self.db.set_setting(CHECKPOINT_KEY.format(name=name), "0")
+
+    def export_members(self, filepath: str, fmt: Optional[str] = None, group_filter: Optional[str] = None,
+                       progress: Optional[ExportProgressCallback] = None,
+                       token: Optional[CancellationToken] = None) -> ExportResult:
+        """Export members to CSV, JSON Lines or Parquet (see export_videos)."""
+        fmt = export_format(filepath, fmt)
+        total = self.db.count_members(group_filter)
+        chunks = self.db.iter_member_rows(MEMBER_COLUMNS, group_filter, chunk_size=CHUNK_SIZE)
+        return self._export(chunks, MEMBER_COLUMNS, filepath, fmt, total, progress, token)
+
+    def _export(self, chunks: Iterator[List[tuple]], columns: List[str], filepath: str, fmt: str, total: int,
+                progress: Optional[ExportProgressCallback], token: Optional[CancellationToken]) -> ExportResult:
+        result = ExportResult(filepath, fmt)
+        start = time.perf_counter()
+        partial = _partial_path(filepath)
+        sink = _SINKS[fmt](partial, columns)
+        try:
+            try:
+                for rows in chunks:
+                    if token is not None and token.cancelled:
+                        result.cancelled = True
+                        break
+                    sink.write(rows)
+                    result.rows += len(rows)
+                    if progress:
+                        progress(ExportProgress(result.rows, total))
+            finally:
+                chunks.close()
+                sink.close()
+            if result.cancelled:
+                _discard(partial)
+            else:
+                os.replace(partial, filepath)
+        except BaseException:
+            _discard(partial)
+            raise
+        result.seconds = time.perf_counter() - start
+        if result.cancelled:
+            logger.info(f"Export to {filepath} cancelled after {result.rows} rows")
+        else:
+            logger.info(f"Exported {result.rows} rows to {filepath} ({fmt}) in {result.seconds:.1f}s "
+                        f"({result.rows_per_second:,.0f} rows/s)")
+        return result
+
+    def export_members_csv(self, filepath: str, group_filter: str = None) -> ExportResult:
         """
         Export members to CSV file.
         
@@ -25,65 +267,27 @@ class ExportManager:
             filepath: Path to save the CSV file
             group_filter: Optional group filter ('hololive' or 'nijisanji')
         """
-        if group_filter:
-            members = self.db.get_members_by_group(group_filter)
-        else:
-            members = self.db.get_all_members()
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'group_name', 'generation', 'channel_id', 
-                         'youtube_url', 'twitter_url', 'is_favorite']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for m in members:
-                writer.writerow({
-                    'name': m.name,
-                    'group_name': m.group_name,
-                    'generation': m.generation,
-                    'channel_id': m.channel_id,
-                    'youtube_url': m.youtube_url,
-                    'twitter_url': m.twitter_url or '',
-                    'is_favorite': '1' if m.is_favorite else '0'
-                })
+        return self.export_members(filepath, "csv", group_filter)
     
-    def export_videos_csv(self, filepath: str, group_filter: str = None, limit: int = 500):
+    def export_videos_csv(self, filepath: str, group_filter: str = None, limit: int = None) -> ExportResult:
         """
         Export videos to CSV file.
         
         Args:
             filepath: Path to save the CSV file
             group_filter: Optional group filter
-            limit: Maximum number of videos to export
+            limit: Maximum number of videos to export (default: all)
         """
-        if group_filter:
-            videos = self.db.get_videos_by_group(group_filter, limit=limit)
-        else:
-            videos = self.db.get_videos(limit=limit)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['video_id', 'title', 'url', 'channel_id', 
-                         'published_at', 'is_collab']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for v in videos:
-                writer.writerow({
-                    'video_id': v.video_id,
-                    'title': v.title,
-                    'url': v.url,
-                    'channel_id': v.channel_id,
-                    'published_at': v.published_at.isoformat(),
-                    'is_collab': '1' if v.is_collab else '0'
-                })
+        return self.export_videos(filepath, "csv", group_filter, limit)
     
-    def export_favorites_json(self, filepath: str):
+    def export_favorites_json(self, filepath: str) -> ExportResult:
         """
         Export favorite members to JSON for backup.
         
         Args:
             filepath: Path to save the JSON file
         """
+        start = time.perf_counter()
         members = self.db.get_all_members()
         favorites = [
             {
@@ -99,8 +303,15 @@ class ExportManager:
             'favorites': favorites
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, ensure_ascii=False, indent=2)
+        partial = _partial_path(filepath)
+        try:
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(backup_data, f, ensure_ascii=False, indent=2)
+            os.replace(partial, filepath)
+        except BaseException:
+            _discard(partial)
+            raise
+        return ExportResult(filepath, "json", len(favorites), time.perf_counter() - start)
     
     def import_favorites_json(self, filepath: str):
         """
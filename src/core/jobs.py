@@ -0,0 +1,108 @@
+"""
+Scoped, cancellable update jobs (see DataManager.run_job).
+
+A job says which channels to refresh (everything, one group, favorites, a
+single member, or only channels that have not been fetched recently) and
+carries a CancellationToken the UI can trip from its own thread.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+SCOPES = ("all", "group", "favorites", "member", "stale")
+
+
+class CancellationToken:
+    """
+    Thread-safe cancel flag.
+
+    cancel() may be called from any thread; callbacks registered with
+    on_cancel run right away on that thread, which is how a running update
+    aborts its in-flight fetches instead of waiting for them.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``callback`` on cancel (now, if already cancelled); returns a function that unregisters it."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._discard(callback)
+        callback()
+        return lambda: None
+
+    def _discard(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+@dataclass
+class UpdateJob:
+    """
+    What to update.
+
+    scope:
+        "all"       members, then every channel's videos
+        "group"     videos of ``group`` (of every group when None; no member refresh)
+        "favorites" videos of favorite members (optionally of ``group``)
+        "member"    videos of the member with ``channel_id``
+        "stale"     videos of channels not fetched successfully within ``max_age`` (optionally of ``group``)
+
+    skip_fetched_since drops channels already fetched successfully at or after
+    that time, so a follow-up job does not refetch what the previous one got.
+    """
+    scope: str = "all"
+    group: Optional[str] = None
+    channel_id: Optional[str] = None
+    max_age: timedelta = timedelta(hours=1)
+    token: CancellationToken = field(default_factory=CancellationToken)
+    skip_fetched_since: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.scope not in SCOPES:
+            raise ValueError(f"Unknown update scope: {self.scope!r} (expected one of {', '.join(SCOPES)})")
+        if self.scope == "member" and not self.channel_id:
+            raise ValueError("A 'member' update needs a channel_id")
+
+    def covers(self, other: "UpdateJob") -> bool:
+        """True if running this job fetches everything ``other`` would (so ``other`` can be dropped)."""
+        if self.scope == "all":
+            return True
+        if other.scope == "all":
+            return False
+        if self.scope == other.scope and self.group == other.group and self.channel_id == other.channel_id:
+            return self.scope != "stale" or self.max_age <= other.max_age
+        if self.scope == "group":
+            # Every channel (no group) or every channel of one group; a member's group is not known here
+            return self.group is None or (other.scope != "member" and self.group == other.group)
+        if self.scope in ("favorites", "stale") and other.scope == self.scope:
+            return self.group is None and (self.scope == "favorites" or self.max_age <= other.max_age)
+        return False
+
+    def describe(self) -> str:
+        if self.scope == "member":
+            return f"member {self.channel_id}"
+        if self.scope == "group":
+            return f"group {self.group or '(all)'}"
+        label = f"stale channels (> {self.max_age})" if self.scope == "stale" else self.scope
+        return f"{label} of {self.group}" if self.group else label
@@ -0,0 +1,113 @@
+"""
+Cross-process lock file so only one updater writes to app.db at a time.
+"""
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# msvcrt.locking locks a byte range that readers of the locked bytes trip over;
+# lock one byte far past the owner text so owner() can still read it
+_WINDOWS_LOCK_OFFSET = 1 << 20
+
+
+class LockHeldError(RuntimeError):
+    """Raised when another process already holds the update lock."""
+
+
+def _lock(fd: int):
+    """Lock ``fd`` without waiting; OSError if another process holds it."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        os.lseek(fd, _WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, _WINDOWS_LOCK_OFFSET, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class UpdateLock:
+    """
+    Exclusive OS lock on a lock file (flock on POSIX, msvcrt.locking on Windows).
+
+    The kernel drops the lock when its holder exits or crashes, so there is no
+    stale lock to detect and take over; the file itself stays in place and
+    only records the holder's PID and start time for error messages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    def acquire(self, blocking: bool = False, timeout: float = None, poll: float = 1.0) -> bool:
+        """
+        Try to take the lock.
+
+        Args:
+            blocking: Wait until the lock becomes free instead of failing immediately
+            timeout: Maximum seconds to wait when blocking (None = forever)
+            poll: Seconds between attempts when blocking
+
+        Returns:
+            True if the lock was acquired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._try_lock():
+                return True
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            time.sleep(poll)
+
+    def release(self):
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            os.ftruncate(fd, 0)
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+    def owner(self) -> str:
+        """Describe the current holder (for error messages)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError:
+            return ""
+
+    def _try_lock(self) -> bool:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Never unlinked: a process that removed it could lock a new file while another holds the old one
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, f"{os.getpid()} {time.time():.0f}".encode("utf-8"))
+        self._fd = fd
+        return True
+
+    def __enter__(self):
+        if not self.acquire():
+            raise LockHeldError(f"Update lock is held by another process ({self.owner()})")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
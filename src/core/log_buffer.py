@@ -0,0 +1,190 @@
+"""
+In-memory ring buffer of structured log records.
+
+The update pipeline logs per-channel records with extra fields, e.g.
+
+    logger.warning("feed could not be fetched",
+                   extra={"channel_id": member.channel_id, "stage": "fetch", "duration": 0.42})
+
+and LogBuffer keeps the last ``capacity`` records with those fields, indexed
+so the log viewer and the CLI can ask "what failed for this channel in the
+last hour" without reading app.log.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from heapq import merge
+from typing import List, Optional, Union
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    seq: int
+    created: float  # time.time()
+    level: int
+    logger: str
+    message: str
+    channel_id: Optional[str] = None
+    stage: Optional[str] = None  # e.g. "resolve", "fetch", "update"
+    duration: Optional[float] = None  # seconds
+    exc_text: Optional[str] = None
+
+    @property
+    def level_name(self) -> str:
+        return logging.getLevelName(self.level)
+
+    def format(self) -> str:
+        """Same layout as app.log ("asctime - name - levelname - message")."""
+        stamp = datetime.fromtimestamp(self.created).strftime("%Y-%m-%d %H:%M:%S")
+        text = f"{stamp},{int(self.created * 1000) % 1000:03d} - {self.logger} - {self.level_name} - {self.message}"
+        return f"{text}\n{self.exc_text}" if self.exc_text else text
+
+
+def _as_timestamp(value: Union[None, float, datetime]) -> Optional[float]:
+    return value.timestamp() if isinstance(value, datetime) else value
+
+
+class LogBuffer(logging.Handler):
+    """
+    Logging handler keeping the last ``capacity`` records in memory.
+
+    Records live in a fixed-size ring addressed by sequence number. Records
+    with a channel_id and records at WARNING or above are also indexed, so
+    the common diagnostics queries (a channel's history, recent failures)
+    only touch the matching records; time bounds are binary searches.
+    """
+
+    _instance = None
+
+    @classmethod
+    def install(cls, capacity: int = 100_000, level: int = logging.INFO) -> "LogBuffer":
+        """Attach the shared buffer to the root logger (once) and return it."""
+        if cls._instance is None:
+            cls._instance = cls(capacity, level)
+            logging.getLogger().addHandler(cls._instance)
+        return cls._instance
+
+    @classmethod
+    def instance(cls) -> Optional["LogBuffer"]:
+        """The installed buffer, or None when install() was never called."""
+        return cls._instance
+
+    def __init__(self, capacity: int = 100_000, level: int = logging.INFO):
+        super().__init__(level)
+        self.capacity = capacity
+        self._ring: List[Optional[LogEntry]] = [None] * capacity
+        self._next_seq = 0
+        self._by_channel = defaultdict(deque)  # channel_id -> seqs
+        self._by_level = defaultdict(deque)  # level >= WARNING -> seqs
+        self._loggers = set()  # logger names seen
+        self._data_lock = threading.Lock()
+
+    # --- Handler ---
+    def emit(self, record: logging.LogRecord):
+        try:
+            exc_text = None
+            if record.exc_info:
+                exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            with self._data_lock:
+                seq = self._next_seq
+                entry = LogEntry(seq, record.created, record.levelno, record.name, record.getMessage(),
+                                 getattr(record, "channel_id", None), getattr(record, "stage", None),
+                                 getattr(record, "duration", None), exc_text)
+                self._ring[seq % self.capacity] = entry
+                self._next_seq += 1
+                self._loggers.add(entry.logger)
+                if entry.channel_id:
+                    self._index(self._by_channel[entry.channel_id], seq)
+                if entry.level >= logging.WARNING:
+                    self._index(self._by_level[entry.level], seq)
+        except Exception:
+            self.handleError(record)
+
+    def _index(self, seqs: deque, seq: int):
+        seqs.append(seq)
+        oldest = self._next_seq - self.capacity
+        while seqs and seqs[0] < oldest:
+            seqs.popleft()
+
+    # --- Queries ---
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest record (-1 when empty); pass it as ``after_seq`` to poll."""
+        return self._next_seq - 1
+
+    def __len__(self):
+        return min(self._next_seq, self.capacity)
+
+    def query(self, level: int = logging.NOTSET, channel_id: Optional[str] = None, logger: Optional[str] = None,
+              stage: Optional[str] = None, since: Union[None, float, datetime] = None,
+              until: Union[None, float, datetime] = None, after_seq: int = -1,
+              limit: Optional[int] = None) -> List[LogEntry]:
+        """
+        Records at ``level`` or above matching every given filter, oldest first.
+
+        ``logger`` matches a logger name or any of its parents' ("core" matches
+        "core.manager"); ``since``/``until`` take datetimes or time.time()
+        values; ``after_seq`` returns only records newer than that sequence
+        number; ``limit`` keeps the newest ``limit`` matches.
+        """
+        since, until = _as_timestamp(since), _as_timestamp(until)
+        with self._data_lock:
+            first = max(self._next_seq - self.capacity, after_seq + 1)
+            if since is not None:
+                first = self._first_since(since, first)
+            entries = self._candidates(level, channel_id, first)
+            loggers = None
+            if logger is not None:
+                prefix = logger + "."
+                loggers = {name for name in self._loggers if name == logger or name.startswith(prefix)}
+
+        # Only the filters that were given (and are not implied by the candidates) scan the records
+        if level > self.level and not (channel_id is None and level >= logging.WARNING):
+            entries = [e for e in entries if e.level >= level]
+        if loggers is not None:
+            entries = [e for e in entries if e.logger in loggers]
+        if stage is not None:
+            entries = [e for e in entries if e.stage == stage]
+        if until is not None:
+            entries = [e for e in entries if e.created <= until]
+        return entries[-limit:] if limit else entries
+
+    def _first_since(self, since: float, lo: int) -> int:
+        # Records arrive in time order (threads may interleave by a few ms), so binary search by seq
+        hi = self._next_seq
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ring[mid % self.capacity].created < since:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _candidates(self, level: int, channel_id: Optional[str], first: int) -> List[LogEntry]:
+        # Records from seq ``first`` on, narrowed through an index where one applies
+        if channel_id is not None:
+            seqs = [s for s in self._by_channel.get(channel_id, ()) if s >= first]
+        elif level >= logging.WARNING:
+            seqs = list(merge(*(s for lvl, s in self._by_level.items() if lvl >= level)))
+            seqs = seqs[bisect_left(seqs, first):]
+        else:
+            # Contiguous range: at most two slices of the ring
+            start, end = first % self.capacity, self._next_seq % self.capacity
+            if first >= self._next_seq:
+                return []
+            if start < end:
+                return self._ring[start:end]
+            return self._ring[start:] + self._ring[:end]
+        return [self._ring[seq % self.capacity] for seq in seqs]
+
+    def clear(self):
+        with self._data_lock:
+            self._ring = [None] * self.capacity
+            self._by_channel.clear()
+            self._by_level.clear()
+            self._loggers.clear()
+            self._next_seq = 0
@@ -1,39 +1,178 @@
-import asyncio
-import aiohttp
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import Callable, List, Optional, TYPE_CHECKING
 from models.member import Member
 from models.video import Video
+from models.progress import ChannelProgress, UpdateResult
 from core.database import DatabaseManager
-from core.scraper import Scraper
-from core.rss import RSSParser
+from core.export_manager import CHECKPOINT_KEY
+from core.jobs import CancellationToken, UpdateJob
+from core.lock import UpdateLock
+
+# asyncio, aiohttp, bs4 and feedparser make up most of the GUI's import time and
+# are only needed once an update runs, so they are imported on first use.
+if TYPE_CHECKING:
+    from core.async_database import AsyncDatabaseManager
+    from core.scraper import Scraper
+    from core.rss import RSSParser
+    from core.video_writer import VideoWriter
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Receives a ChannelProgress as each channel finishes (called on the update's event loop thread)
+ProgressCallback = Callable[[ChannelProgress], None]
+
 class DataManager:
+    # A talent page that did not yield a channel ID is not retried for this long
+    RESOLVE_RETRY_AFTER = timedelta(hours=6)
+    # housekeeping() closes the shared HTTP session after this long without use (seconds)
+    HTTP_IDLE_CLOSE = 900
+    # change_log rows are kept at least this long, whatever the export checkpoints say
+    # (ChangeFeed cursors live in memory and only lag by a poll interval)
+    CHANGE_LOG_RETENTION = timedelta(days=30)
+
     def __init__(self, db_path="data/app.db"):
         self.db = DatabaseManager(db_path)
-        self.scraper = Scraper()
-        self.rss = RSSParser()
+        self._adb = None
+        self._scraper = None
+        self._rss = None
         self.api_key = None  # YouTube API key (optional)
+        self._http = None
+        self._http_loop = None
+        self._http_last_used = 0.0
+        self._unresolved = {}  # niji_ slug -> datetime of the failed resolution
+
+    @property
+    def adb(self) -> "AsyncDatabaseManager":
+        # Coroutines use the async facade so SQLite never blocks the event loop
+        if self._adb is None:
+            from core.async_database import AsyncDatabaseManager
+            self._adb = AsyncDatabaseManager(self.db.db_path)
+        return self._adb
+
+    @property
+    def scraper(self) -> "Scraper":
+        if self._scraper is None:
+            from core.scraper import Scraper
+            self._scraper = Scraper()
+        return self._scraper
+
+    @property
+    def rss(self) -> "RSSParser":
+        if self._rss is None:
+            from core.rss import RSSParser
+            self._rss = RSSParser()
+        return self._rss
+
+    async def http_session(self) -> "aiohttp.ClientSession":
+        """
+        The aiohttp session shared by all fetches on the current event loop.
+
+        Reusing one session keeps its connection pool and DNS cache warm across
+        channels and, on a long-lived loop (AsyncService, the Kivy app), across
+        updates. A session left over from another loop is replaced.
+        """
+        import asyncio
+        import aiohttp
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15),
+                                               connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=600))
+            self._http_loop = loop
+        self._http_last_used = time.monotonic()
+        return self._http
+
+    async def close_http_session(self):
+        """Close the shared session (call on the loop that uses it before that loop ends)."""
+        import asyncio
+        session, self._http = self._http, None
+        if session is not None and not session.closed and self._http_loop is asyncio.get_running_loop():
+            await session.close()
+
+    async def housekeeping(self):
+        """
+        Periodic upkeep on a long-lived loop: drop an idle HTTP session and
+        expired resolution failures, and prune the change_log.
+        """
+        if self._http is not None and time.monotonic() - self._http_last_used > self.HTTP_IDLE_CLOSE:
+            await self.close_http_session()
+        expired = datetime.now() - self.RESOLVE_RETRY_AFTER
+        self._unresolved = {slug: at for slug, at in self._unresolved.items() if at > expired}
+        await self.prune_change_log()
 
-    async def update_all_data(self):
+    async def prune_change_log(self) -> int:
+        """
+        Delete change_log rows older than CHANGE_LOG_RETENTION that every delta
+        export checkpoint has already passed; returns the number deleted.
+        """
+        checkpoints = await self.adb.get_settings_with_prefix(CHECKPOINT_KEY.format(name=""))
+        # A reset checkpoint (0) means the next export is a full one, which reads no change_log
+        seqs = [int(value) for value in checkpoints.values() if int(value or 0) > 0]
+        deleted = await self.adb.prune_change_log(datetime.now() - self.CHANGE_LOG_RETENTION, min(seqs, default=None))
+        if deleted:
+            logger.info(f"Pruned {deleted} change_log rows")
+        return deleted
+
+    def update_lock(self) -> UpdateLock:
+        """Lock guarding app.db against concurrent updaters (GUI, CLI, cron)."""
+        return UpdateLock(self.db.db_path + ".lock")
+
+    async def update_all_data(self, progress: Optional[ProgressCallback] = None):
         logger.info("Starting full data update...")
         await self.update_members()
-        await self.update_recent_videos()
+        await self.update_recent_videos(progress=progress)
         logger.info("Full data update complete.")
 
+    async def run_job(self, job: UpdateJob, progress: Optional[ProgressCallback] = None) -> UpdateResult:
+        """
+        Run an update limited to ``job``'s scope.
+
+        Cancelling ``job.token`` stops the run promptly: channels not started
+        yet are skipped and in-flight fetches are aborted. Videos of channels
+        that already finished are still written.
+        """
+        logger.info(f"Starting update job: {job.describe()}")
+        token = job.token
+        if job.scope == "all":
+            await self.update_members()
+        if token.cancelled:
+            return UpdateResult(cancelled=True)
+
+        if job.scope == "all" or (job.scope == "group" and not job.group):
+            members = await self.adb.get_all_members()
+        elif job.scope == "group":
+            members = await self.adb.get_members_by_group(job.group)
+        elif job.scope == "favorites":
+            members = await self.adb.get_favorite_members(job.group)
+        elif job.scope == "member":
+            member = await self.adb.get_member(job.channel_id)
+            members = [member] if member else []
+        else:
+            members = await self.adb.get_stale_members(datetime.now() - job.max_age, job.group)
+        if job.skip_fetched_since is not None:
+            fetched = await self.adb.get_fetched_channel_ids(job.skip_fetched_since)
+            members = [m for m in members if m.channel_id not in fetched]
+
+        started = time.perf_counter()
+        result = await self._update_videos_for(members, progress, token)
+        logger.info(f"Update job {job.describe()} {'cancelled' if result.cancelled else 'finished'}: "
+                    f"{result.done}/{result.total} channels, {result.new_videos} new videos, {result.errors} errors"
+                    + (f", {result.lost_videos} videos not saved" if result.lost_videos else ""),
+                    extra={"stage": "update", "duration": time.perf_counter() - started})
+        return result
+
     async def update_members(self):
         # Check last update date
-        last_update_str = self.db.get_setting("last_member_update")
+        last_update_str = await self.adb.get_setting("last_member_update")
         # If DB is empty, always update regardless of last_update
-        existing_members = self.db.get_all_members()
+        existing_members = await self.adb.get_all_members()
         # If either group is missing, force update even if last update is recent
         missing_group = False
         if existing_members:
             try:
-                missing_group = (len(self.db.get_members_by_group("hololive")) == 0) or (len(self.db.get_members_by_group("nijisanji")) == 0)
+                missing_group = (await self.adb.count_members("hololive") == 0) or (await self.adb.count_members("nijisanji") == 0)
             except Exception:
                 missing_group = False
 
@@ -60,9 +199,10 @@ class DataManager:
                     youtube_url=m_data["youtube_url"],
                     twitter_url=m_data.get("twitter_url"),
                     icon_url=m_data.get("icon_url"),
-                    is_favorite=False # Default
+                    is_favorite=False, # Default
+                    en_name=m_data.get("en_name")
                 )
-                self.db.upsert_member(member)
+                await self.adb.upsert_member(member)
         except Exception as e:
             logger.error(f"Failed to update Hololive members: {e}")
 
@@ -79,110 +219,177 @@ class DataManager:
                     youtube_url=m_data["youtube_url"],
                     twitter_url=m_data.get("twitter_url"),
                     icon_url=m_data.get("icon_url"),
-                    is_favorite=False
+                    is_favorite=False,
+                    en_name=m_data.get("en_name")
                 )
-                self.db.upsert_member(member)
+                await self.adb.upsert_member(member)
         except Exception as e:
             logger.error(f"Failed to update Nijisanji members: {e}")
         
         # Update last update timestamp
-        self.db.set_setting("last_member_update", datetime.now().isoformat())
+        await self.adb.set_setting("last_member_update", datetime.now().isoformat())
 
-    async def update_recent_videos(self, group_filter: str = None):
+    async def update_recent_videos(self, group_filter: str = None, progress: Optional[ProgressCallback] = None):
+        """
+        Fetch the latest videos of every member (optionally one group).
+
+        ``progress`` is called with a ChannelProgress as each channel finishes,
+        so callers can show done/total and pick up new videos while the run
+        continues. Favorites are fetched first.
+        """
         logger.info(f"Updating videos... (Group: {group_filter})")
         
         if group_filter:
-            members = self.db.get_members_by_group(group_filter)
+            members = await self.adb.get_members_by_group(group_filter)
         else:
-            members = self.db.get_all_members()
-            
-        # process in chunks to avoid rate limits? RSS is per channel.
-        # Async gather for all?
-        # Maybe batches of 10.
-        
-        chunk_size = 5
-        for i in range(0, len(members), chunk_size):
-            chunk = members[i:i + chunk_size]
-            tasks = [self._update_member_video(m) for m in chunk]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            members = await self.adb.get_all_members()
+
+        return await self._update_videos_for(members, progress)
+
+    async def update_favorite_videos(self, group_filter: str = None, progress: Optional[ProgressCallback] = None):
+        """Refresh videos for favorite members only (much cheaper than a full run)."""
+        logger.info(f"Updating favorite videos... (Group: {group_filter})")
+        members = await self.adb.get_favorite_members(group_filter)
+        return await self._update_videos_for(members, progress)
+
+    async def _update_videos_for(self, members: List[Member], progress: Optional[ProgressCallback] = None,
+                                 token: Optional[CancellationToken] = None) -> UpdateResult:
+        # Fetch/parse runs concurrently; all SQLite writes go through a single
+        # writer thread so DB commits never stall in-flight network I/O.
+        # Member names for collab detection are loaded once per run.
+        import asyncio
+        from core.video_writer import VideoWriter
+        all_members = await self.adb.get_all_members()
+        concurrency = asyncio.Semaphore(5)
+        # Favorites first: tasks queue on the semaphore in creation order
+        members = sorted(members, key=lambda m: not m.is_favorite)
+        result = UpdateResult(total=len(members))
+
+        async def fetch(member):
+            async with concurrency:
+                started = time.perf_counter()
+                try:
+                    fetched, new, error = await self._update_member_video(member, all_members, writer)
+                except Exception as e:
+                    fetched, new, error = 0, 0, str(e)
+                if member.channel_id.startswith('UC'):
+                    await self.adb.record_channel_fetch(member.channel_id, error)
+            # One structured record per channel (see core.log_buffer); failures were logged where they happened
+            logger.info(f"{member.name}: " + (f"failed ({error})" if error else f"{fetched} videos, {new} new"),
+                        extra={"channel_id": member.channel_id, "stage": "fetch",
+                               "duration": time.perf_counter() - started})
+            result.done += 1
+            result.new_videos += new
+            result.errors += error is not None
+            if progress is not None:
+                progress(ChannelProgress(
+                    done=result.done, total=result.total, channel_id=member.channel_id, name=member.name,
+                    is_favorite=bool(member.is_favorite), fetched=fetched, new_videos=new, error=error,
+                    new_total=result.new_videos, errors=result.errors))
+
+        loop = asyncio.get_running_loop()
+        async with VideoWriter(self.adb) as writer:
+            tasks = [loop.create_task(fetch(m)) for m in members]
+
+            def cancel_all():
+                for task in tasks:
+                    task.cancel()
+
+            # The token is tripped from another thread; hop onto the loop to cancel
+            unregister = token.on_cancel(lambda: loop.call_soon_threadsafe(cancel_all)) if token else None
+            try:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                if unregister is not None:
+                    unregister()
+        result.lost_videos = writer.rows_lost
+        result.cancelled = bool(token and token.cancelled)
+        return result
 
-    async def _update_member_video(self, member: Member):
+    async def _update_member_video(self, member: Member, all_members: List[Member], writer: "VideoWriter"):
+        """Fetch and queue one channel's feed; returns (videos fetched, new videos, error or None)."""
+        import asyncio
         if not member.channel_id:
-            return
+            return 0, 0, None
             
         # Resolve Nijisanji Channel ID if needed (legacy niji_ IDs)
         if not member.channel_id.startswith('UC') and member.channel_id.startswith('niji_'):
             slug = member.channel_id.replace('niji_', '')
+            failed_at = self._unresolved.get(slug)
+            if failed_at is not None and datetime.now() - failed_at < self.RESOLVE_RETRY_AFTER:
+                return 0, 0, "channel ID could not be resolved"
             logger.info(f"Resolving channel ID for {member.name} ({slug})...")
             
             # Add delay to be gentle to the server
             await asyncio.sleep(1.0)
             
-            real_id = await self.scraper.resolve_nijisanji_channel_id(slug)
+            real_id = await self.scraper.resolve_nijisanji_channel_id(slug, await self.http_session())
             if real_id and real_id.startswith('UC'):
-                logger.info(f"Resolved {member.name}: {real_id}")
+                logger.info(f"Resolved {member.name}: {real_id}", extra={"channel_id": real_id, "stage": "resolve"})
                 # Update Member object and DB
                 old_id = member.channel_id
                 member.channel_id = real_id
                 
-                # Update DB directly here
-                conn = self.db._get_connection()
-                cursor = conn.cursor()
-                cursor.execute('UPDATE members SET channel_id = ? WHERE channel_id = ?', (real_id, old_id))
-                cursor.execute('UPDATE videos SET channel_id = ? WHERE channel_id = ?', (real_id, old_id))
-                conn.commit()
-                conn.close()
+                await self.adb.update_channel_id(old_id, real_id)
             else:
-                logger.warning(f"Could not resolve channel ID for {member.name}")
-                return
+                logger.warning(f"Could not resolve channel ID for {member.name}",
+                               extra={"channel_id": member.channel_id, "stage": "resolve"})
+                self._unresolved[slug] = datetime.now()
+                return 0, 0, "channel ID could not be resolved"
         elif not member.channel_id.startswith('UC'):
             # Enforce UC-only channel IDs
-            return
+            return 0, 0, None
 
         url = f"https://www.youtube.com/feeds/videos.xml?channel_id={member.channel_id}"
         
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                xml = await self.scraper.fetch_page(session, url)
-                if not xml:
-                    return
+        session = await self.http_session()
+        try:
+            xml = await self.scraper.fetch_page(session, url)
+            if not xml:
+                logger.warning(f"Feed could not be fetched for {member.name}",
+                               extra={"channel_id": member.channel_id, "stage": "fetch"})
+                return 0, 0, "feed could not be fetched"
+            
+            videos_data = self.rss.parse_feed(xml)
+            
+            # Create a set of names/aliases
+            # Heuristic: Name must be at least 2 chars to avoid false positives (though most JP names are)
+            # Filter out the owner of the video
+            other_members = [m.name for m in all_members if m.channel_id != member.channel_id]
+
+            videos = []
+            for v_data in videos_data:
+                title = v_data["title"]
+                description = v_data.get("description", "")
                 
-                videos_data = self.rss.parse_feed(xml)
+                is_collab = False
+                # Simple string matching
+                # Better: Regex or specialized tokenizer
+                combined_text = (title + " " + description)
                 
-                # Get all member names for collab detection
-                # Optimization: Cache names mapping or pass it in
-                all_members = self.db.get_all_members()
-                # Create a set of names/aliases
-                # Heuristic: Name must be at least 2 chars to avoid false positives (though most JP names are)
-                # Filter out the owner of the video
-                other_members = [m.name for m in all_members if m.channel_id != member.channel_id]
-
-                for v_data in videos_data:
-                    title = v_data["title"]
-                    description = v_data.get("description", "")
-                    
-                    is_collab = False
-                    # Simple string matching
-                    # Better: Regex or specialized tokenizer
-                    combined_text = (title + " " + description)
-                    
-                    for name in other_members:
-                        if name in combined_text:
-                            is_collab = True
-                            break
-                    
-                    video = Video(
-                        video_id=v_data["video_id"],
-                        title=title,
-                        url=v_data["url"],
-                        channel_id=member.channel_id,
-                        published_at=v_data["published_at"],
-                        thumbnail_url=v_data["thumbnail_url"],
-                        description=description,
-                        is_collab=is_collab
-                    )
-                    self.db.upsert_video(video)
-            except Exception as e:
-                logger.error(f"Error updating videos for {member.name}: {e}")
+                for name in other_members:
+                    if name in combined_text:
+                        is_collab = True
+                        break
+                
+                video = Video(
+                    video_id=v_data["video_id"],
+                    title=title,
+                    url=v_data["url"],
+                    channel_id=member.channel_id,
+                    published_at=v_data["published_at"],
+                    thumbnail_url=v_data["thumbnail_url"],
+                    description=description,
+                    is_collab=is_collab
+                )
+                videos.append(video)
+
+            # Checked before queueing: once the writer commits the batch every id is known
+            known = await self.adb.get_existing_video_ids([v.video_id for v in videos])
+            await writer.put(videos)
+            return len(videos), sum(1 for v in videos if v.video_id not in known), None
+        except Exception as e:
+            logger.error(f"Error updating videos for {member.name}: {e}",
+                         extra={"channel_id": member.channel_id, "stage": "parse"})
+            return 0, 0, str(e)
 
@@ -5,8 +5,6 @@ from typing import List, Dict, Optional
 import logging
 import re
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Scraper:
@@ -15,6 +13,8 @@ class Scraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.timeout = aiohttp.ClientTimeout(total=15)
+        # YouTube handle/custom URL -> UC channel ID, kept for the life of the scraper
+        self.channel_id_cache: Dict[str, str] = {}
 
     async def fetch_page(self, session: aiohttp.ClientSession, url: str) -> str:
         try:
@@ -297,7 +297,8 @@ class Scraper:
                                 "channel_id": channel_id,
                                 "youtube_url": youtube_url,
                                 "twitter_url": twitter_url,
-                                "icon_url": icon_url
+                                "icon_url": icon_url,
+                                "en_name": t.get('enName') or None
                             })
                         except Exception as e:
                             logger.error(f"Error parsing nijisanji liver: {e}")
@@ -352,50 +353,53 @@ class Scraper:
         
         # Strip query params that might cause mismatches
         url = url.split("?")[0]
+        if url in self.channel_id_cache:
+            return self.channel_id_cache[url]
         
         html = await self.fetch_page(session, url)
         if not html:
             return None
         
         # Try to extract channelId from page source
-        match = re.search(r'channelId\":\"(UC[\\w-]+)\"', html)
-        if match:
-            return match.group(1)
-        
-        match = re.search(r'\"channelId\":\"(UC[\\w-]+)\"', html)
+        match = re.search(r'channelId\":\"(UC[\\w-]+)\"', html) or re.search(r'\"channelId\":\"(UC[\\w-]+)\"', html)
         if match:
+            self.channel_id_cache[url] = match.group(1)
             return match.group(1)
         
         return None
 
-    async def resolve_nijisanji_channel_id(self, slug: str) -> Optional[str]:
+    async def resolve_nijisanji_channel_id(self, slug: str, session: Optional[aiohttp.ClientSession] = None) -> Optional[str]:
         """
         Fetch individual talent page to resolve YouTube channel ID.
+        Uses ``session`` when given (the caller's shared session), else a temporary one.
         """
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.resolve_nijisanji_channel_id(slug, session)
+
         url = f"https://www.nijisanji.jp/talents/l/{slug}"
         try:
-            async with aiohttp.ClientSession() as session:
-                html = await self.fetch_page(session, url)
-                if not html:
-                    return None
-                
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Look for YouTube link in social links section
-                # Usually in a list or specific container
-                youtube_url = ""
-                
-                # Strategy 1: Find 'youtube.com' in any 'a' tag
-                for a in soup.find_all('a', href=True):
-                    href = a['href']
-                    if 'youtube.com' in href:
-                        if '/channel/' in href or '/@' in href or '/c/' in href or '/user/' in href:
-                             youtube_url = href
-                             break
+            html = await self.fetch_page(session, url)
+            if not html:
+                return None
+            
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            # Look for YouTube link in social links section
+            # Usually in a list or specific container
+            youtube_url = ""
+            
+            # Strategy 1: Find 'youtube.com' in any 'a' tag
+            for a in soup.find_all('a', href=True):
+                href = a['href']
+                if 'youtube.com' in href:
+                    if '/channel/' in href or '/@' in href or '/c/' in href or '/user/' in href:
+                         youtube_url = href
+                         break
+            
+            if youtube_url:
+                return self._extract_channel_id(youtube_url)
                 
-                if youtube_url:
-                    return self._extract_channel_id(youtube_url)
-                    
         except Exception as e:
             logger.error(f"Error resolving channel ID for {slug}: {e}")
             
@@ -0,0 +1,207 @@
+"""
+Member name search: normalisation, kana/romaji folding and a prebuilt index.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+_SEPARATORS = re.compile(r"[\s・･.\-_/,、。!！?？'\"()（）\[\]【】]+")
+_KANA_RUN = re.compile(r"[ぁ-ゖー]+")
+
+# Hepburn romaji for hiragana (katakana is folded to hiragana first)
+_DIGRAPHS = {
+    "きゃ": "kya", "きゅ": "kyu", "きょ": "kyo", "ぎゃ": "gya", "ぎゅ": "gyu", "ぎょ": "gyo",
+    "しゃ": "sha", "しゅ": "shu", "しょ": "sho", "しぇ": "she", "じゃ": "ja", "じゅ": "ju", "じょ": "jo", "じぇ": "je",
+    "ちゃ": "cha", "ちゅ": "chu", "ちょ": "cho", "ちぇ": "che", "にゃ": "nya", "にゅ": "nyu", "にょ": "nyo",
+    "ひゃ": "hya", "ひゅ": "hyu", "ひょ": "hyo", "びゃ": "bya", "びゅ": "byu", "びょ": "byo",
+    "ぴゃ": "pya", "ぴゅ": "pyu", "ぴょ": "pyo", "みゃ": "mya", "みゅ": "myu", "みょ": "myo",
+    "りゃ": "rya", "りゅ": "ryu", "りょ": "ryo", "ふぁ": "fa", "ふぃ": "fi", "ふぇ": "fe", "ふぉ": "fo",
+    "てぃ": "ti", "でぃ": "di", "とぅ": "tu", "どぅ": "du", "うぃ": "wi", "うぇ": "we", "うぉ": "wo",
+    "ゔぁ": "va", "ゔぃ": "vi", "ゔぇ": "ve", "ゔぉ": "vo", "つぁ": "tsa", "いぇ": "ye",
+}
+_MONOGRAPHS = dict(zip(
+    "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわゐゑをん"
+    "がぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽゔぁぃぅぇぉゃゅょゎ",
+    ["a", "i", "u", "e", "o", "ka", "ki", "ku", "ke", "ko", "sa", "shi", "su", "se", "so",
+     "ta", "chi", "tsu", "te", "to", "na", "ni", "nu", "ne", "no", "ha", "hi", "fu", "he", "ho",
+     "ma", "mi", "mu", "me", "mo", "ya", "yu", "yo", "ra", "ri", "ru", "re", "ro", "wa", "i", "e", "o", "n",
+     "ga", "gi", "gu", "ge", "go", "za", "ji", "zu", "ze", "zo", "da", "ji", "zu", "de", "do",
+     "ba", "bi", "bu", "be", "bo", "pa", "pi", "pu", "pe", "po", "vu", "a", "i", "u", "e", "o",
+     "ya", "yu", "yo", "wa"],
+))
+
+
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(ord("ァ"), ord("ヶ") + 1)}
+
+
+def fold_kana(text: str) -> str:
+    """Katakana -> hiragana (ァ..ヶ map onto ぁ..ゖ)."""
+    return text.translate(_KATAKANA_TO_HIRAGANA)
+
+
+def normalize(text: Optional[str]) -> str:
+    """NFKC, case-folded, kana-folded form used for both index keys and queries."""
+    if not text:
+        return ""
+    return fold_kana(unicodedata.normalize("NFKC", text).casefold())
+
+
+def kana_to_romaji(kana: str) -> str:
+    """Hepburn romaji for a hiragana string (other characters are dropped)."""
+    out = []
+    double_next = False
+    i = 0
+    while i < len(kana):
+        pair = kana[i:i + 2]
+        if pair in _DIGRAPHS:
+            roman, i = _DIGRAPHS[pair], i + 2
+        elif kana[i] == "っ":
+            double_next, i = True, i + 1
+            continue
+        elif kana[i] in _MONOGRAPHS:
+            roman, i = _MONOGRAPHS[kana[i]], i + 1
+        else:
+            # ー (long vowel) and anything unknown carry no romaji
+            i += 1
+            continue
+        if double_next:
+            roman = ("t" if roman.startswith("ch") else roman[0]) + roman
+            double_next = False
+        out.append(roman)
+    return "".join(out)
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in _SEPARATORS.split(text) if t]
+
+
+def search_keys(*fields: Optional[str]) -> List[str]:
+    """
+    Index keys for a record: every field normalised (tokens and the joined form)
+    plus the romaji of each kana run, so "ペコラ", "ぺこら" and "pekora" meet.
+    """
+    keys = []
+    for field in fields:
+        keys.extend(_field_keys(field))
+    return list(dict.fromkeys(keys))
+
+
+@lru_cache(maxsize=16384)
+def _field_keys(field: Optional[str]) -> tuple:
+    # Cached: group and generation values repeat across most members
+    tokens = _tokens(normalize(field))
+    if not tokens:
+        return ()
+    joined = "".join(tokens)
+    keys = tokens + [joined]
+    romaji = [r for r in map(kana_to_romaji, _KANA_RUN.findall(joined)) if r]
+    keys.extend(romaji)
+    if len(romaji) > 1:
+        keys.append("".join(romaji))
+    return tuple(keys)
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class MemberSearchIndex:
+    """
+    Prebuilt search index over member names, English names and generations.
+
+    Queries of three or more characters intersect trigram postings and then
+    verify a substring match; shorter ones (most kanji queries are one or two
+    characters) scan the keys for a substring.
+    A kana query is also tried as romaji, so "ぺこら" finds a member whose only
+    kana-free field is the English name "Pekora". sync() re-indexes only the
+    records whose keys changed, so a refresh does not pay for a full rebuild.
+    """
+
+    def __init__(self, records: Optional[Dict[str, Iterable[Optional[str]]]] = None):
+        self._keys: Dict[str, List[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        if records:
+            self.build(records)
+
+    @classmethod
+    def for_members(cls, members) -> "MemberSearchIndex":
+        """Index keyed by channel_id over name, en_name, group and generation."""
+        return cls(cls.member_records(members))
+
+    @staticmethod
+    def member_records(members) -> Dict[str, tuple]:
+        return {m.channel_id: (m.name, m.en_name, m.group_name, m.generation) for m in members}
+
+    def build(self, records: Dict[str, Iterable[Optional[str]]]):
+        """(Re)build from {record id: fields}."""
+        self._keys = {rid: search_keys(*fields) for rid, fields in records.items()}
+        owners = defaultdict(list)  # key -> record ids; shared keys get their trigrams once
+        for rid, keys in self._keys.items():
+            for key in keys:
+                owners[key].append(rid)
+        self._trigrams = defaultdict(set)
+        for key, rids in owners.items():
+            for tri in _trigrams(key):
+                self._trigrams[tri].update(rids)
+
+    def sync(self, records: Dict[str, Iterable[Optional[str]]]):
+        """Bring the index in line with {record id: fields}; returns the number of records re-indexed."""
+        if not self._keys:
+            self.build(records)
+            return len(self._keys)
+        new_keys = {rid: search_keys(*fields) for rid, fields in records.items()}
+        stale = [rid for rid, keys in self._keys.items() if new_keys.get(rid) != keys]
+        fresh = [rid for rid, keys in new_keys.items() if self._keys.get(rid) != keys]
+        for rid in stale:
+            self._remove(rid)
+        for rid in fresh:
+            self._add(rid, new_keys[rid])
+        return len(set(stale) | set(fresh))
+
+    def _add(self, rid: str, keys: List[str]):
+        self._keys[rid] = keys
+        for key in keys:
+            for tri in _trigrams(key):
+                self._trigrams[tri].add(rid)
+
+    def _remove(self, rid: str):
+        keys = self._keys.pop(rid)
+        for key in keys:
+            for tri in _trigrams(key):
+                postings = self._trigrams.get(tri)
+                if postings is not None:
+                    postings.discard(rid)
+                    if not postings:
+                        del self._trigrams[tri]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def search(self, query: str) -> Optional[Set[str]]:
+        """Matching record ids, or None for an empty query (everything matches)."""
+        joined = "".join(_tokens(normalize(query)))
+        if not joined:
+            return None
+        variants = {joined}
+        if _KANA_RUN.fullmatch(joined) and kana_to_romaji(joined):
+            variants.add(kana_to_romaji(joined))
+        result = set()
+        for q in variants:
+            result |= self._lookup(q)
+        return result
+
+    def _lookup(self, q: str) -> Set[str]:
+        if len(q) < 3:
+            return self._scan(q)
+        postings = [self._trigrams.get(tri) for tri in _trigrams(q)]
+        if not all(postings):
+            return set()
+        candidates = set.intersection(*sorted(postings, key=len))
+        return {rid for rid in candidates if any(q in key for key in self._keys[rid])}
+
+    def _scan(self, q: str) -> Set[str]:
+        # No trigram to narrow by; a few thousand short keys scan in well under a millisecond
+        return {rid for rid, keys in self._keys.items() if any(q in key for key in keys)}
@@ -0,0 +1,122 @@
+"""
+Single-writer pipeline for persisting fetched videos.
+
+Fetch/parse coroutines push parsed batches onto a bounded asyncio.Queue. One
+drain task groups them into size- or time-bounded transactions and commits each
+on the AsyncDatabaseManager's DB thread, so SQLite never blocks the event loop
+and there is only ever one writer contending for the database lock.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from typing import List, Optional
+from models.video import Video
+from core.async_database import AsyncDatabaseManager
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# A batch hitting "database is locked"/"busy" is retried after 0.5, 1 and 2 seconds before its rows count as lost
+COMMIT_RETRIES = 3
+COMMIT_RETRY_DELAY = 0.5
+
+
+class VideoWriter:
+    """
+    Usage:
+        async with VideoWriter(db) as writer:
+            await writer.put(videos)   # from any number of producer coroutines
+    """
+
+    def __init__(self, db: AsyncDatabaseManager, max_batch_rows: int = 500,
+                 max_delay: float = 0.5, queue_size: int = 32):
+        """
+        Args:
+            db: Database to write into
+            max_batch_rows: Commit once this many rows are pending
+            max_delay: Commit pending rows at the latest this many seconds after the first arrived
+            queue_size: Maximum queued batches before producers are made to wait
+        """
+        self.db = db
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self.rows_written = 0
+        self.rows_lost = 0  # rows of batches that could not be committed
+        self.transactions = 0
+
+    async def put(self, videos: List[Video]):
+        """Queue a parsed batch. Waits (backpressure) while the queue is full."""
+        if videos:
+            await self.queue.put(videos)
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def close(self):
+        """Flush everything still queued and stop the drain task."""
+        if self._task is None:
+            return
+        await self.queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info(f"Video writer flushed {self.rows_written} rows in {self.transactions} transactions"
+                    + (f", {self.rows_lost} rows lost" if self.rows_lost else ""))
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    async def _drain(self):
+        stopping = False
+        while not stopping:
+            item = await self.queue.get()
+            if item is _STOP:
+                break
+            pending = list(item)
+            deadline = time.monotonic() + self.max_delay
+
+            # Keep collecting until the batch is big enough or old enough
+            while len(pending) < self.max_batch_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                pending.extend(item)
+
+            await self._commit(pending)
+
+    async def _commit(self, videos: List[Video]):
+        for attempt in range(COMMIT_RETRIES + 1):
+            try:
+                await self.db.upsert_videos(videos)
+                self.rows_written += len(videos)
+                self.transactions += 1
+                return
+            except sqlite3.OperationalError as e:
+                # Usually a lock held by another connection (an export, a backup); worth waiting for
+                if attempt == COMMIT_RETRIES:
+                    error = e
+                    break
+                delay = COMMIT_RETRY_DELAY * 2 ** attempt
+                logger.warning(f"Writing {len(videos)} videos failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                error = e
+                break
+        self.rows_lost += len(videos)
+        logger.error(f"Failed to write {len(videos)} videos: {error}")
@@ -1,6 +1,12 @@
 import sys
 import os
 import logging
+import logging.handlers
+import sqlite3
+import time
+
+# Reference point for the startup timings (see ui.startup_probe)
+START_TIME = time.perf_counter()
 
 # Ensure src is in path (dev) or bundled path (PyInstaller)
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -10,6 +16,7 @@ else:
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from ui.main_window import MainWindow
+from core.log_buffer import LogBuffer
 
 def handle_exception(exc_type, exc_value, exc_traceback):
     if issubclass(exc_type, KeyboardInterrupt):
@@ -35,6 +42,23 @@ def handle_exception(exc_type, exc_value, exc_traceback):
 
     sys.__excepthook__(exc_type, exc_value, exc_traceback) # Call the default handler
 
+def has_cached_data(db_path="data/app.db"):
+    """True when the database already holds members, i.e. the window has something to show at once."""
+    if not os.path.exists(db_path):
+        return False
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute("SELECT 1 FROM members LIMIT 1").fetchone() is not None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+# app.log rotates at this size, keeping app.log.1 .. app.log.N
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
 def main():
     # Configure logging to file
 
@@ -43,38 +67,65 @@ def main():
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.handlers.RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES,
+                                                 backupCount=LOG_BACKUP_COUNT, encoding='utf-8'),
             logging.StreamHandler()
         ],
         force=True
     )
+    # Structured, queryable copy of the records for the log viewer
+    LogBuffer.install()
     logger = logging.getLogger(__name__)
     logger.info("Application starting...")
     
     sys.excepthook = handle_exception # Set the custom exception handler
 
     app = QApplication(sys.argv)
-    
-    from ui.splash import SplashWindow
-    splash = SplashWindow()
-    splash.show()
-    splash.start_video()
-    
-    # Process events to show the splash window immediately
-    app.processEvents()
+
+    # The video splash (and QtMultimedia) only covers a cold start; with cached
+    # data the window is up in well under a second. --splash / --no-splash override.
+    if "--splash" in sys.argv:
+        show_splash = True
+    elif "--no-splash" in sys.argv:
+        show_splash = False
+    else:
+        show_splash = not has_cached_data()
+
+    splash = None
+    if show_splash:
+        from ui.splash import SplashWindow
+        splash = SplashWindow()
+        splash.show()
+        splash.start_video()
+
+        # Process events to show the splash window immediately
+        app.processEvents()
     
     try:
-        # Initialize main window (heavy part)
+        # Initialize main window (tabs are built when first shown)
         window = MainWindow()
+        logger.info(f"Main window constructed in {(time.perf_counter() - START_TIME) * 1000:.0f} ms")
+
+        from ui.startup_probe import StartupProbe
+        StartupProbe(window, START_TIME)
         
         # Load finished! Show main window immediately
-        splash.close()
+        if splash is not None:
+            splash.close()
         window.show()
         
         # Optional: Handle skip button in splash just in case users click it
         # splash.finished remains as a signal but we handle primary transition here
         
-        sys.exit(app.exec())
+        exit_code = app.exec()
+
+        # The window's closeEvent already stopped updates; now the loop thread itself
+        from core.async_service import AsyncService
+        AsyncService.shutdown_instance()
+
+        from ui.components.async_image import ImageStore
+        logger.info(f"Image cache stats: {ImageStore.instance().stats()}")
+        sys.exit(exit_code)
     except Exception as e:
         logger.critical(f"Application crashed: {e}", exc_info=True)
 
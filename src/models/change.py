@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class Change:
+    seq: int  # change_log sequence number (monotonically increasing)
+    entity: str  # 'video' or 'member'
+    entity_id: str  # video_id or channel_id
+    op: str  # 'insert', 'update' or 'delete'
+    changed_at: Optional[datetime] = None
@@ -12,6 +12,7 @@ class Member:
     twitter_url: Optional[str] = None
     is_favorite: bool = False
     icon_url: Optional[str] = None
+    en_name: Optional[str] = None  # Romanised/English name (search alias)
 
     def __post_init__(self):
         # Ensure is_favorite is boolean if loaded from integer
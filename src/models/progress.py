@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ChannelProgress:
+    """One channel finished during a video update (see DataManager.update_recent_videos)."""
+    done: int  # channels finished so far, this one included
+    total: int  # channels in this run
+    channel_id: str
+    name: str
+    is_favorite: bool = False
+    fetched: int = 0  # videos in the channel's feed
+    new_videos: int = 0  # of those, videos not in the DB before this run
+    error: Optional[str] = None  # why the channel failed, if it did
+    new_total: int = 0  # new videos so far in this run
+    errors: int = 0  # failed channels so far in this run
+
+@dataclass
+class UpdateResult:
+    """Outcome of a video update run (see DataManager.run_job)."""
+    total: int = 0  # channels selected
+    done: int = 0  # channels finished (fetched or failed) before the run ended
+    new_videos: int = 0
+    errors: int = 0
+    lost_videos: int = 0  # fetched videos whose batch could not be written to the database
+    cancelled: bool = False
+
+@dataclass
+class ExportProgress:
+    """A chunk of an export was written (see ExportManager.export_videos)."""
+    rows: int  # rows written so far (pages copied, for database backups)
+    total: Optional[int] = None  # rows expected (counted before the export started), if known
+
+@dataclass
+class ExportResult:
+    """Outcome of an export (see ExportManager.export_videos)."""
+    path: str
+    format: str  # "csv", "jsonl", "parquet" or "json"
+    rows: int = 0
+    seconds: float = 0.0
+    cancelled: bool = False  # nothing was written to ``path``
+    checkpoint: Optional[int] = None  # delta exports: change_log seq the export covers up to
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+@dataclass
+class BackupResult:
+    """A database snapshot taken or restored (see core.backup.BackupManager)."""
+    path: str  # the snapshot
+    pages: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    cancelled: bool = False  # no snapshot was written
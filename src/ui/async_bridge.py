@@ -0,0 +1,58 @@
+"""
+Qt side of core.async_service: submit coroutines, get results as signals.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+
+class AsyncBridge(QObject):
+    """
+    Submit coroutines to the shared AsyncService and get the outcome back on
+    the GUI thread.
+
+    The future's done callback runs on the loop thread and only emits
+    ``completed``; the queued connection delivers it to this object's thread,
+    where the per-call callbacks run. A deleted receiver never sees a result.
+
+    Example:
+        bridge = AsyncBridge(self)
+        bridge.submit(manager.run_job(job), on_done=self.show_result, on_error=self.show_error)
+    """
+
+    # concurrent.futures.Future that finished (emitted from the loop thread)
+    completed = Signal(object)
+
+    def __init__(self, parent=None, service=None):
+        super().__init__(parent)
+        self._service = service
+        self._callbacks = {}  # Future -> (on_done, on_error)
+        self.completed.connect(self._dispatch)
+
+    @property
+    def service(self):
+        if self._service is None:
+            from core.async_service import AsyncService  # asyncio is not needed before the first submit
+            self._service = AsyncService.instance()
+        return self._service
+
+    def submit(self, coro, on_done=None, on_error=None):
+        """
+        Run ``coro`` on the service loop. ``on_done(result)`` or
+        ``on_error(exception)`` is called on the GUI thread; returns the
+        concurrent.futures.Future.
+        """
+        future = self.service.submit(coro)
+        self._callbacks[future] = (on_done, on_error)
+        future.add_done_callback(self.completed.emit)
+        return future
+
+    def _dispatch(self, future):
+        on_done, on_error = self._callbacks.pop(future, (None, None))
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+        elif on_done is not None:
+            on_done(future.result())
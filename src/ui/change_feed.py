@@ -0,0 +1,111 @@
+"""
+Qt adapter over the database change_log.
+"""
+
+import logging
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from core.database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeedTask(QRunnable):
+    """Reads up to ``limit`` changes (and the videos they inserted) off the GUI thread, a page at a time."""
+
+    def __init__(self, feed, after, limit):
+        super().__init__()
+        self.feed = feed
+        self.db = feed.db
+        self.after = after
+        self.limit = limit
+
+    def run(self):
+        try:
+            changes = []
+            while len(changes) < self.limit:
+                page = self.db.changes_since(changes[-1].seq if changes else self.after,
+                                             limit=min(ChangeFeed.PAGE_SIZE, self.limit - len(changes)))
+                changes.extend(page)
+                if len(page) < ChangeFeed.PAGE_SIZE:
+                    break
+            inserted = list(dict.fromkeys(c.entity_id for c in changes if c.entity == "video" and c.op == "insert"))
+            videos = self.db.get_videos_by_ids(inserted) if inserted else []
+        except Exception as e:
+            logger.warning(f"Reading the change log after {self.after} failed: {e}")
+            changes, videos = [], []
+        try:
+            self.feed.page_loaded.emit(self.after, changes, videos)
+        except RuntimeError:
+            pass  # Feed was deleted while reading
+
+
+class ChangeFeed(QObject):
+    """
+    Turn change_log rows into Qt signals so the UI consumes deltas, not rescans.
+
+    The feed keeps a cursor (the last seen sequence number) and starts at the
+    current end of the log, so only changes made while the app runs are
+    reported. poll() is cheap when nothing changed (one MAX(seq) query); it
+    runs after the in-app update and on a timer, which also picks up writes
+    made by the CLI or another process.
+
+    New changes are read PAGE_SIZE at a time by a ChangeFeedTask in the thread
+    pool, which also loads the inserted videos, so a large update never
+    stalls the GUI thread. The signals fire once per MAX_BATCH changes (once
+    per poll, usually), so views refresh and notifications go out once.
+    """
+
+    PAGE_SIZE = 1000
+    MAX_BATCH = 10_000
+
+    # All new changes (list of models.change.Change), oldest first
+    changed = Signal(list)
+    # Newly inserted videos (list of Video), newest first
+    videos_added = Signal(list)
+    # channel_ids of inserted/updated/deleted members
+    members_changed = Signal(list)
+    # (cursor the batch was read after, changes, inserted videos) from ChangeFeedTask
+    page_loaded = Signal(int, list, list)
+
+    def __init__(self, db: DatabaseManager, parent=None, interval_ms: int = 5000):
+        super().__init__(parent)
+        self.db = db
+        self.seq = db.get_change_seq()
+        self._reading = False  # a ChangeFeedTask is running
+        self._again = False    # poll() was called meanwhile
+        self.page_loaded.connect(self._on_page_loaded)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        if interval_ms:
+            self.timer.start(interval_ms)
+
+    def poll(self):
+        """Read and emit everything logged since the last poll, in the background."""
+        if self._reading:
+            self._again = True
+            return
+        if self.db.get_change_seq() <= self.seq:
+            return
+        self._read_batch()
+
+    def _read_batch(self):
+        self._reading, self._again = True, False
+        QThreadPool.globalInstance().start(ChangeFeedTask(self, self.seq, self.MAX_BATCH))
+
+    def _on_page_loaded(self, after, changes, videos):
+        self._reading = False
+        if after != self.seq:
+            self.poll()  # The cursor was moved meanwhile (e.g. after a restore); read from there
+            return
+        if changes:
+            self.seq = changes[-1].seq
+            self.changed.emit(changes)
+            if videos:
+                self.videos_added.emit(videos)
+            members = list(dict.fromkeys(c.entity_id for c in changes if c.entity == "member"))
+            if members:
+                self.members_changed.emit(members)
+        if len(changes) == self.MAX_BATCH:
+            self._read_batch()  # More where that came from
+        elif self._again:
+            self.poll()
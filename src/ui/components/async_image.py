@@ -1,7 +1,444 @@
+import os
+import time
+from collections import OrderedDict
 from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import QByteArray, QBuffer, QIODevice, Qt, QUrl
-from PySide6.QtGui import QPixmap, QImage
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtCore import QBuffer, QIODevice, QObject, QRect, QRunnable, QSize, QStandardPaths, Qt, QThread, QThreadPool, QTimer, QUrl, Signal
+from PySide6.QtGui import QPixmap, QImage, QImageReader
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest, QNetworkReply
+
+USER_AGENT = b"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+class PixmapLRU:
+    """Decoded pixmaps keyed by (url, width, height), evicted least-recently-used past a byte budget."""
+
+    def __init__(self, max_bytes=MEMORY_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items = OrderedDict()  # key -> (pixmap, cost)
+
+    @staticmethod
+    def cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key, pixmap):
+        cost = self.cost(pixmap)
+        if key in self._items:
+            self.total_bytes -= self._items.pop(key)[1]
+        self._items[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes and len(self._items) > 1:
+            _, (_, evicted_cost) = self._items.popitem(last=False)
+            self.total_bytes -= evicted_cost
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+class PendingImage(QObject):
+    """Handle for an in-flight image; every requester of the same URL and size shares one."""
+    finished = Signal(QPixmap)  # null pixmap on failure
+
+    def __init__(self, key, parent=None):
+        super().__init__(parent)
+        self.key = key
+        self.waiters = 0  # unreleased request() callers
+
+def decode_image(data, target=None):
+    """
+    Decode ``data`` straight to ``target`` size (cover + centre crop).
+
+    QImageReader scales while decoding (JPEG decodes at reduced DCT size), so a
+    large portrait never materialises at full resolution. Safe to call off the
+    GUI thread: it only touches QImage.
+    """
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    reader.setAutoTransform(True)
+    if target is not None and not target.isEmpty():
+        source = reader.size()
+        if source.isValid() and source.width() >= target.width() and source.height() >= target.height():
+            scaled = source.scaled(target, Qt.KeepAspectRatioByExpanding)
+            reader.setScaledSize(scaled)
+            reader.setScaledClipRect(QRect((scaled.width() - target.width()) // 2,
+                                           (scaled.height() - target.height()) // 2,
+                                           target.width(), target.height()))
+    return reader.read()
+
+class ImageDecodeTask(QRunnable):
+    """Decodes one downloaded image in the store's thread pool."""
+
+    def __init__(self, store, key, data):
+        super().__init__()
+        self.store = store
+        self.key = key
+        self.data = data
+
+    def run(self):
+        _, width, height = self.key
+        image = decode_image(self.data, QSize(width, height) if width and height else None)
+        # Queued to the GUI thread, where the QPixmap is created
+        self.store.decoded.emit(self.key, image)
+
+PRIORITY_VISIBLE = 0
+PRIORITY_NEARBY = 1
+MAX_CONCURRENT_DOWNLOADS = 6
+# A failed URL is not refetched for FAILURE_BACKOFF seconds, doubling per consecutive failure up to FAILURE_BACKOFF_MAX
+FAILURE_BACKOFF = 30.0
+FAILURE_BACKOFF_MAX = 30 * 60.0
+
+class ImageStore(QObject):
+    """
+    Process-wide image pipeline shared by every view and AsyncImageLoader.
+
+    1. Memory: LRU of decoded pixmaps with a byte budget, keyed by (url, width, height).
+    2. Disk: QNetworkDiskCache on the shared QNetworkAccessManager, size-capped,
+       so icons survive restarts and refreshes without hitting the network.
+    3. Network: concurrent requests for the same URL coalesce into one fetch.
+
+    Downloads are decoded in a QThreadPool at the size they will be painted at;
+    the GUI thread only wraps the finished QImage in a QPixmap.
+
+    Fetching is demand driven. At most MAX_CONCURRENT_DOWNLOADS run at once and
+    the queue serves visible images before nearby ones. Views report what they
+    need through set_demand (see ViewportImageTracker), widgets hold requests
+    until release; anything nobody wants any more is dropped from the queue or
+    aborted mid-download.
+
+    A URL that failed is left alone for a backoff period that grows with each
+    consecutive failure; retry_failed() clears it at once (manual refresh).
+    """
+    image_loaded = Signal(str)
+    decoded = Signal(object, QImage)  # (key, image) from ImageDecodeTask
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = ImageStore()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.manager = AsyncImageLoader.get_manager()
+        self.memory = PixmapLRU()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThread.idealThreadCount() - 1))
+        self._pending = {}    # key -> PendingImage
+        self._demand = {}     # owner -> {key: priority}
+        self._downloads = {}  # url -> [key, ...] waiting for the bytes
+        self._queued = {}     # url -> priority, not started yet (insertion order breaks ties)
+        self._active = {}     # url -> QNetworkReply
+        self._failed = {}     # url -> (monotonic time it may be retried, consecutive failures)
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "network": 0, "coalesced": 0,
+                         "errors": 0, "cancelled": 0}
+        # Start downloads once the current event is done: aborting a reply frees a
+        # slot synchronously, and a batch of widget deletions must not refill it
+        # with requests that are about to be cancelled too.
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.setInterval(0)
+        self._dispatch_timer.timeout.connect(self._dispatch)
+        self.decoded.connect(self._on_decoded)
+
+    @staticmethod
+    def _key(url, size):
+        if size is None or size.isEmpty():
+            return (url, 0, 0)
+        return (url, size.width(), size.height())
+
+    # --- Public API ---
+    def pixmap(self, url, size=None):
+        """
+        Cached pixmap for ``url`` at ``size`` (device pixels), or None after
+        queueing it as visible (delegates repaint on image_loaded).
+        """
+        if not url or self._is_failed(url):
+            return None
+        key = self._key(url, size)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self.counters["memory_hits"] += 1
+            return cached
+        if key not in self._pending:
+            self._start(key, PRIORITY_VISIBLE)
+        else:
+            self._reprioritise(url)
+        return None
+
+    def request(self, url, size=None):
+        """
+        Cached pixmap for ``url`` at ``size``, or a PendingImage whose ``finished`` delivers it.
+
+        A PendingImage must be balanced by release() once the caller no longer
+        needs it (AsyncImageLoader does this when destroyed); the last release
+        before completion cancels the download.
+        """
+        key = self._key(url, size)
+        cached = self.memory.get(key)
+        if cached is not None:
+            self.counters["memory_hits"] += 1
+            return cached
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.counters["coalesced"] += 1
+        else:
+            pending = self._start(key, PRIORITY_VISIBLE)
+        pending.waiters += 1
+        self._reprioritise(url)
+        return pending
+
+    def release(self, pending):
+        """Drop one request() hold on ``pending``; no-op once it has completed."""
+        key = pending.key
+        if self._pending.get(key) is not pending:
+            return
+        pending.waiters = max(pending.waiters - 1, 0)
+        if self._priority(key) is None:
+            self._cancel(key)
+
+    def set_demand(self, owner, wanted):
+        """
+        Replace the images ``owner`` needs with ``wanted`` ({key: priority}).
+
+        Missing images are queued (prefetching PRIORITY_NEARBY ones), and images
+        this owner no longer needs are cancelled unless someone else still does.
+        An empty dict withdraws the owner entirely.
+        """
+        previous = self._demand.pop(owner, {})
+        if wanted:
+            self._demand[owner] = wanted
+        for key, priority in wanted.items():
+            if self._is_failed(key[0]) or key in self._pending or key in self.memory:
+                continue
+            self._start(key, priority)
+        for key in previous:
+            if key not in wanted and key in self._pending and self._priority(key) is None:
+                self._cancel(key)
+        for url in {key[0] for key in previous} | {key[0] for key in wanted}:
+            self._reprioritise(url)
+
+    def retry_failed(self):
+        """Forget every failure backoff and let views request those images again."""
+        failed, self._failed = self._failed, {}
+        for url in failed:
+            self.image_loaded.emit(url)  # Repaint, which re-requests the image
+
+    def stats(self):
+        """Counters plus hit rates (memory and memory+disk) over all lookups."""
+        c = dict(self.counters)
+        lookups = c["memory_hits"] + c["disk_hits"] + c["network"] + c["coalesced"]
+        c["memory_entries"] = len(self.memory)
+        c["memory_bytes"] = self.memory.total_bytes
+        c["memory_hit_rate"] = c["memory_hits"] / lookups if lookups else 0.0
+        c["hit_rate"] = (c["memory_hits"] + c["disk_hits"] + c["coalesced"]) / lookups if lookups else 0.0
+        return c
+
+    # --- Scheduling ---
+    def _is_failed(self, url):
+        failure = self._failed.get(url)
+        return failure is not None and time.monotonic() < failure[0]
+
+    def _priority(self, key):
+        """Most urgent priority anyone holds for ``key``, or None if nobody wants it."""
+        priorities = [wanted[key] for wanted in self._demand.values() if key in wanted]
+        pending = self._pending.get(key)
+        if pending is not None and pending.waiters:
+            priorities.append(PRIORITY_VISIBLE)
+        return min(priorities) if priorities else None
+
+    def _url_priority(self, url):
+        priorities = [self._priority(key) for key in self._downloads.get(url, [])]
+        priorities = [p for p in priorities if p is not None]
+        # Keys queued by a paint with no owner yet count as visible
+        return min(priorities) if priorities else PRIORITY_VISIBLE
+
+    def _reprioritise(self, url):
+        if url in self._queued:
+            self._queued[url] = self._url_priority(url)
+
+    def _start(self, key, priority):
+        pending = PendingImage(key, self)
+        self._pending[key] = pending
+        url = key[0]
+        waiting = self._downloads.get(url)
+        if waiting is not None:
+            # Same URL already queued or downloading for another size
+            self.counters["coalesced"] += 1
+            waiting.append(key)
+            if url in self._queued:
+                self._queued[url] = min(self._queued[url], priority)
+        else:
+            self._downloads[url] = [key]
+            self._queued[url] = priority
+            self._dispatch_timer.start()
+        return pending
+
+    def _cancel(self, key):
+        """Forget ``key``; drop or abort its download when no other size needs it."""
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.deleteLater()
+        url = key[0]
+        keys = self._downloads.get(url)
+        if keys is None:
+            return  # already downloaded; the decode result just lands in the cache
+        if key in keys:
+            keys.remove(key)
+        if keys:
+            return
+        del self._downloads[url]
+        self.counters["cancelled"] += 1
+        if url in self._queued:
+            del self._queued[url]
+        else:
+            reply = self._active.pop(url, None)
+            if reply is not None:
+                reply.abort()
+
+    def _dispatch(self):
+        while self._queued and len(self._active) < MAX_CONCURRENT_DOWNLOADS:
+            url = min(self._queued, key=self._queued.get)
+            del self._queued[url]
+            self._active[url] = self._fetch(url)
+
+    # --- Network / decode ---
+    def _fetch(self, url):
+        req = QNetworkRequest(QUrl(url))
+        req.setRawHeader(b"User-Agent", USER_AGENT)
+        # Icons and thumbnails are effectively immutable: use the disk copy without revalidating
+        req.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferCache)
+        reply = self.manager.get(req)
+        reply.finished.connect(lambda: self._handle_finished(url, reply))
+        return reply
+
+    def _handle_finished(self, url, reply):
+        if self._active.get(url) is reply:
+            del self._active[url]
+        error = reply.error()
+        data = None
+        if error == QNetworkReply.NetworkError.NoError:
+            if reply.attribute(QNetworkRequest.SourceIsFromCacheAttribute):
+                self.counters["disk_hits"] += 1
+            else:
+                self.counters["network"] += 1
+            data = reply.readAll()
+        reply.deleteLater()
+        if error != QNetworkReply.NetworkError.OperationCanceledError:
+            # Aborted replies were already cleaned up by _cancel
+            self._deliver(url, data)
+        self._dispatch_timer.start()
+
+    def _deliver(self, url, data):
+        """Queue decodes of ``data`` for every size waiting on ``url``."""
+        keys = self._downloads.pop(url, [])
+        for key in keys:
+            if data:
+                self.pool.start(ImageDecodeTask(self, key, data))
+            else:
+                self._on_decoded(key, QImage())
+
+    def _on_decoded(self, key, image):
+        url = key[0]
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        if pixmap.isNull():
+            self.counters["errors"] += 1
+            failures = self._failed.get(url, (0.0, 0))[1] + 1
+            backoff = min(FAILURE_BACKOFF * 2 ** (failures - 1), FAILURE_BACKOFF_MAX)
+            self._failed[url] = (time.monotonic() + backoff, failures)
+        else:
+            self._failed.pop(url, None)
+            self.memory.put(key, pixmap)
+            self.image_loaded.emit(url)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.finished.emit(pixmap)
+            pending.deleteLater()
+
+class ViewportImageTracker(QObject):
+    """
+    Reports the images a QListView needs to ImageStore.
+
+    Rows intersecting the viewport are PRIORITY_VISIBLE and rows within one
+    viewport height above or below are prefetched as PRIORITY_NEARBY; images
+    for rows that scrolled further away are cancelled. The view's delegate
+    supplies ``image_requests(index, rect) -> [(url, QSize), ...]``, and the
+    view calls schedule() from paintEvent and clear() from hideEvent. A view
+    may also offer ``prefetch_image_requests()`` for images of rows it is
+    about to add (e.g. a prefetched page); those are PRIORITY_NEARBY too.
+    """
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.owner = id(view)
+        self.store = ImageStore.instance()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(100)
+        self.timer.timeout.connect(self.update_demand)
+        owner, store = self.owner, self.store
+        view.destroyed.connect(lambda *_: store.set_demand(owner, {}))
+
+    def schedule(self):
+        # Throttle rather than debounce so a long scroll still cancels as it goes
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def clear(self):
+        self.timer.stop()
+        self.store.set_demand(self.owner, {})
+
+    def _first_row(self, model, top):
+        """First row whose rect reaches ``top``; rows are laid out top to bottom."""
+        lo, hi = 0, model.rowCount()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rect = self.view.visualRect(model.index(mid, 0))
+            if rect.isValid() and rect.bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def update_demand(self):
+        view, model = self.view, self.view.model()
+        if model is None or not view.isVisible():
+            self.clear()
+            return
+        viewport = view.viewport().rect()
+        near = viewport.adjusted(0, -viewport.height(), 0, viewport.height())
+        delegate = view.itemDelegate()
+        dpr = view.devicePixelRatioF()
+        wanted = {}
+        for row in range(self._first_row(model, near.top()), model.rowCount()):
+            index = model.index(row, 0)
+            rect = view.visualRect(index)
+            if not rect.isValid() or rect.top() > near.bottom():
+                break
+            priority = PRIORITY_VISIBLE if rect.intersects(viewport) else PRIORITY_NEARBY
+            for url, size in delegate.image_requests(index, rect):
+                if url:
+                    wanted[ImageStore._key(url, size * dpr)] = priority
+        prefetch = getattr(view, "prefetch_image_requests", None)
+        for url, size in (prefetch() if prefetch else []):
+            if url:
+                wanted.setdefault(ImageStore._key(url, size * dpr), PRIORITY_NEARBY)
+        self.store.set_demand(self.owner, wanted)
 
 class AsyncImageLoader(QLabel):
     _manager = None
@@ -10,6 +447,12 @@ class AsyncImageLoader(QLabel):
     def get_manager(cls):
         if cls._manager is None:
             cls._manager = QNetworkAccessManager()
+            cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            if cache_dir:
+                disk_cache = QNetworkDiskCache(cls._manager)
+                disk_cache.setCacheDirectory(os.path.join(cache_dir, "images"))
+                disk_cache.setMaximumCacheSize(DISK_CACHE_BYTES)
+                cls._manager.setCache(disk_cache)
         return cls._manager
 
     def __init__(self, url, w=100, h=100, parent=None):
@@ -17,29 +460,37 @@ class AsyncImageLoader(QLabel):
         self.setFixedSize(w, h)
         self.setScaledContents(True)
         self.setStyleSheet("background-color: #ccc; border-radius: 5px;")
-        
+
         # Use shared manager
         self.manager = self.get_manager()
-        
-        if url:
-            self.load_image(url)
+
+        # Nothing is fetched until the label is first shown (tabs never opened cost nothing)
+        self.url = url
+        self._requested = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.url and not self._requested:
+            self.load_image(self.url)
 
     def load_image(self, url):
-        req = QNetworkRequest(QUrl(url))
-        req.setRawHeader(b"User-Agent", b"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        
-        reply = self.manager.get(req)
-        reply.finished.connect(lambda: self.handle_finished(reply))
+        self.url = url
+        self._requested = True
+        # Decoded at the label's size in device pixels, so setScaledContents has nothing to do
+        size = self.size() * self.devicePixelRatioF()
+        store = ImageStore.instance()
+        result = store.request(url, size)
+        if isinstance(result, QPixmap):
+            self.handle_finished(result)
+        else:
+            result.finished.connect(self.handle_finished)
+            # Abort the download if this label goes away first (e.g. refresh_list)
+            self.destroyed.connect(lambda *_: store.release(result))
 
-    def handle_finished(self, reply):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                self.setPixmap(pixmap)
-                self.setStyleSheet("background-color: transparent;")
+    def handle_finished(self, pixmap):
+        if not pixmap.isNull():
+            self.setPixmap(pixmap)
+            self.setStyleSheet("background-color: transparent;")
         else:
             # Error placeholder
             self.setText("Error")
-        reply.deleteLater()
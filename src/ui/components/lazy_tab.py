@@ -0,0 +1,44 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, Signal
+
+
+class LazyTab(QWidget):
+    """
+    Tab page that builds its real widget the first time it is shown.
+
+    Until then it is an empty placeholder, so tabs nobody opens cost neither
+    widget construction nor the queries their constructors run. ``factory``
+    returns the real tab; the tabs load their data when constructed, so a
+    refresh_list before that point is simply dropped.
+    """
+
+    materialized = Signal(QWidget)
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.widget = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self.placeholder = QLabel("読み込み中…")
+        self.placeholder.setAlignment(Qt.AlignCenter)
+        self.placeholder.setStyleSheet("color: #888;")
+        self._layout.addWidget(self.placeholder)
+
+    def materialize(self):
+        """Build the real widget now (if not done yet) and return it."""
+        if self.widget is None:
+            self.widget = self.factory()
+            self._layout.removeWidget(self.placeholder)
+            self.placeholder.deleteLater()
+            self._layout.addWidget(self.widget)
+            self.materialized.emit(self.widget)
+        return self.widget
+
+    def showEvent(self, event):
+        self.materialize()
+        super().showEvent(event)
+
+    def refresh_list(self):
+        if self.widget is not None and hasattr(self.widget, "refresh_list"):
+            self.widget.refresh_list()
@@ -0,0 +1,53 @@
+from difflib import SequenceMatcher
+from PySide6.QtCore import QModelIndex
+
+
+def apply_list_diff(model, rows, new_rows, key):
+    """
+    Morph ``rows`` (the list backing ``model``) into ``new_rows`` in place.
+
+    Instead of a model reset, emits row removals/insertions for the entries whose
+    ``key`` disappeared/appeared and dataChanged for kept entries that compare
+    unequal. Unchanged entries keep their existing object, so views keep their
+    scroll position, hover state and painted images, and the work done by the
+    view is proportional to what changed.
+
+    Returns (inserted, updated, removed) row counts.
+    """
+    old_keys = [key(r) for r in rows]
+    new_keys = [key(r) for r in new_rows]
+    if old_keys == new_keys:
+        opcodes = [("equal", 0, len(rows), 0, len(new_rows))]
+    else:
+        opcodes = SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes()
+
+    inserted = removed = 0
+    changed = []  # final row numbers (positions in new_rows)
+    # Back to front, so the row numbers of earlier opcodes stay valid
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == "equal":
+            for offset in range(i2 - i1):
+                new = new_rows[j1 + offset]
+                if rows[i1 + offset] != new:
+                    rows[i1 + offset] = new
+                    changed.append(j1 + offset)
+            continue
+        if i2 > i1:
+            model.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+            del rows[i1:i2]
+            model.endRemoveRows()
+            removed += i2 - i1
+        if j2 > j1:
+            model.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+            rows[i1:i1] = new_rows[j1:j2]
+            model.endInsertRows()
+            inserted += j2 - j1
+
+    # One dataChanged per contiguous run of updated rows
+    changed.sort()
+    start = 0
+    for n in range(1, len(changed) + 1):
+        if n == len(changed) or changed[n] != changed[n - 1] + 1:
+            model.dataChanged.emit(model.index(changed[start]), model.index(changed[n - 1]))
+            start = n
+    return inserted, len(changed), removed
@@ -0,0 +1,406 @@
+from collections import defaultdict
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (Qt, QAbstractListModel, QAbstractProxyModel, QSortFilterProxyModel, QModelIndex,
+                            QRect, QSize, QUrl, QEvent, QTimer, Signal)
+from PySide6.QtGui import QDesktopServices, QFont, QColor, QPainter, QPainterPath
+from ui.components.async_image import ImageStore, ViewportImageTracker
+from ui.components.list_diff import apply_list_diff
+from core.search import MemberSearchIndex
+
+MemberRole = Qt.UserRole + 1
+SectionRole = Qt.UserRole + 2
+
+SECTION_HEIGHT = 40
+
+# Card styles: "channel" (ChannelsTab), "sns" (SNSTab) and "mini" (integrated member list)
+CARD_SIZES = {
+    "channel": QSize(160, 200),
+    "sns": QSize(320, 140),
+    "mini": QSize(180, 60),
+}
+
+
+def section_key(member):
+    return f"[{member.group_name}] {member.generation}"
+
+
+class MemberGridModel(QAbstractListModel):
+    """
+    Members grouped into generation sections.
+
+    Rows are either a section header (SectionRole -> title) or a member card
+    (MemberRole -> Member). set_members updates the rows in place, so a refresh
+    only touches the cards that were added, changed or removed. Searching is
+    done by MemberFilterProxyModel on top.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._members = []
+        self._rows = []  # [(title, None) | (title, Member)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        title, member = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return member.name if member else title
+        if role == Qt.ToolTipRole:
+            return member.name if member else None
+        if role == MemberRole:
+            return member
+        if role == SectionRole:
+            return title if member is None else None
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled
+
+    def set_members(self, members):
+        """Show ``members``; returns (inserted, updated, removed) row counts."""
+        self._members = list(members)
+        by_section = defaultdict(list)
+        for m in self._members:
+            by_section[section_key(m)].append(m)
+        rows = []
+        for title in sorted(by_section.keys()):
+            rows.append((title, None))
+            rows.extend((title, m) for m in by_section[title])
+        return apply_list_diff(self, self._rows, rows, key=self._row_key)
+
+    @staticmethod
+    def _row_key(row):
+        title, member = row
+        return (title, member.channel_id if member is not None else None)
+
+    def members(self):
+        return self._members
+
+    def entry(self, row):
+        """(section title, Member or None for a header) for ``row``."""
+        return self._rows[row] if 0 <= row < len(self._rows) else (None, None)
+
+    def member_changed(self, member):
+        """Repaint the card of ``member`` after it was modified in place."""
+        for row, (_, m) in enumerate(self._rows):
+            if m is member:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+                return
+
+
+class MemberFilterProxyModel(QSortFilterProxyModel):
+    """
+    Search filter over a MemberGridModel, shared by ChannelsTab and SNSTab.
+
+    Queries go through a MemberSearchIndex (NFKC, kana folding, romaji, English
+    names), which is synced with the source members shortly after they change,
+    ahead of the next keystroke. Typing is debounced; a section header stays
+    visible while its section has a match.
+    """
+    DEBOUNCE_MS = 120
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._index = MemberSearchIndex()
+        self._index_dirty = True
+        self._matches = None   # matching channel_ids, None when not filtering
+        self._sections = set()  # section titles with at least one match
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.timeout.connect(self._sync_index)
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        for signal in (model.modelReset, model.rowsInserted, model.rowsRemoved, model.dataChanged):
+            signal.connect(self._source_changed)
+        self._source_changed()
+
+    def set_filter_text(self, text):
+        self._text = text
+        self._filter_timer.start()
+
+    def _source_changed(self, *args):
+        self._index_dirty = True
+        # Sync once the current batch of changes is applied
+        self._index_timer.start()
+        if self._text.strip():
+            self._filter_timer.start()
+
+    def _sync_index(self):
+        if self._index_dirty:
+            self._index.sync(MemberSearchIndex.member_records(self.sourceModel().members()))
+            self._index_dirty = False
+        return self._index
+
+    def _apply_filter(self):
+        members = self.sourceModel().members()
+        self._matches = self._sync_index().search(self._text)
+        if self._matches is not None:
+            self._sections = {section_key(m) for m in members if m.channel_id in self._matches}
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._matches is None:
+            return True
+        title, member = self.sourceModel().entry(source_row)
+        if member is None:
+            return title in self._sections
+        return member.channel_id in self._matches
+
+
+class MemberCardDelegate(QStyledItemDelegate):
+    """
+    Paints member cards and generation headers for MemberGridView.
+
+    Buttons are painted rects; clicks are resolved in editorEvent and either open
+    a URL or emit ``favorite_clicked``.
+    """
+    favorite_clicked = Signal(object)
+
+    def __init__(self, style="channel", parent=None):
+        super().__init__(parent)
+        self.style = style
+        self.card_size = CARD_SIZES[style]
+        self.images = ImageStore.instance()
+        self.name_font = QFont("Yu Gothic UI", 11 if style == "sns" else 10, QFont.Bold)
+        self.small_font = QFont("Yu Gothic UI", 8)
+        self.section_font = QFont("Yu Gothic UI", 11, QFont.Bold)
+        self.button_font = QFont("Yu Gothic UI", 9, QFont.Bold)
+        self._hover = (-1, None)  # (row, button name)
+
+    @staticmethod
+    def _entry(index):
+        # Read the row straight from the Python model instead of index.data():
+        # cheaper per paint, and avoids converting empty QVariants back to None.
+        model = index.model()
+        while isinstance(model, QAbstractProxyModel):
+            index = model.mapToSource(index)
+            model = index.model()
+        return model.entry(index.row())
+
+    # --- Geometry ---
+    def sizeHint(self, option, index):
+        title, member = self._entry(index)
+        if member is None:
+            view = self.parent()
+            width = view.viewport().width() - 2 * view.spacing() - 1 if view is not None else 600
+            return QSize(max(width, self.card_size.width()), SECTION_HEIGHT)
+        return self.card_size
+
+    def _buttons(self, rect, member):
+        """Button rects for a card, keyed by name."""
+        if self.style == "mini":
+            return {}
+        if self.style == "channel":
+            bottom = rect.bottom() - 10
+            return {
+                "youtube": QRect(rect.left() + 12, bottom - 30, 96, 30),
+                "favorite": QRect(rect.right() - 44, bottom - 30, 32, 30),
+            }
+        buttons = {}
+        x = rect.left() + 108
+        y = rect.bottom() - 44
+        if member.youtube_url:
+            buttons["youtube"] = QRect(x, y, 40, 30)
+            x += 45
+        if member.twitter_url:
+            buttons["twitter"] = QRect(x, y, 40, 30)
+        return buttons
+
+    def _icon_rect(self, card):
+        if self.style == "mini":
+            return QRect(card.left() + 8, card.center().y() - 20, 40, 40)
+        if self.style == "channel":
+            return QRect(card.center().x() - 40, card.top() + 12, 80, 80)
+        return QRect(card.left() + 16, card.center().y() - 40, 80, 80)
+
+    def image_requests(self, index, rect):
+        """(url, size) of the images painted for ``index`` in ``rect`` (ViewportImageTracker)."""
+        _, member = self._entry(index)
+        if member is None:
+            return []
+        return [(member.icon_url, self._icon_rect(rect.adjusted(1, 1, -1, -1)).size())]
+
+    def _hit(self, rect, member, pos):
+        for name, button_rect in self._buttons(rect, member).items():
+            if button_rect.contains(pos):
+                return name
+        return None
+
+    # --- Painting ---
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        title, member = self._entry(index)
+        if member is None:
+            if title is not None:
+                self._paint_section(painter, option.rect, title)
+        else:
+            hovered = option.state & QStyle.State_MouseOver
+            self._paint_card(painter, option.rect, member, index.row(), bool(hovered))
+        painter.restore()
+
+    def _paint_section(self, painter, rect, title):
+        painter.setPen(QColor("#e94560"))
+        painter.setFont(self.section_font)
+        painter.drawText(rect.adjusted(8, 0, -8, -6), Qt.AlignLeft | Qt.AlignBottom, title)
+        painter.setPen(QColor("#3a3a5e"))
+        painter.drawLine(rect.left() + 4, rect.bottom() - 2, rect.right() - 4, rect.bottom() - 2)
+
+    def _paint_icon(self, painter, rect, url, round_icon):
+        pixmap = self.images.pixmap(url, rect.size() * painter.device().devicePixelRatioF())
+        clip = QPainterPath()
+        if round_icon:
+            clip.addEllipse(rect)
+        else:
+            clip.addRoundedRect(rect, 5, 5)
+        painter.setClipPath(clip)
+        if pixmap is not None:
+            painter.drawPixmap(rect, pixmap)
+        else:
+            painter.fillRect(rect, QColor("#cccccc"))
+        painter.setClipping(False)
+
+    def _paint_button(self, painter, rect, text, color, hover_color, hovered, text_color="white"):
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(hover_color if hovered else color))
+        painter.drawRoundedRect(rect, 6, 6)
+        painter.setPen(QColor(text_color))
+        painter.setFont(self.button_font)
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    def _paint_card(self, painter, rect, member, row, hovered):
+        card = rect.adjusted(1, 1, -1, -1)
+        if self.style == "mini":
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor("#1a1a2e"))
+            painter.drawRoundedRect(card, 6, 6)
+            self._paint_icon(painter, self._icon_rect(card), member.icon_url, True)
+            painter.setPen(QColor("white"))
+            painter.setFont(self.name_font)
+            painter.drawText(QRect(card.left() + 56, card.top(), card.width() - 62, card.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter | Qt.TextWordWrap, member.name)
+            return
+        painter.setPen(QColor("#e94560") if hovered else QColor("#3a3a5e"))
+        painter.setBrush(QColor("#16213e"))
+        painter.drawRoundedRect(card, 8 if self.style == "channel" else 12, 8 if self.style == "channel" else 12)
+
+        hover_row, hover_button = self._hover
+        buttons = self._buttons(card, member)
+
+        if self.style == "channel":
+            self._paint_icon(painter, self._icon_rect(card), member.icon_url, False)
+
+            painter.setPen(QColor("#eaeaea"))
+            painter.setFont(self.name_font)
+            name_rect = QRect(card.left() + 6, card.top() + 96, card.width() - 12, 36)
+            painter.drawText(name_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, member.name)
+
+            painter.setPen(QColor("#666"))
+            painter.setFont(self.small_font)
+            painter.drawText(QRect(card.left(), name_rect.bottom() + 2, card.width(), 16),
+                             Qt.AlignHCenter | Qt.AlignTop, f"[{member.group_name}]")
+
+            self._paint_button(painter, buttons["youtube"], "📺 視聴", "#e94560", "#ff6b8a",
+                               hover_row == row and hover_button == "youtube")
+            painter.setPen(QColor("#fbbf24" if member.is_favorite else "#666"))
+            painter.setFont(QFont("Yu Gothic UI", 14))
+            painter.drawText(buttons["favorite"], Qt.AlignCenter, "★" if member.is_favorite else "☆")
+        else:
+            self._paint_icon(painter, self._icon_rect(card), member.icon_url, True)
+
+            painter.setPen(QColor("#eaeaea"))
+            painter.setFont(self.name_font)
+            painter.drawText(QRect(card.left() + 108, card.top() + 16, card.width() - 120, 56),
+                             Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, member.name)
+
+            if "youtube" in buttons:
+                self._paint_button(painter, buttons["youtube"], "📺", "#ff0000", "#ff4040",
+                                   hover_row == row and hover_button == "youtube")
+            if "twitter" in buttons:
+                self._paint_button(painter, buttons["twitter"], "🐦", "#1da1f2", "#4db5f5",
+                                   hover_row == row and hover_button == "twitter")
+
+    # --- Interaction ---
+    def editorEvent(self, event, model, option, index):
+        _, member = self._entry(index)
+        if member is None or event.type() not in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+
+        button = self._hit(option.rect.adjusted(1, 1, -1, -1), member, event.position().toPoint())
+        if event.type() == QEvent.MouseMove:
+            if self._hover != (index.row(), button):
+                self._hover = (index.row(), button)
+                view = self.parent()
+                if view is not None:
+                    view.viewport().setCursor(Qt.PointingHandCursor if button else Qt.ArrowCursor)
+                    view.viewport().update()
+            return False
+
+        if event.button() != Qt.LeftButton or button is None:
+            return False
+        if button == "youtube" and member.youtube_url:
+            QDesktopServices.openUrl(QUrl(member.youtube_url))
+        elif button == "twitter" and member.twitter_url:
+            QDesktopServices.openUrl(QUrl(member.twitter_url))
+        elif button == "favorite":
+            self.favorite_clicked.emit(member)
+        return True
+
+    def clear_hover(self):
+        self._hover = (-1, None)
+
+
+class MemberGridView(QListView):
+    """
+    Wrapping grid of painted member cards with full-width generation headers.
+
+    Uses list mode with left-to-right flow and wrapping, so a header whose size
+    hint spans the viewport starts a new line; only visible cards are painted.
+    """
+
+    def __init__(self, style="channel", parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.ListMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setSpacing(5)
+        self.setMovement(QListView.Static)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(20)
+        self.setMouseTracking(True)
+        self.card_delegate = MemberCardDelegate(style, self)
+        self.setItemDelegate(self.card_delegate)
+        self.image_tracker = ViewportImageTracker(self)
+        ImageStore.instance().image_loaded.connect(self._on_image_loaded)
+
+    def _on_image_loaded(self, url):
+        self.viewport().update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        self.image_tracker.schedule()
+
+    def hideEvent(self, event):
+        self.image_tracker.clear()
+        super().hideEvent(event)
+
+    def leaveEvent(self, event):
+        self.card_delegate.clear_hover()
+        self.viewport().unsetCursor()
+        super().leaveEvent(event)
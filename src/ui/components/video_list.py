@@ -0,0 +1,397 @@
+import logging
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (Qt, QAbstractListModel, QAbstractProxyModel, QModelIndex, QPoint, QRect,
+                            QRunnable, QSize, QThreadPool, QTimer, QUrl, QEvent, Signal)
+from PySide6.QtGui import QDesktopServices, QFont, QColor, QPainter, QPainterPath, QFontMetrics
+from ui.components.async_image import ImageStore, ViewportImageTracker
+from ui.components.list_diff import apply_list_diff
+
+logger = logging.getLogger(__name__)
+
+VideoRole = Qt.UserRole + 1
+
+ROW_HEIGHT = 110
+THUMB_W, THUMB_H = 160, 90
+BUTTON_W, BUTTON_H = 150, 34
+WATCH_TEXT = "▶ YouTubeで視聴"
+
+PAGE_SIZE = 50
+# Pages kept resident on either side of the visible rows; anything further is evicted
+KEEP_PAGES = 2
+
+
+class _Evicted:
+    """Stand-in for a row whose Video was dropped; keeps the key for list diffs."""
+    __slots__ = ("video_id",)
+
+    def __init__(self, video_id):
+        self.video_id = video_id
+
+
+class PageLoadTask(QRunnable):
+    """Runs a page query off the GUI thread and hands the rows back to the model."""
+
+    def __init__(self, model, generation, offset, loader):
+        super().__init__()
+        self.model = model
+        self.generation = generation
+        self.offset = offset
+        self.loader = loader
+
+    def run(self):
+        try:
+            videos = self.loader(PAGE_SIZE, self.offset)
+        except Exception as e:
+            logger.warning(f"Loading videos at offset {self.offset} failed: {e}")
+            signal, args = self.model.page_failed, (self.generation, self.offset)
+        else:
+            signal, args = self.model.page_loaded, (self.generation, self.offset, videos)
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # Model was deleted while the query ran
+
+
+class VideoListModel(QAbstractListModel):
+    """
+    Flat list of Video objects; rows are painted by VideoItemDelegate.
+
+    Either fed directly with set_videos, or paged from a loader
+    ``(limit, offset) -> [Video]`` (set_loader): the view pulls pages through
+    canFetchMore/fetchMore as it nears the bottom, the page after the last one
+    is prefetched in the background, and touch() evicts pages that scrolled far
+    away (reloading them when they come back into view) to bound memory.
+    """
+
+    # (generation, offset, videos) from PageLoadTask, delivered on the GUI thread
+    page_loaded = Signal(int, int, list)
+    # (generation, offset) of a PageLoadTask whose query raised
+    page_failed = Signal(int, int)
+    # A background prefetch finished; its thumbnails can be requested
+    prefetched = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._videos = []  # Video, or _Evicted for rows dropped by touch()
+        self._loader = None
+        self._exhausted = True
+        self._generation = 0   # bumped by refresh so stale page loads are ignored
+        self._in_flight = set()  # offsets being loaded in the background
+        self._prefetch = None   # (offset, videos) of the page after the last row
+        self.pool = QThreadPool.globalInstance()
+        self.page_loaded.connect(self._on_page_loaded)
+        self.page_failed.connect(self._on_page_failed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._videos)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._videos):
+            return None
+        video = self.video_at(index.row())
+        if video is None:
+            return None  # Evicted; the delegate paints it as reloading
+        if role == Qt.DisplayRole:
+            return video.title
+        if role == Qt.ToolTipRole:
+            return video.title
+        if role == VideoRole:
+            return video
+        return None
+
+    def set_videos(self, videos):
+        """Show ``videos``, applying only the inserted/updated/removed rows (see apply_list_diff)."""
+        return apply_list_diff(self, self._videos, list(videos), key=lambda v: v.video_id)
+
+    def video_at(self, row):
+        video = self._videos[row] if 0 <= row < len(self._videos) else None
+        return None if isinstance(video, _Evicted) else video
+
+    # --- Paging ---
+    def set_loader(self, loader):
+        """Page rows from ``loader(limit, offset)`` instead of set_videos, starting at the first page."""
+        self._loader = loader
+        return self.refresh()
+
+    def refresh(self):
+        """
+        Re-query everything up to the last resident page and diff it in.
+
+        Rows past that point are dropped (fetchMore brings them back), so a
+        refresh costs what the user has scrolled through, not what was loaded.
+        """
+        self._generation += 1
+        self._in_flight.clear()
+        self._prefetch = None
+        resident = [row for row, video in enumerate(self._videos) if not isinstance(video, _Evicted)]
+        count = max(PAGE_SIZE, (resident[-1] // PAGE_SIZE + 1) * PAGE_SIZE if resident else 0)
+        videos = self._loader(count, 0)
+        self._exhausted = len(videos) < count
+        result = self.set_videos(videos)
+        self._start_prefetch()
+        return result
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loader is not None and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        offset = len(self._videos)
+        if self._prefetch is not None and self._prefetch[0] == offset:
+            videos = self._prefetch[1]
+        else:
+            videos = self._loader(PAGE_SIZE, offset)
+        self._prefetch = None
+        self._exhausted = len(videos) < PAGE_SIZE
+        if videos:
+            self.beginInsertRows(QModelIndex(), offset, offset + len(videos) - 1)
+            self._videos.extend(videos)
+            self.endInsertRows()
+        self._start_prefetch()
+
+    def prefetched_videos(self):
+        """The prefetched next page (not rows yet), for thumbnail prefetching."""
+        return self._prefetch[1] if self._prefetch is not None else []
+
+    def touch(self, first, last):
+        """
+        Rows ``first``..``last`` are on screen: evict pages more than KEEP_PAGES
+        away and reload evicted pages within reach in the background.
+        """
+        if self._loader is None or not self._videos:
+            return
+        first_page, last_page = first // PAGE_SIZE, last // PAGE_SIZE
+        for page in range((len(self._videos) - 1) // PAGE_SIZE + 1):
+            start, end = page * PAGE_SIZE, min((page + 1) * PAGE_SIZE, len(self._videos))
+            if first_page - KEEP_PAGES <= page <= last_page + KEEP_PAGES:
+                if page >= first_page - 1 and page <= last_page + 1 and start not in self._in_flight \
+                        and any(isinstance(v, _Evicted) for v in self._videos[start:end]):
+                    self._load_page(start)
+            elif not isinstance(self._videos[start], _Evicted) or not isinstance(self._videos[end - 1], _Evicted):
+                self._videos[start:end] = [_Evicted(v.video_id) for v in self._videos[start:end]]
+
+    def resident_count(self):
+        return sum(1 for v in self._videos if not isinstance(v, _Evicted))
+
+    def _start_prefetch(self):
+        if self._loader is not None and not self._exhausted:
+            self._load_page(len(self._videos))
+
+    def _load_page(self, offset):
+        self._in_flight.add(offset)
+        self.pool.start(PageLoadTask(self, self._generation, offset, self._loader))
+
+    def _on_page_failed(self, generation, offset):
+        # Free the offset: touch() reloads the page on the next scroll/paint, fetchMore queries it directly
+        if generation == self._generation:
+            self._in_flight.discard(offset)
+
+    def _on_page_loaded(self, generation, offset, videos):
+        if generation != self._generation:
+            return
+        self._in_flight.discard(offset)
+        if offset == len(self._videos):
+            self._prefetch = (offset, videos)
+            self.prefetched.emit()
+            return
+        current = self._videos[offset:offset + len(videos)]
+        if [v.video_id for v in current] != [v.video_id for v in videos]:
+            # Rows shifted since the page was evicted (new videos arrived); realign everything
+            self.refresh()
+            return
+        self._videos[offset:offset + len(videos)] = videos
+        self.dataChanged.emit(self.index(offset), self.index(offset + len(videos) - 1))
+
+
+class VideoItemDelegate(QStyledItemDelegate):
+    """
+    Paints a video row: thumbnail, title, date and a "watch" button.
+
+    Nothing is instantiated per row; thumbnails come from the shared ImageStore
+    and the button is a painted rect that reacts to clicks in editorEvent.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.images = ImageStore.instance()
+        self.title_font = QFont("Arial", 11, QFont.Bold)
+        self.detail_font = QFont("Arial", 9)
+        self.button_font = QFont("Arial", 9, QFont.Bold)
+        self._hover_row = -1
+        self._hover_button = False
+
+    @staticmethod
+    def _video(index):
+        # Read the row straight from the Python model instead of index.data()
+        model = index.model()
+        while isinstance(model, QAbstractProxyModel):
+            index = model.mapToSource(index)
+            model = index.model()
+        return model.video_at(index.row())
+
+    def sizeHint(self, option, index):
+        return QSize(0, ROW_HEIGHT)
+
+    def _layout(self, rect):
+        inner = rect.adjusted(8, 8, -8, -8)
+        thumb = QRect(inner.left(), inner.top() + (inner.height() - THUMB_H) // 2, THUMB_W, THUMB_H)
+        button = QRect(inner.right() - BUTTON_W, inner.top(), BUTTON_W, BUTTON_H)
+        text = QRect(thumb.right() + 12, inner.top(), button.left() - thumb.right() - 24, inner.height())
+        return thumb, text, button
+
+    def image_requests(self, index, rect):
+        """(url, size) of the images painted for ``index`` in ``rect`` (ViewportImageTracker)."""
+        return self.video_image_requests(self._video(index), rect)
+
+    def video_image_requests(self, video, rect):
+        if video is None:
+            return []
+        thumb_rect, _, _ = self._layout(rect.adjusted(3, 3, -3, -3))
+        return [(video.thumbnail_url, thumb_rect.size())]
+
+    def paint(self, painter, option, index):
+        video = self._video(index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        row_rect = option.rect.adjusted(3, 3, -3, -3)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#0f3460") if hovered and video is not None else QColor("#1a1a2e"))
+        painter.drawRoundedRect(row_rect, 6, 6)
+        if video is None:
+            # Evicted page being reloaded: keep the row's place
+            painter.restore()
+            return
+
+        thumb_rect, text_rect, button_rect = self._layout(row_rect)
+
+        # Thumbnail (placeholder until the image store has it)
+        pixmap = self.images.pixmap(video.thumbnail_url, thumb_rect.size() * painter.device().devicePixelRatioF())
+        clip = QPainterPath()
+        clip.addRoundedRect(thumb_rect, 5, 5)
+        painter.setClipPath(clip)
+        if pixmap is not None:
+            painter.drawPixmap(thumb_rect, pixmap)
+        else:
+            painter.fillRect(thumb_rect, QColor("#cccccc"))
+        painter.setClipping(False)
+
+        # Title (up to two lines) and date
+        painter.setPen(QColor("#eaeaea"))
+        painter.setFont(self.title_font)
+        title_height = QFontMetrics(self.title_font).lineSpacing() * 2
+        title_rect = QRect(text_rect.left(), text_rect.top(), text_rect.width(), title_height)
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, video.title)
+
+        painter.setPen(QColor("gray"))
+        painter.setFont(self.detail_font)
+        detail_rect = QRect(text_rect.left(), title_rect.bottom() + 4, text_rect.width(), 20)
+        painter.drawText(detail_rect, Qt.AlignLeft | Qt.AlignTop, video.published_at.strftime('%Y-%m-%d %H:%M'))
+
+        # Watch button
+        button_hover = self._hover_button and self._hover_row == index.row()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("#ff6b8a") if button_hover else QColor("#e94560"))
+        painter.drawRoundedRect(button_rect, 6, 6)
+        painter.setPen(QColor("white"))
+        painter.setFont(self.button_font)
+        painter.drawText(button_rect, Qt.AlignCenter, WATCH_TEXT)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() in (QEvent.MouseMove, QEvent.MouseButtonRelease):
+            _, _, button_rect = self._layout(option.rect.adjusted(3, 3, -3, -3))
+            on_button = button_rect.contains(event.position().toPoint())
+            if event.type() == QEvent.MouseMove:
+                if on_button != self._hover_button or self._hover_row != index.row():
+                    self._hover_button = on_button
+                    self._hover_row = index.row()
+                    view = self.parent()
+                    if view is not None:
+                        view.viewport().setCursor(Qt.PointingHandCursor if on_button else Qt.ArrowCursor)
+                        view.viewport().update()
+            elif on_button and event.button() == Qt.LeftButton:
+                video = self._video(index)
+                if video is not None:
+                    QDesktopServices.openUrl(QUrl(video.url))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class VideoListView(QListView):
+    """QListView preconfigured for VideoListModel/VideoItemDelegate."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSelectionMode(QAbstractItemView.NoSelection)  # Disable blue selection
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setItemDelegate(VideoItemDelegate(self))
+        self._empty_text = ""
+        self.image_tracker = ViewportImageTracker(self)
+        ImageStore.instance().image_loaded.connect(self._on_image_loaded)
+        # Paging: report the visible rows to the model once per paint burst
+        self._page_timer = QTimer(self)
+        self._page_timer.setSingleShot(True)
+        self._page_timer.setInterval(0)
+        self._page_timer.timeout.connect(self._update_pages)
+        self.verticalScrollBar().valueChanged.connect(self._fetch_ahead)
+
+    def setModel(self, model):
+        super().setModel(model)
+        if hasattr(model, "prefetched"):
+            model.prefetched.connect(self.image_tracker.schedule)
+
+    def _fetch_ahead(self, value):
+        # Qt only calls fetchMore at the very bottom; start within one viewport of it
+        bar, model = self.verticalScrollBar(), self.model()
+        if model is not None and value >= bar.maximum() - self.viewport().height() and model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+
+    def _update_pages(self):
+        model = self.model()
+        if not hasattr(model, "touch") or model.rowCount() == 0:
+            return
+        first = self.indexAt(QPoint(0, 0)).row()
+        last = self.indexAt(QPoint(0, self.viewport().height() - 1)).row()
+        model.touch(max(first, 0), last if last >= 0 else model.rowCount() - 1)
+
+    def prefetch_image_requests(self):
+        """Thumbnails of the model's prefetched next page (ViewportImageTracker)."""
+        videos = getattr(self.model(), "prefetched_videos", list)()
+        rect = QRect(0, 0, self.viewport().width(), ROW_HEIGHT)
+        delegate = self.itemDelegate()
+        return [request for video in videos for request in delegate.video_image_requests(video, rect)]
+
+    def set_empty_text(self, text):
+        self._empty_text = text
+        self.viewport().update()
+
+    def _on_image_loaded(self, url):
+        # Only visible rows are painted, so a viewport repaint is all that's needed
+        self.viewport().update()
+
+    def leaveEvent(self, event):
+        delegate = self.itemDelegate()
+        delegate._hover_button = False
+        delegate._hover_row = -1
+        self.viewport().unsetCursor()
+        super().leaveEvent(event)
+
+    def hideEvent(self, event):
+        self.image_tracker.clear()
+        super().hideEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        self.image_tracker.schedule()
+        self._page_timer.start()
+        if self._empty_text and (self.model() is None or self.model().rowCount() == 0):
+            painter = QPainter(self.viewport())
+            painter.setPen(QColor("#888"))
+            painter.drawText(self.viewport().rect().adjusted(10, 10, -10, -10),
+                             Qt.AlignTop | Qt.AlignLeft, self._empty_text)
@@ -0,0 +1,56 @@
+"""
+Background exports for the GUI.
+"""
+
+import asyncio
+import functools
+from typing import Callable
+from PySide6.QtCore import QObject, Signal
+from core.jobs import CancellationToken
+from ui.async_bridge import AsyncBridge
+
+
+class ExportTask(QObject):
+    """
+    Runs one ExportManager (or BackupManager) call off the GUI thread.
+
+    The work itself is blocking (SQLite reads and file writes), so it runs
+    in a worker thread of the shared AsyncService loop; progress and the
+    outcome arrive as signals on the GUI thread.
+
+    Example:
+        task = ExportTask(lambda progress, token: exporter.export_videos(path, progress=progress, token=token))
+        task.progress.connect(...)
+        task.finished.connect(...)
+        task.start()
+    """
+
+    # ExportProgress after each chunk
+    progress = Signal(object)
+    # The call's ExportResult/BackupResult (``cancelled`` set when cancel() stopped it)
+    finished = Signal(object)
+    # Exception the export raised (the partial file was removed)
+    failed = Signal(object)
+
+    def __init__(self, export: Callable[..., object], parent=None):
+        super().__init__(parent)
+        self.export = export
+        self.token = CancellationToken()
+        self.bridge = AsyncBridge(self)
+        self.future = None
+
+    @property
+    def running(self) -> bool:
+        return self.future is not None and not self.future.done()
+
+    def start(self):
+        self.future = self.bridge.submit(self._run(), on_done=self.finished.emit, on_error=self.failed.emit)
+
+    def cancel(self):
+        """Stop after the chunk being written; the target file is left as it was."""
+        self.token.cancel()
+
+    async def _run(self):
+        # Default executor of the service loop (asyncio.to_thread needs Python 3.9)
+        work = functools.partial(self.export, progress=self.progress.emit, token=self.token)
+        return await asyncio.get_running_loop().run_in_executor(None, work)
@@ -7,6 +7,7 @@ from ui.tabs.favorites import FavoritesTab
 from ui.tabs.sns import SNSTab
 from ui.tabs.stats_tab import StatsTab
 from ui.tabs.schedule_tab import ScheduleTab
+from ui.components.lazy_tab import LazyTab
 
 
 
@@ -15,6 +16,7 @@ class GroupTabsContainer(QWidget):
     """
     A container widget that holds all tabs for a specific group (hololive or nijisanji).
     Each container has: Channels, Videos, Collabs, Favorites, and SNS tabs.
+    Tabs are LazyTab hosts: a tab's widgets are built the first time it is shown.
     """
     
     def __init__(self, data_manager: DataManager, group_name: str):
@@ -39,25 +41,32 @@ class GroupTabsContainer(QWidget):
         layout.addWidget(self.tabs)
         
         # Create all tabs with group filter
-        self.stats_tab = StatsTab(self.data_manager, group_filter=self.group_name)
+        self.stats_tab = LazyTab(lambda: StatsTab(self.data_manager, group_filter=self.group_name))
+        self.stats_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.stats_tab, "📊 統計")
         
-        self.schedule_tab = ScheduleTab(self.data_manager, group_filter=self.group_name)
+        self.schedule_tab = LazyTab(lambda: ScheduleTab(self.data_manager, group_filter=self.group_name))
+        self.schedule_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.schedule_tab, "📅 スケジュール")
         
-        self.channels_tab = ChannelsTab(self.data_manager, group_filter=self.group_name)
+        self.channels_tab = LazyTab(lambda: ChannelsTab(self.data_manager, group_filter=self.group_name))
+        self.channels_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.channels_tab, "📺 チャンネル")
         
-        self.videos_tab = VideosTab(self.data_manager, group_filter=self.group_name)
+        self.videos_tab = LazyTab(lambda: VideosTab(self.data_manager, group_filter=self.group_name))
+        self.videos_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.videos_tab, "🎬 最新動画")
         
-        self.collabs_tab = CollabsTab(self.data_manager, group_filter=self.group_name)
+        self.collabs_tab = LazyTab(lambda: CollabsTab(self.data_manager, group_filter=self.group_name))
+        self.collabs_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.collabs_tab, "🤝 コラボ")
         
-        self.favorites_tab = FavoritesTab(self.data_manager, group_filter=self.group_name)
+        self.favorites_tab = LazyTab(lambda: FavoritesTab(self.data_manager, group_filter=self.group_name))
+        self.favorites_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.favorites_tab, "⭐ お気に入り")
         
-        self.sns_tab = SNSTab(self.data_manager, group_filter=self.group_name)
+        self.sns_tab = LazyTab(lambda: SNSTab(self.data_manager, group_filter=self.group_name))
+        self.sns_tab.materialized.connect(self.on_tab_materialized)
         self.tabs.addTab(self.sns_tab, "🔗 SNS")
         
         # Connect tab change signal
@@ -86,6 +95,10 @@ class GroupTabsContainer(QWidget):
         if current:
             self._refresh_tab(current)
 
+    def on_tab_materialized(self, widget):
+        # A freshly built tab has just loaded its data
+        self.tab_loaded[widget.parentWidget()] = True
+
     def on_tab_changed(self, index):
         """Handle tab change to load data if needed"""
         widget = self.tabs.widget(index)
@@ -0,0 +1,127 @@
+"""
+Image pipeline benchmark: GUI stalls while a screenful of large icons arrives.
+
+    PYTHONPATH=src python -m ui.image_store_probe [--icons N]
+
+Serves N large portrait JPEGs from file:// URLs (one file, hard-linked under
+N names, so every URL is a separate fetch) and requests them all at once
+through ImageStore's public API. A 5 ms timer records how late it fires. For
+comparison the same images are decoded full-size on the GUI thread, which is
+what AsyncImageLoader.handle_finished used to do.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from PySide6.QtCore import QBuffer, QIODevice, QSize, Qt, QTimer, QUrl
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QApplication
+from ui.components.async_image import ImageStore
+
+SOURCE, TARGET = QSize(1200, 1800), QSize(80, 80)
+TICK_MS = 5
+
+
+def make_portrait() -> bytes:
+    image = QImage(SOURCE, QImage.Format_RGB32)
+    painter = QPainter(image)
+    for i in range(0, SOURCE.height(), 6):
+        painter.fillRect(0, i, SOURCE.width(), 6, QColor.fromHsv(i % 360, 120 + i % 100, 200))
+    painter.end()
+    buffer = QBuffer()
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "JPG", 90)
+    return bytes(buffer.data())
+
+
+def serve(data: bytes, count: int, directory: str):
+    """file:// URLs of ``count`` distinct names for the same image."""
+    first = os.path.join(directory, "icon0.jpg")
+    with open(first, "wb") as f:
+        f.write(data)
+    paths = [first]
+    for i in range(1, count):
+        path = os.path.join(directory, f"icon{i}.jpg")
+        os.link(first, path)
+        paths.append(path)
+    return [QUrl.fromLocalFile(path).toString() for path in paths]
+
+
+def measure(app, start_all, is_done):
+    """Run the event loop until ``is_done()``; returns (seconds, worst timer lateness in seconds)."""
+    lags, last = [], [time.perf_counter()]
+    ticker = QTimer()
+    ticker.setInterval(TICK_MS)
+
+    def tick():
+        now = time.perf_counter()
+        lags.append(now - last[0] - TICK_MS / 1000)
+        last[0] = now
+        if is_done():
+            ticker.stop()
+            app.quit()
+
+    ticker.timeout.connect(tick)
+    ticker.start()
+    started = time.perf_counter()
+    QTimer.singleShot(0, start_all)
+    app.exec()
+    return time.perf_counter() - started, max(lags, default=0.0)
+
+
+def gui_thread_decode(app, data: bytes, icons: int):
+    done = [0]
+
+    def start_all():
+        for _ in range(icons):
+            def handle():
+                pixmap = QPixmap()
+                pixmap.loadFromData(data)
+                pixmap.scaled(TARGET, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                done[0] += 1
+            QTimer.singleShot(0, handle)
+
+    return measure(app, start_all, lambda: done[0] == icons)
+
+
+def image_store(app, urls):
+    store = ImageStore.instance()
+    pending, done = [], [0]
+
+    def finished(pixmap):
+        done[0] += 1
+
+    def start_all():
+        for url in urls:
+            result = store.request(url, TARGET)
+            if isinstance(result, QPixmap):
+                done[0] += 1
+            else:
+                result.finished.connect(finished)
+                pending.append(result)
+
+    elapsed, worst = measure(app, start_all, lambda: done[0] == len(urls))
+    for result in pending:
+        store.release(result)
+    return elapsed, worst, store.stats()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="GUI stalls while icons load")
+    parser.add_argument("--icons", type=int, default=600)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    data = make_portrait()
+    print(f"source image: {SOURCE.width()}x{SOURCE.height()} JPEG, {len(data) // 1024} KiB")
+
+    elapsed, worst = gui_thread_decode(app, data, args.icons)
+    print(f"GUI-thread decode: {args.icons} icons in {elapsed:.2f}s, worst GUI stall {worst * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        elapsed, worst, stats = image_store(app, serve(data, args.icons, directory))
+    print(f"ImageStore       : {args.icons} icons in {elapsed:.2f}s, worst GUI stall {worst * 1000:.0f} ms, "
+          f"{stats['memory_bytes'] // 1024} KiB cached, {stats['errors']} errors")
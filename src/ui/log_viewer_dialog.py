@@ -1,25 +1,122 @@
 import os
+import re
 import sys
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QApplication
+from collections import deque
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QApplication,
+                               QComboBox, QLineEdit, QLabel)
 from PySide6.QtCore import Qt, QTimer
+from core.log_buffer import LogBuffer
+
+# Matches the format set up in src/main.py: "asctime - name - levelname - message"
+_RECORD_START = re.compile(r"^\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d+ - (\S+) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - ")
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+class LogTail:
+    """
+    Incremental reader for a growing (and rotating) log file.
+
+    Remembers the byte offset it has read up to, so each read_lines() only
+    touches what was appended since. A rotated or truncated file (different
+    inode, or smaller than the offset) is read again from the start. The
+    first read starts ``initial_bytes`` from the end instead of at the top.
+    """
+
+    def __init__(self, path: str, initial_bytes: int = 256 * 1024):
+        self.path = path
+        self.initial_bytes = initial_bytes
+        self.offset = None
+        self._inode = None
+        self._partial = b""  # Trailing bytes of an unfinished line
+
+    def read_lines(self):
+        """Complete lines appended since the last call; None if the file does not exist."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        rotated = self._inode is not None and stat.st_ino != self._inode
+        if self.offset is None or rotated or stat.st_size < self.offset:
+            start = max(0, stat.st_size - self.initial_bytes) if self.offset is None else 0
+            skip_first = start > 0  # Starting mid-file: the first line is most likely cut
+            self.offset, self._partial = start, b""
+        else:
+            skip_first = False
+        self._inode = stat.st_ino
+        if stat.st_size == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+        self.offset += len(data)
+        chunks = (self._partial + data).split(b"\n")
+        self._partial = chunks.pop()
+        if skip_first and chunks:
+            chunks.pop(0)
+        return [c.decode("utf-8", errors="replace").rstrip("\r") for c in chunks]
+
 
 class LogViewerDialog(QDialog):
+    """
+    Shows the application log with level/module/channel filters.
+
+    Reads the in-memory LogBuffer when it is installed (see src/main.py), so
+    filtering is a query rather than a re-read; otherwise tails app.log and
+    the channel filter is unavailable.
+    """
+
+    # Lines kept for re-filtering (app.log fallback), and lines shown in the view
+    KEEP_LINES = 20000
+    MAX_BLOCKS = 5000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("アプリケーションログ")
         self.resize(800, 600)
 
         self.layout = QVBoxLayout(self)
-        
-        self.log_display = QTextEdit()
+
+        # Reader-side filters
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("レベル:"))
+        self.level_filter = QComboBox()
+        self.level_filter.addItems(list(_LEVELS))
+        self.level_filter.setCurrentText("INFO")
+        self.level_filter.currentTextChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.level_filter)
+        filter_layout.addWidget(QLabel("モジュール:"))
+        self.module_filter = QLineEdit()
+        self.module_filter.setPlaceholderText("例: core.manager")
+        self.module_filter.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.module_filter)
+        filter_layout.addWidget(QLabel("チャンネルID:"))
+        self.channel_filter = QLineEdit()
+        self.channel_filter.setPlaceholderText("UC...")
+        self.channel_filter.textChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.channel_filter)
+        self.layout.addLayout(filter_layout)
+
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_display.setMaximumBlockCount(self.MAX_BLOCKS)
         self.layout.addWidget(self.log_display)
 
         refresh_button = QPushButton("更新")
         refresh_button.clicked.connect(self.load_log)
         self.layout.addWidget(refresh_button)
 
+        self.buffer = LogBuffer.instance()
+        self.last_seq = -1  # Newest buffer record already considered
         self.log_file_path = self._get_log_file_path()
+        self.tail = LogTail(self.log_file_path)
+        # (level, logger name, line); continuation lines (tracebacks) inherit their record's level/name
+        self.lines = deque(maxlen=self.KEEP_LINES)
+        self._current = (_LEVELS["INFO"], "")
+        if self.buffer is None:
+            self.channel_filter.setEnabled(False)
+            self.channel_filter.setToolTip("ログバッファが無効なため使用できません")
         self.load_log()
 
         # Optional: Auto-refresh every few seconds
@@ -33,18 +130,64 @@ class LogViewerDialog(QDialog):
         app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
         return os.path.join(app_dir, 'app.log')
 
+    def _accepts(self, entry):
+        level, name, _ = entry
+        module = self.module_filter.text().strip()
+        return level >= _LEVELS[self.level_filter.currentText()] and (not module or module in name)
+
+    def _query(self, limit=None):
+        # Buffer records after last_seq that pass the filters; advances last_seq
+        last = self.buffer.last_seq
+        entries = self.buffer.query(level=_LEVELS[self.level_filter.currentText()],
+                                    channel_id=self.channel_filter.text().strip() or None,
+                                    logger=self.module_filter.text().strip() or None,
+                                    after_seq=self.last_seq, limit=limit)
+        self.last_seq = max(last, entries[-1].seq) if entries else last
+        return [entry.format() for entry in entries]
+
     def load_log(self):
-        if not os.path.exists(self.log_file_path):
-            self.log_display.setText("ログファイルが見つかりません。")
+        """Append the lines written since the last call (that pass the filters)."""
+        if self.buffer is not None:
+            shown = self._query(limit=self.MAX_BLOCKS)  # Older lines would be trimmed from the view anyway
+            if shown:
+                self._append(shown)
             return
-
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.log_display.setText(content)
-                self.log_display.verticalScrollBar().setValue(self.log_display.verticalScrollBar().maximum()) # Scroll to bottom
+            new_lines = self.tail.read_lines()
         except Exception as e:
-            self.log_display.setText(f"ログファイルの読み込み中にエラーが発生しました: {e}")
+            self.log_display.setPlainText(f"ログファイルの読み込み中にエラーが発生しました: {e}")
+            return
+        if new_lines is None:
+            if not self.lines:
+                self.log_display.setPlainText("ログファイルが見つかりません。")
+            return
+
+        entries = []
+        for line in new_lines:
+            match = _RECORD_START.match(line)
+            if match:
+                self._current = (_LEVELS[match.group(2)], match.group(1))
+            entries.append((*self._current, line))
+        self.lines.extend(entries)
+        shown = [entry[2] for entry in entries if self._accepts(entry)]
+        if shown:
+            self._append(shown)
+
+    def apply_filter(self):
+        """Re-render the kept lines with the current filters (no file I/O)."""
+        self.log_display.clear()
+        if self.buffer is not None:
+            self.last_seq = -1
+            self._append(self._query(limit=self.MAX_BLOCKS))
+            return
+        self._append([entry[2] for entry in self.lines if self._accepts(entry)][-self.MAX_BLOCKS:])
+
+    def _append(self, lines):
+        scrollbar = self.log_display.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        self.log_display.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum()) # Scroll to bottom
 
     def closeEvent(self, event):
         self.auto_refresh_timer.stop()
@@ -2,50 +2,36 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QTabWidget, QLabel, QListWidget, QListWidgetItem, 
                                QHBoxLayout, QPushButton, QScrollArea, QFrame,
                                QLineEdit, QGroupBox, QSplitter, QComboBox, 
-                               QMenuBar, QMenu, QFileDialog, QMessageBox)
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QTimer
+                               QMenuBar, QMenu, QFileDialog, QMessageBox, QProgressBar,
+                               QProgressDialog)
+from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QFont, QAction
 from core.manager import DataManager
-from core.export_manager import ExportManager
+from core.backup import BackupManager
+from core.export_manager import ExportManager, parquet_available
+from core.jobs import UpdateJob
 from models.member import Member
 from ui.group_tabs_container import GroupTabsContainer
+from ui.components.async_image import ImageStore
+from ui.components.member_grid import MemberGridModel, MemberGridView
+from ui.components.lazy_tab import LazyTab
 from ui.tabs.channels import ChannelsTab
 from ui.tabs.videos import VideosTab
 from ui.tabs.collabs import CollabsTab
 from ui.notifications import NotificationManager
+from ui.change_feed import ChangeFeed
+from ui.update_coordinator import UpdateCoordinator
+from ui.export_task import ExportTask
 import os
-import asyncio
 import logging
 from datetime import datetime
 from ui.log_viewer_dialog import LogViewerDialog # Import the new dialog
 
-class Worker(QThread):
-    finished = Signal(bool) # Modified to emit a boolean indicating success
-    
-    def __init__(self, manager):
-        super().__init__()
-        self.manager = manager
-
-    def run(self):
-        # Setup logger for worker thread
-        logger = logging.getLogger(__name__)
-        logger.info("Worker thread started")
-        
-        success = True # Assume success initially
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            logger.info("Calling update_all_data")
-            loop.run_until_complete(self.manager.update_all_data())
-            loop.close()
-            logger.info("Worker thread finished successfully")
-        except Exception as e:
-            logger.error(f"Error in data update worker: {e}", exc_info=True)
-            success = False # Set to False on error
-        finally:
-            self.finished.emit(success) # Emit success status
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):
+    API_KEY_DEBOUNCE_MS = 1500
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("ホロライブ・にじさんじ 統合アプリ")
@@ -56,11 +42,23 @@ class MainWindow(QMainWindow):
         
         self.data_manager = DataManager()
         self.export_manager = ExportManager(self.data_manager.db)
+        self.backup_manager = BackupManager(self.data_manager.db)
+        self._exports = []  # ExportTask objects still running
         self.api_key = ""
         
         # Setup notification manager
         self.notification_manager = NotificationManager(self)
-        
+
+        # Deltas from the database (this window's updates, the CLI, cron jobs)
+        self.change_feed = ChangeFeed(self.data_manager.db, self)
+        self.change_feed.videos_added.connect(self.notify_new_videos)
+        
+        # Every update (menu, buttons, timer, tabs) goes through one coordinator
+        self.updates = UpdateCoordinator.for_manager(self.data_manager)
+        self.updates.started.connect(self.on_update_started)
+        self.updates.progress.connect(self.on_update_progress)
+        self.updates.finished.connect(self.on_update_finished)
+
         # Theme state
         self.current_theme = "dark"  # default theme
         
@@ -97,9 +95,10 @@ class MainWindow(QMainWindow):
         self.api_status_label.setObjectName("subLabel")
         settings_layout.addWidget(self.api_status_label)
         
-        refresh_btn = QPushButton("🔄 全データ更新")
-        refresh_btn.clicked.connect(self.refresh_data)
-        settings_layout.addWidget(refresh_btn)
+        # Doubles as the cancel button while an update runs
+        self.refresh_btn = QPushButton("🔄 全データ更新")
+        self.refresh_btn.clicked.connect(self.on_refresh_clicked)
+        settings_layout.addWidget(self.refresh_btn)
         
         main_layout.addWidget(settings_frame)
         
@@ -120,9 +119,23 @@ class MainWindow(QMainWindow):
         self.setup_integrated_tab()
         self.tabs.addTab(self.integrated_tab, "🌐 統合ビュー")
 
+        # Tabs exist now, so deltas can be applied to them
+        self.change_feed.changed.connect(self.on_data_changed)
+
         # Status Bar
         self.status_label = QLabel("準備完了")
         self.statusBar().addWidget(self.status_label)
+        self.update_progress = QProgressBar()
+        self.update_progress.setMaximumWidth(240)
+        self.update_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.update_progress)
+
+        # While an update runs, pick up committed videos shortly after channels report new ones
+        # (VideoWriter commits at most 0.5 s after a batch is queued)
+        self.progress_poll = QTimer(self)
+        self.progress_poll.setSingleShot(True)
+        self.progress_poll.setInterval(700)
+        self.progress_poll.timeout.connect(self.change_feed.poll)
         
         # Initial Data Fetch
         # DISABLED AUTOMATIC UPDATE ON STARTUP TO PREVENT FREEZE
@@ -133,6 +146,24 @@ class MainWindow(QMainWindow):
         self.update_timer.timeout.connect(self.scheduled_update)
         self.update_timer.start(3600000)  # 1 hour
 
+        # Daily database snapshot (checked hourly, see BackupManager.backup_if_due)
+        self.backup_timer = QTimer(self)
+        self.backup_timer.timeout.connect(self.scheduled_backup)
+        self.backup_timer.start(3600000)
+
+    def closeEvent(self, event):
+        # Stop a running update so its thread is not destroyed mid-run
+        self.updates.shutdown()
+        # Running exports stop after their current chunk and remove their partial files
+        for task in self._exports:
+            task.cancel()
+        for task in self._exports:
+            try:
+                task.future.exception(10)
+            except Exception:
+                pass
+        super().closeEvent(event)
+
     def load_stylesheet(self):
         qss_path = os.path.join(os.path.dirname(__file__), "styles", "main.qss")
         if os.path.exists(qss_path):
@@ -171,7 +202,36 @@ class MainWindow(QMainWindow):
         restore_fav_action = QAction("お気に入りを復元...", self)
         restore_fav_action.triggered.connect(self.restore_favorites)
         export_menu.addAction(restore_fav_action)
-        
+
+        export_menu.addSeparator()
+
+        backup_db_action = QAction("データベースをバックアップ", self)
+        backup_db_action.triggered.connect(self.backup_database)
+        export_menu.addAction(backup_db_action)
+
+        restore_db_action = QAction("データベースを復元...", self)
+        restore_db_action.triggered.connect(self.restore_database)
+        export_menu.addAction(restore_db_action)
+        
+        # Update Menu (scoped update jobs, see core.jobs)
+        update_menu = menubar.addMenu("更新(&U)")
+        update_jobs = [
+            ("全データ", lambda: UpdateJob()),
+            ("ホロライブの動画", lambda: UpdateJob("group", group="hololive")),
+            ("にじさんじの動画", lambda: UpdateJob("group", group="nijisanji")),
+            ("お気に入りの動画のみ", lambda: UpdateJob("favorites")),
+            ("1時間以上未取得のチャンネルのみ", lambda: UpdateJob("stale")),
+        ]
+        for label, make_job in update_jobs:
+            action = QAction(label, self)
+            action.triggered.connect(lambda checked=False, make_job=make_job: self.start_update(make_job()))
+            update_menu.addAction(action)
+        update_menu.addSeparator()
+        self.cancel_update_action = QAction("更新を中止", self)
+        self.cancel_update_action.setEnabled(False)
+        self.cancel_update_action.triggered.connect(self.cancel_update)
+        update_menu.addAction(self.cancel_update_action)
+
         # Theme Menu
         theme_menu = menubar.addMenu("テーマ(&T)")
         
@@ -202,39 +262,41 @@ class MainWindow(QMainWindow):
         log_viewer_action.triggered.connect(self.show_log_viewer)
         help_menu.addAction(log_viewer_action)
 
+    def _export_file_filter(self):
+        filters = ["CSV Files (*.csv)", "JSON Lines (*.jsonl)"]
+        if parquet_available():
+            filters.append("Parquet (*.parquet)")
+        return ";;".join(filters)
+
     def export_members(self):
-        """Export members list to CSV"""
+        """Export members list to CSV, JSON Lines or Parquet"""
         filepath, _ = QFileDialog.getSaveFileName(
             self,
             "メンバーリストをエクスポート",
             f"members_{datetime.now().strftime('%Y%m%d')}.csv",
-            "CSV Files (*.csv)"
+            self._export_file_filter()
         )
         
         if filepath:
-            try:
-                from datetime import datetime
-                self.export_manager.export_members_csv(filepath)
-                QMessageBox.information(self, "成功", "メンバーリストをエクスポートしました")
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"エクスポートに失敗しました: {e}")
+            self.start_export(
+                "メンバーリストをエクスポート",
+                lambda progress, token: self.export_manager.export_members(filepath, progress=progress, token=token),
+                lambda result: f"メンバーリストをエクスポートしました（{result.rows:,}件）", "エクスポート")
     
     def export_videos(self):
-        """Export videos list to CSV"""
+        """Export the whole video archive to CSV, JSON Lines or Parquet"""
         filepath, _ = QFileDialog.getSaveFileName(
             self,
             "動画リストをエクスポート",
             f"videos_{datetime.now().strftime('%Y%m%d')}.csv",
-            "CSV Files (*.csv)"
+            self._export_file_filter()
         )
         
         if filepath:
-            try:
-                from datetime import datetime
-                self.export_manager.export_videos_csv(filepath)
-                QMessageBox.information(self, "成功", "動画リストをエクスポートしました")
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"エクスポートに失敗しました: {e}")
+            self.start_export(
+                "動画リストをエクスポート",
+                lambda progress, token: self.export_manager.export_videos(filepath, progress=progress, token=token),
+                lambda result: f"動画リストをエクスポートしました（{result.rows:,}件）", "エクスポート")
     
     def backup_favorites(self):
         """Backup favorites to JSON"""
@@ -246,12 +308,120 @@ class MainWindow(QMainWindow):
         )
         
         if filepath:
-            try:
-                from datetime import datetime
-                self.export_manager.export_favorites_json(filepath)
-                QMessageBox.information(self, "成功", "お気に入りをバックアップしました")
-            except Exception as e:
-                QMessageBox.critical(self, "エラー", f"バックアップに失敗しました: {e}")
+            self.start_export(
+                "お気に入りをバックアップ",
+                lambda progress, token: self.export_manager.export_favorites_json(filepath),
+                lambda result: f"お気に入りをバックアップしました（{result.rows:,}件）", "バックアップ")
+
+    def backup_database(self):
+        """Snapshot app.db into data/backups (keeps the newest few)"""
+        self.start_export(
+            "データベースをバックアップ",
+            lambda progress, token: self.backup_manager.create_snapshot(progress=progress, token=token),
+            lambda result: f"データベースをバックアップしました\n{result.path}", "バックアップ", unit="ページ")
+
+    def restore_database(self):
+        """Replace app.db's contents with a snapshot"""
+        if self.updates.busy:
+            QMessageBox.warning(self, "復元", "データ更新中は復元できません。更新の完了後に実行してください。")
+            return
+        filepath, _ = QFileDialog.getOpenFileName(
+            self,
+            "データベースを復元",
+            self.backup_manager.backup_dir,
+            "SQLite Database (*.db)"
+        )
+        if not filepath:
+            return
+        answer = QMessageBox.question(
+            self, "データベースを復元",
+            f"現在のデータを {os.path.basename(filepath)} の内容で置き換えます。\n"
+            "現在のデータは復元前に自動でバックアップされます。よろしいですか？")
+        if answer != QMessageBox.Yes:
+            return
+
+        def restore(progress, token):
+            with self.data_manager.update_lock():
+                return self.backup_manager.restore(filepath, progress=progress)
+
+        def on_restored(result):
+            # The restored change_log may end below (or far above) the feed's cursor
+            self.change_feed.seq = self.data_manager.db.get_change_seq()
+
+        # Restore is one write transaction into app.db; there is nothing to stop between its steps
+        self.start_export(
+            "データベースを復元", restore,
+            lambda result: "データベースを復元しました。\n表示を完全に更新するにはアプリを再起動してください。",
+            "復元", unit="ページ", on_done=on_restored, cancellable=False)
+
+    def scheduled_backup(self):
+        """Hourly check: take a snapshot in the background if the newest is older than a day"""
+        if self.updates.busy or self._exports:
+            return  # Try again next hour
+        task = ExportTask(lambda progress, token: self.backup_manager.backup_if_due(token=token), self)
+        task.finished.connect(lambda result: self._exports.remove(task))
+        task.failed.connect(lambda error: (self._exports.remove(task),
+                                           logger.error(f"Scheduled database backup failed: {error}")))
+        self._exports.append(task)
+        task.start()
+
+    def start_export(self, title, export, describe, action, unit="件", on_done=None, cancellable=True):
+        """
+        Run ``export(progress=, token=)`` in the background with a non-modal
+        progress dialog; the window stays usable and, if ``cancellable``, the
+        dialog can cancel it. When it completes, ``on_done(result)`` runs and
+        ``describe(result)`` is shown.
+        """
+        task = ExportTask(export, self)
+        dialog = QProgressDialog(f"{title}...", "中止", 0, 0, self)
+        dialog.setWindowTitle(title)
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.setAutoReset(False)
+        dialog.setMinimumDuration(500)  # Quick exports finish without a dialog flashing up
+        if cancellable:
+            dialog.canceled.connect(task.cancel)
+        else:
+            dialog.setCancelButton(None)
+
+        def close_dialog():
+            if cancellable:
+                dialog.canceled.disconnect(task.cancel)
+            dialog.close()
+
+        def on_progress(event):
+            if task.token.cancelled:
+                return
+            if event.total:
+                dialog.setMaximum(max(event.total, event.rows))
+                dialog.setValue(event.rows)
+                dialog.setLabelText(f"{title}... {event.rows:,} / {event.total:,} {unit}")
+            else:
+                dialog.setLabelText(f"{title}... {event.rows:,} {unit}")
+
+        def on_finished(result):
+            self._exports.remove(task)
+            close_dialog()
+            if result.cancelled:
+                self.status_label.setText(f"{action}を中止しました")
+                return
+            if on_done is not None:
+                on_done(result)
+            message = describe(result)
+            self.status_label.setText(message.splitlines()[0])
+            QMessageBox.information(self, "成功", message)
+
+        def on_failed(error):
+            self._exports.remove(task)
+            close_dialog()
+            logger.error(f"{title} failed: {error}", exc_info=error)
+            QMessageBox.critical(self, "エラー", f"{action}に失敗しました: {error}")
+
+        task.progress.connect(on_progress)
+        task.finished.connect(on_finished)
+        task.failed.connect(on_failed)
+        self._exports.append(task)
+        task.start()
+        return task
     
     def restore_favorites(self):
         """Restore favorites from JSON"""
@@ -266,8 +436,8 @@ class MainWindow(QMainWindow):
             try:
                 count = self.export_manager.import_favorites_json(filepath)
                 QMessageBox.information(self, "成功", f"{count}件のお気に入りを復元しました")
-                # Refresh displays
-                self.on_update_finished()
+                # Refresh displays (favorite flags are in the change_log)
+                self.change_feed.poll()
             except Exception as e:
                 QMessageBox.critical(self, "エラー", f"復元に失敗しました: {e}")
     
@@ -384,32 +554,32 @@ class MainWindow(QMainWindow):
         integrated_tabs = QTabWidget()
         layout.addWidget(integrated_tabs)
         
-        # Add integrated tabs (no group filter)
+        # Add integrated tabs (no group filter); each is built when first shown
         from ui.tabs.favorites import FavoritesTab
         from ui.tabs.sns import SNSTab
         
-        self.integrated_members_tab = QWidget()
-        self.setup_members_tab()
+        self.integrated_members_tab = LazyTab(self.setup_members_tab)
         integrated_tabs.addTab(self.integrated_members_tab, "👥 メンバー一覧")
         
-        self.channels_tab = ChannelsTab(self.data_manager)
+        self.channels_tab = LazyTab(lambda: ChannelsTab(self.data_manager))
         integrated_tabs.addTab(self.channels_tab, "📺 チャンネル")
         
-        self.videos_tab = VideosTab(self.data_manager)
+        self.videos_tab = LazyTab(lambda: VideosTab(self.data_manager))
         integrated_tabs.addTab(self.videos_tab, "🎬 最新動画")
         
-        self.collab_tab = CollabsTab(self.data_manager)
+        self.collab_tab = LazyTab(lambda: CollabsTab(self.data_manager))
         integrated_tabs.addTab(self.collab_tab, "🤝 コラボ")
         
-        self.favorites_tab = FavoritesTab(self.data_manager)
+        self.favorites_tab = LazyTab(lambda: FavoritesTab(self.data_manager))
         integrated_tabs.addTab(self.favorites_tab, "⭐ お気に入り")
         
-        self.sns_tab = SNSTab(self.data_manager)
+        self.sns_tab = LazyTab(lambda: SNSTab(self.data_manager))
         integrated_tabs.addTab(self.sns_tab, "🔗 SNS")
 
     def setup_members_tab(self):
-        """Setup the members tab (used in integrated view)"""
-        layout = QVBoxLayout(self.integrated_members_tab)
+        """Build the members tab (used in integrated view)"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
         
         # Group filter
         filter_layout = QHBoxLayout()
@@ -421,115 +591,23 @@ class MainWindow(QMainWindow):
         filter_layout.addStretch()
         layout.addLayout(filter_layout)
         
-        # Scroll Area for lists
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        layout.addWidget(scroll)
-        
-        container = QWidget()
-        self.members_layout = QVBoxLayout(container)
-        self.members_layout.setSpacing(20)
-        scroll.setWidget(container)
-        
-        # Placeholders for group boxes (will be created dynamically)
-        self.holo_container = QWidget()
-        self.holo_layout = QVBoxLayout(self.holo_container)
-        self.members_layout.addWidget(self.holo_container)
-        
-        self.niji_container = QWidget()
-        self.niji_layout = QVBoxLayout(self.niji_container)
-        self.members_layout.addWidget(self.niji_container)
-        
-        self.members_layout.addStretch()
+        # Member grid (cards are painted; refreshes only touch what changed)
+        self.members_model = MemberGridModel(self)
+        self.members_view = MemberGridView("mini")
+        self.members_view.setModel(self.members_model)
+        layout.addWidget(self.members_view)
+
+        self.load_members()
+        return widget
 
     def load_members(self):
-        # Clear existing
-        def clear_layout(layout):
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        
-        clear_layout(self.holo_layout)
-        clear_layout(self.niji_layout)
-        
+        if not hasattr(self, "members_model"):
+            return  # Members tab not built yet; it loads when first shown
         members = self.data_manager.db.get_all_members()
         filter_text = self.group_filter.currentText()
-        
-        # Separate by group
-        holo_members = [m for m in members if m.group_name == "hololive"]
-        niji_members = [m for m in members if m.group_name == "nijisanji"]
-        
-        show_holo = filter_text in ["すべて", "hololive"]
-        show_niji = filter_text in ["すべて", "nijisanji"]
-        
-        from collections import defaultdict
-        from PySide6.QtWidgets import QGroupBox, QGridLayout
-        from ui.components.async_image import AsyncImageLoader
-        
-        def create_group_section(members, parent_layout, title_prefix):
-            if not members: return
-            
-            # Group by generation
-            by_gen = defaultdict(list)
-            for m in members:
-                by_gen[m.generation].append(m)
-            
-            # Sort generations (simple sort for now)
-            sorted_gens = sorted(by_gen.keys())
-            
-            main_group = QGroupBox(title_prefix)
-            main_group.setStyleSheet("QGroupBox { border: 2px solid #3a3a5e; border-radius: 8px; font-size: 16px; color: #e94560; margin-top: 20px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
-            main_layout = QVBoxLayout(main_group)
-            
-            for gen in sorted_gens:
-                gen_box = QGroupBox(gen)
-                gen_box.setStyleSheet("QGroupBox { border: 1px solid #555; border-radius: 4px; font-size: 13px; color: #aaa; margin-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
-                gen_layout = QGridLayout(gen_box)
-                gen_layout.setSpacing(10)
-                
-                row, col = 0, 0
-                cols = 4
-                
-                for m in by_gen[gen]:
-                    # Member Card (Mini)
-                    card = QFrame()
-                    card.setFixedSize(180, 60)
-                    card.setStyleSheet("background-color: #1a1a2e; border-radius: 6px;")
-                    card_layout = QHBoxLayout(card)
-                    card_layout.setContentsMargins(5,5,5,5)
-                    
-                    # Icon
-                    img = AsyncImageLoader(m.icon_url, 40, 40)
-                    img.setStyleSheet("border-radius: 20px;")
-                    card_layout.addWidget(img)
-                    
-                    # Name
-                    name_lbl = QLabel(m.name)
-                    name_lbl.setStyleSheet("color: white; font-weight: bold;")
-                    card_layout.addWidget(name_lbl)
-                    
-                    gen_layout.addWidget(card, row, col)
-                    col += 1
-                    if col >= cols:
-                        col = 0
-                        row += 1
-                
-                main_layout.addWidget(gen_box)
-            
-            parent_layout.addWidget(main_group)
-
-        if show_holo:
-            create_group_section(holo_members, self.holo_layout, "🔷 ホロライブ")
-            self.holo_container.setVisible(True)
-        else:
-            self.holo_container.setVisible(False)
-            
-        if show_niji:
-            create_group_section(niji_members, self.niji_layout, "🔶 にじさんじ")
-            self.niji_container.setVisible(True)
-        else:
-            self.niji_container.setVisible(False)
+        if filter_text in ["hololive", "nijisanji"]:
+            members = [m for m in members if m.group_name == filter_text]
+        self.members_model.set_members(members)
 
     @Slot(str)
     def on_api_key_changed(self, text):
@@ -538,7 +616,8 @@ class MainWindow(QMainWindow):
             self.api_status_label.setText("(設定済み ✓)")
             self.api_status_label.setStyleSheet("color: #4ade80;")
             self.data_manager.api_key = self.api_key
-            self.refresh_data()
+            # Fires per keystroke; only start once typing pauses
+            self.start_update(UpdateJob(), debounce_ms=self.API_KEY_DEBOUNCE_MS)
         else:
             self.api_status_label.setText("(未設定)")
             self.api_status_label.setStyleSheet("color: #888;")
@@ -551,43 +630,107 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def refresh_data(self):
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            return
-            
+        self.start_update(UpdateJob())
+
+    def start_update(self, job: UpdateJob, debounce_ms: int = None):
+        # Merged into the running/queued job when it already covers ``job``
+        self.updates.request(job, debounce_ms)
+
+    @Slot()
+    def on_refresh_clicked(self):
+        if self.updates.busy:
+            self.cancel_update()
+        else:
+            ImageStore.instance().retry_failed()
+            self.refresh_data()
+
+    @Slot()
+    def cancel_update(self):
+        if self.updates.busy:
+            self.updates.cancel()
+            self.status_label.setText("更新を中止しています...")
+            self.refresh_btn.setEnabled(False)
+
+    @Slot(object)
+    def on_update_started(self, job):
         self.status_label.setText("データ更新中...")
-        self.worker = Worker(self.data_manager)
-        self.worker.finished.connect(self.on_update_finished)
-        self.worker.start()
+        self.update_progress.setRange(0, 0)  # Indeterminate until the first channel reports
+        self.update_progress.setVisible(True)
+        self.refresh_btn.setText("⏹ 更新を中止")
+        self.refresh_btn.setEnabled(True)
+        self.cancel_update_action.setEnabled(True)
+
+    @Slot(object)
+    def on_update_progress(self, event):
+        """Per-channel progress: update the bar and let new videos flow into the lists."""
+        self.update_progress.setRange(0, event.total)
+        self.update_progress.setValue(event.done)
+        status = f"動画を更新中... {event.done}/{event.total} (新着 {event.new_total}件"
+        if event.errors:
+            status += f", エラー {event.errors}件"
+        self.status_label.setText(status + ")")
+        if event.new_videos and not self.progress_poll.isActive():
+            self.progress_poll.start()
 
-    @Slot(bool)
-    def on_update_finished(self, success: bool):
-        if success:
+    @Slot(object, object)
+    def on_update_finished(self, job, result):
+        """``result`` is the job's UpdateResult, or None if the update failed."""
+        if self.updates.running is not None:
+            return  # A queued job was dropped; the running one reports on its own
+        self.update_progress.setVisible(False)
+        self.progress_poll.stop()
+        self.refresh_btn.setText("🔄 全データ更新")
+        self.refresh_btn.setEnabled(True)
+        self.cancel_update_action.setEnabled(False)
+        success = result is not None and not result.lost_videos
+        if result is not None and result.cancelled:
+            self.status_label.setText(f"データ更新を中止しました ({result.done}/{result.total} チャンネル)")
+        elif success:
             self.status_label.setText("データ更新完了")
         else:
             self.status_label.setText("データ更新完了 (一部エラーあり。詳細はログを確認)")
+
+        # Show notification (not for an update the user stopped)
+        if not (result is not None and result.cancelled):
+            self.notification_manager.notify_data_update(success=success)
         
-        # Show notification
-        self.notification_manager.notify_data_update(success=success)
-        
-        # Refresh members tab in integrated view
-        self.load_members()
-        
-        # Refresh group containers
-        if hasattr(self, 'hololive_container'):
-            self.hololive_container.refresh_all_tabs()
-        if hasattr(self, 'nijisanji_container'):
-            self.nijisanji_container.refresh_all_tabs()
-        
-        # Refresh integrated view tabs
-        if hasattr(self, 'channels_tab'):
+        # Refresh only what the update changed (on_data_changed / notify_new_videos)
+        self.change_feed.poll()
+
+    @Slot(list)
+    def on_data_changed(self, changes):
+        """Refresh the views affected by ``changes`` (from ChangeFeed)."""
+        entities = {c.entity for c in changes}
+        if "member" in entities:
+            self.load_members()
             self.channels_tab.refresh_list()
-        if hasattr(self, 'videos_tab'):
+            self.sns_tab.refresh_list()
+        if "video" in entities:
             self.videos_tab.refresh_list()
-        if hasattr(self, 'collab_tab'):
             self.collab_tab.refresh_list()
-        if hasattr(self, 'favorites_tab'):
-            self.favorites_tab.refresh_list()
-        if hasattr(self, 'sns_tab'):
-            self.sns_tab.refresh_list()
+        # Favorites depend on both videos and members' favorite flags
+        self.favorites_tab.refresh_list()
+
+        # Group containers refresh their current tab and reload the rest lazily
+        self.hololive_container.refresh_all_tabs()
+        self.nijisanji_container.refresh_all_tabs()
+
+    @Slot(list)
+    def notify_new_videos(self, videos):
+        """Notify about new videos of favorite members, or failing that new collabs."""
+        members = {m.channel_id: m for m in self.data_manager.db.get_all_members()}
+        favorites = [v for v in videos if v.channel_id in members and members[v.channel_id].is_favorite]
+        collabs = [v for v in videos if v.is_collab]
+
+        # The tray shows one message at a time, so summarise bursts
+        if favorites:
+            video = favorites[0]
+            title = video.title if len(favorites) == 1 else f"{video.title} (他{len(favorites) - 1}件)"
+            self.notification_manager.notify_new_video(members[video.channel_id].name, title)
+        elif collabs:
+            video = collabs[0]
+            member = members.get(video.channel_id)
+            title = video.title if len(collabs) == 1 else f"{video.title} (他{len(collabs) - 1}件)"
+            self.notification_manager.notify_collab(member.name if member else video.channel_id, title)
 
 
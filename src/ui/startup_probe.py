@@ -0,0 +1,155 @@
+"""
+Startup timing: time-to-first-paint and time-to-interactive of the main window.
+
+Run as a benchmark from the directory the app runs in (the one holding
+data/app.db):
+
+    PYTHONPATH=src python -m ui.startup_probe [--runs N] [--top N]
+
+It reports an ``-X importtime`` breakdown of ``import ui.main_window`` and the
+median first paint / interactive times of fresh processes on the current DB.
+"""
+
+import logging
+import time
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProbe(QObject):
+    """
+    Logs when ``window`` first paints and when the GUI becomes interactive.
+
+    Times are measured from ``t0`` (a time.perf_counter() taken at process
+    start). "Interactive" is the start of the first quiet window after the first
+    paint: QUIET_TICKS consecutive ticks of a TICK_MS timer that each arrive
+    within SLACK_MS of schedule, i.e. the event loop had no long task blocking
+    input. The probe emits measured(first_paint, interactive) in seconds and
+    removes itself once both times are logged.
+    """
+    measured = Signal(float, float)
+
+    TICK_MS = 10
+    SLACK_MS = 5
+    QUIET_TICKS = 5
+
+    def __init__(self, window, t0):
+        super().__init__(window)
+        self.window = window
+        self.t0 = t0
+        self.first_paint = None
+        self.interactive = None
+        self._quiet_since = None
+        self._quiet_ticks = 0
+        self._last_tick = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.TICK_MS)
+        self._timer.timeout.connect(self._tick)
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Paint and self.first_paint is None:
+            self.first_paint = time.perf_counter() - self.t0
+            self.window.removeEventFilter(self)
+            self._last_tick = time.perf_counter()
+            self._timer.start()
+        return False
+
+    def _tick(self):
+        now = time.perf_counter()
+        late = (now - self._last_tick) * 1000 - self.TICK_MS
+        self._last_tick = now
+        if late > self.SLACK_MS:
+            self._quiet_since, self._quiet_ticks = None, 0
+            return
+        if self._quiet_since is None:
+            self._quiet_since = now - self.TICK_MS / 1000
+        self._quiet_ticks += 1
+        if self._quiet_ticks >= self.QUIET_TICKS:
+            self._timer.stop()
+            self.interactive = self._quiet_since - self.t0
+            logger.info(f"Startup: first paint {self.first_paint * 1000:.0f} ms, "
+                        f"interactive {self.interactive * 1000:.0f} ms")
+            self.measured.emit(self.first_paint, self.interactive)
+            self.deleteLater()
+
+
+# One measured startup in a fresh process (modules must not be cached)
+_STARTUP_RUN = """
+import time
+T0 = time.perf_counter()
+import sys
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from ui.main_window import MainWindow
+from ui.startup_probe import StartupProbe
+window = MainWindow()
+probe = StartupProbe(window, T0)
+probe.measured.connect(lambda paint, interactive: print(f"STARTUP {paint} {interactive}", flush=True))
+probe.measured.connect(app.quit)
+window.show()
+app.exec()
+"""
+
+
+def import_report(top=15):
+    """Parse ``-X importtime`` for ``import ui.main_window``: (total_us, [(cumulative_us, self_us, module)])."""
+    import os
+    import subprocess
+    import sys
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=src + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import ui.main_window"],
+                            capture_output=True, text=True, env=env)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    total = sum(self_us for _, self_us, _ in rows)
+    return total, sorted(rows, reverse=True)[:top]
+
+
+def measure_startup(runs=5):
+    """First paint / interactive times (seconds) of ``runs`` fresh app processes."""
+    import os
+    import subprocess
+    import sys
+    src = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=src + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", _STARTUP_RUN], capture_output=True, text=True,
+                                env=env, timeout=60)
+        for line in result.stdout.splitlines():
+            if line.startswith("STARTUP "):
+                paint, interactive = line.split()[1:]
+                samples.append((float(paint), float(interactive)))
+    return samples
+
+
+if __name__ == "__main__":
+    import argparse
+    import statistics
+
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the desktop app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    total, rows = import_report(args.top)
+    print(f"import ui.main_window: {total / 1000:.0f} ms")
+    print(f"{'cumulative':>12} {'self':>8}  module")
+    for cumulative_us, self_us, name in rows:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>6.1f}ms  {name}")
+
+    samples = measure_startup(args.runs)
+    if samples:
+        paint = statistics.median(p for p, _ in samples)
+        interactive = statistics.median(i for _, i in samples)
+        print(f"startup over {len(samples)} runs (median): first paint {paint * 1000:.0f} ms, "
+              f"interactive {interactive * 1000:.0f} ms")
+    else:
+        print("startup: no measurement (the app did not report; is a display available?)")
@@ -1,20 +1,63 @@
+import logging
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                                QGroupBox, QGridLayout, QFrame, QScrollArea)
-from PySide6.QtCore import Qt
+                                QGroupBox, QGridLayout, QFrame, QScrollArea, QPushButton)
+from PySide6.QtCore import Qt, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QFont
 from core.manager import DataManager
-from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+class StatsTask(QRunnable):
+    """Computes DatabaseManager.get_stats off the GUI thread."""
+
+    def __init__(self, tab, group_filter, version):
+        super().__init__()
+        self.tab = tab
+        self.db = tab.data_manager.db
+        self.group_filter = group_filter
+        self.version = version
+
+    def run(self):
+        try:
+            stats = self.db.get_stats(self.group_filter)
+        except Exception as e:
+            logger.error(f"Computing stats ({self.group_filter or 'all groups'}) failed: {e}", exc_info=True)
+            signal, args = self.tab.stats_failed, (self.version, str(e))
+        else:
+            signal, args = self.tab.stats_ready, (self.group_filter, self.version, stats)
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # Tab was deleted while computing
 
 
 class StatsTab(QWidget):
     """
     Statistics dashboard tab showing various metrics about VTubers.
+
+    Stats are computed by a StatsTask in the thread pool and cached per group,
+    keyed by the data version (the latest change_log sequence number), so they
+    are only recomputed when members or videos actually changed. A cached
+    snapshot is rendered immediately; "computing" is only shown on a cold cache.
     """
-    
+
+    # group_filter -> (version, stats), shared by all StatsTab instances
+    _cache = {}
+
+    # (group_filter, version, stats) from StatsTask, delivered on the GUI thread
+    stats_ready = Signal(object, int, object)
+    # (version, error message) when StatsTask failed
+    stats_failed = Signal(int, str)
+
     def __init__(self, data_manager: DataManager, group_filter: str = None):
         super().__init__()
         self.data_manager = data_manager
         self.group_filter = group_filter
+        self._rendered = None   # version currently on screen
+        self._computing = None  # version being computed
+        self.stats_ready.connect(self.on_stats_ready)
+        self.stats_failed.connect(self.on_stats_failed)
         self.init_ui()
     
     def init_ui(self):
@@ -36,34 +79,84 @@ class StatsTab(QWidget):
         self.stats_layout = QVBoxLayout(container)
         self.stats_layout.setSpacing(15)
         scroll.setWidget(container)
-        
+
         self.refresh_stats()
     
     def refresh_stats(self):
-        """Refresh all statistics"""
-        # Clear existing widgets
+        """Show the cached stats and recompute them in the background if the data changed"""
+        version = self.data_manager.db.get_change_seq()
+        cached = self._cache.get(self.group_filter)
+        if cached is not None and cached[0] != self._rendered:
+            self.render_stats(*cached)
+        if cached is not None and cached[0] == version:
+            return
+        if cached is None and self._rendered is None:
+            self.show_computing()
+        if self._computing != version:
+            self._computing = version
+            QThreadPool.globalInstance().start(StatsTask(self, self.group_filter, version))
+
+    def on_stats_ready(self, group_filter, version, stats):
+        if version == self._computing:
+            self._computing = None
+        cached = self._cache.get(group_filter)
+        if cached is None or cached[0] <= version:
+            self._cache[group_filter] = (version, stats)
+        if self._rendered is None or self._rendered < version:
+            self.render_stats(version, stats)
+
+    def on_stats_failed(self, version, error):
+        if version == self._computing:
+            self._computing = None  # Let the next refresh_stats try again
+        if self._rendered is None:
+            self.show_error(error)
+        # Otherwise the last good snapshot stays on screen
+
+    def clear_stats(self):
         while self.stats_layout.count():
             item = self.stats_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-        
-        # Get members based on group filter
-        if self.group_filter:
-            members = self.data_manager.db.get_members_by_group(self.group_filter)
-            title_suffix = f" ({self.group_filter})"
-        else:
-            members = self.data_manager.db.get_all_members()
-            title_suffix = " (全グループ)"
-        
+
+    def show_computing(self):
+        self.clear_stats()
+        label = QLabel("⏳ 統計を計算中…")
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("color: #888; font-size: 14px; padding: 40px;")
+        self.stats_layout.addWidget(label)
+        self.stats_layout.addStretch()
+
+    def show_error(self, error):
+        self.clear_stats()
+        label = QLabel(f"⚠ 統計を計算できませんでした\n{error}")
+        label.setAlignment(Qt.AlignCenter)
+        label.setWordWrap(True)
+        label.setStyleSheet("color: #fb7185; font-size: 14px; padding: 40px 40px 10px;")
+        self.stats_layout.addWidget(label)
+        retry = QPushButton("🔄 再試行")
+        retry.clicked.connect(self.retry_stats)
+        self.stats_layout.addWidget(retry, alignment=Qt.AlignCenter)
+        self.stats_layout.addStretch()
+
+    def retry_stats(self):
+        self.show_computing()
+        self.refresh_stats()
+
+    def render_stats(self, version, stats):
+        """Rebuild the cards from a stats snapshot (see DatabaseManager.get_stats)"""
+        self.clear_stats()
+        title_suffix = f" ({self.group_filter})" if self.group_filter else " (全グループ)"
+
         # Create stats cards
-        self.create_overview_card(members, title_suffix)
-        self.create_generation_breakdown(members)
-        self.create_video_stats(members)
-        self.create_active_members_ranking(members)
-        
+        self.create_overview_card(stats, title_suffix)
+        self.create_generation_breakdown(stats)
+        self.create_video_stats(stats)
+        self.create_active_members_ranking(stats)
+
         self.stats_layout.addStretch()
+        self._rendered = version
     
-    def create_overview_card(self, members, title_suffix):
+    def create_overview_card(self, stats, title_suffix):
         """Create overview statistics card"""
         group_box = QGroupBox(f"📈 全体統計{title_suffix}")
         group_box.setStyleSheet("""
@@ -86,23 +179,12 @@ class StatsTab(QWidget):
         layout = QGridLayout(group_box)
         layout.setSpacing(10)
         
-        # Count members by group
-        holo_count = len([m for m in members if m.group_name == "hololive"])
-        niji_count = len([m for m in members if m.group_name == "nijisanji"])
-        total_count = len(members)
-        
-        # Favorite count
-        fav_count = len([m for m in members if m.is_favorite])
-        
-        # Video count
-        if self.group_filter:
-            videos = self.data_manager.db.get_videos_by_group(self.group_filter, limit=999999)
-        else:
-            videos = self.data_manager.db.get_videos(limit=999999)
-        video_count = len(videos)
-        
-        # Collab count
-        collab_count = len([v for v in videos if v.is_collab])
+        holo_count = stats["by_group"].get("hololive", 0)
+        niji_count = stats["by_group"].get("nijisanji", 0)
+        total_count = stats["members"]
+        fav_count = stats["favorites"]
+        video_count = stats["videos"]
+        collab_count = stats["collabs"]
         
         # Create stat cards
         row = 0
@@ -159,7 +241,7 @@ class StatsTab(QWidget):
         
         return frame
     
-    def create_generation_breakdown(self, members):
+    def create_generation_breakdown(self, stats):
         """Create generation breakdown statistics"""
         group_box = QGroupBox("🎭 世代別メンバー数")
         group_box.setStyleSheet("""
@@ -181,14 +263,8 @@ class StatsTab(QWidget):
         
         layout = QVBoxLayout(group_box)
         
-        # Count by generation
-        gen_counts = defaultdict(int)
-        for m in members:
-            gen_key = f"[{m.group_name}] {m.generation}"
-            gen_counts[gen_key] += 1
-        
-        # Sort by count
-        sorted_gens = sorted(gen_counts.items(), key=lambda x: x[1], reverse=True)
+        # Member counts per generation, largest first
+        sorted_gens = stats["generations"]
         
         # Display top 10
         grid = QGridLayout()
@@ -218,7 +294,7 @@ class StatsTab(QWidget):
         layout.addLayout(grid)
         self.stats_layout.addWidget(group_box)
     
-    def create_video_stats(self, members):
+    def create_video_stats(self, stats):
         """Create video-related statistics"""
         group_box = QGroupBox("📹 動画統計 (全投稿数ランキング)")
         group_box.setStyleSheet("""
@@ -241,15 +317,8 @@ class StatsTab(QWidget):
         layout = QVBoxLayout(group_box)
         layout.setSpacing(10)
         
-        # Get video data per member
-        member_video_counts = []
-        for m in members:
-            # We use a reasonably large limit to get a good estimate of activity
-            videos = self.data_manager.db.get_videos_by_channel(m.channel_id, limit=2000)
-            member_video_counts.append((m.name, len(videos), m.group_name))
-        
-        # Sort by video count
-        member_video_counts.sort(key=lambda x: x[1], reverse=True)
+        # Video count per member, most first
+        member_video_counts = stats["member_videos"]
         
         # Calculate average
         if member_video_counts:
@@ -297,7 +366,7 @@ class StatsTab(QWidget):
         
         self.stats_layout.addWidget(group_box)
     
-    def create_active_members_ranking(self, members):
+    def create_active_members_ranking(self, stats):
         """Create ranking of most active members based on recent videos"""
         group_box = QGroupBox("🏆 活動ランキング (最近の動画数)")
         group_box.setStyleSheet("""
@@ -319,14 +388,8 @@ class StatsTab(QWidget):
         
         layout = QVBoxLayout(group_box)
         
-        # Get recent video counts (last 50 per member)
-        member_activity = []
-        for m in members:
-            videos = self.data_manager.db.get_videos_by_channel(m.channel_id, limit=20)
-            member_activity.append((m.name, len(videos), m.group_name))
-        
-        # Sort by activity
-        member_activity.sort(key=lambda x: x[1], reverse=True)
+        # Recent video counts (capped at the last 20 per member)
+        member_activity = [(name, min(count, 20), group) for name, count, group in stats["member_videos"]]
         
         # Display top 10
         grid = QGridLayout()
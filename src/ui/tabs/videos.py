@@ -1,11 +1,13 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QListWidget, QListWidgetItem,
-                               QLabel, QHBoxLayout, QPushButton, QFrame, QAbstractItemView)
-from PySide6.QtCore import Qt, QUrl, QSize
-from PySide6.QtGui import QDesktopServices, QFont
-from ui.components.async_image import AsyncImageLoader
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton)
+from PySide6.QtCore import Qt
+from ui.components.video_list import VideoListModel, VideoListView
 from core.manager import DataManager
+from core.jobs import UpdateJob
 
 class VideosTab(QWidget):
+    # Text shown when the query returns nothing
+    empty_text = ""
+
     def __init__(self, data_manager: DataManager, group_filter: str = None):
         super().__init__()
         self.data_manager = data_manager
@@ -45,112 +47,103 @@ class VideosTab(QWidget):
         self.progress.setStyleSheet("QProgressBar { height: 4px; }")
         layout.addWidget(self.progress)
 
-        # Video List
-        self.list_widget = QListWidget()
-        self.list_widget.setIconSize(QSize(160, 90))
-        self.list_widget.setSpacing(5)
-        self.list_widget.setSelectionMode(QAbstractItemView.NoSelection) # Disable blue selection
-        layout.addWidget(self.list_widget)
+        # Throttled refresh while a fetch is running, so new videos appear as channels land
+        from PySide6.QtCore import QTimer
+        self.progress_refresh = QTimer(self)
+        self.progress_refresh.setSingleShot(True)
+        self.progress_refresh.setInterval(700)  # VideoWriter commits within 0.5 s
+        self.progress_refresh.timeout.connect(self.refresh_list)
+
+        # Video List (model/view: rows are painted, paged in from load_videos as the user scrolls)
+        self.model = VideoListModel(self)
+        self.list_view = VideoListView()
+        self.list_view.setModel(self.model)
+        layout.addWidget(self.list_view)
+
+        self.model.set_loader(self.load_videos)
+        self.list_view.set_empty_text(self.empty_text)
+
+        # Fetches are shared with the main window and the other tabs
+        from ui.update_coordinator import UpdateCoordinator
+        self.updates = UpdateCoordinator.for_manager(self.data_manager)
+        self.requested = None  # Job serving this tab's last fetch request
+        self.fetching = False  # A job overlapping this tab is running
+        self.updates.started.connect(self.on_update_started)
+        self.updates.progress.connect(self.on_fetch_progress)
+        self.updates.finished.connect(self.on_fetch_finished)
+        if self.updates.running is not None:
+            self.on_update_started(self.updates.running)
 
-        self.refresh_list()
+    def update_job(self):
+        """The update the web fetch button runs; FavoritesTab narrows it to favorites."""
+        return UpdateJob("group", group=self.group_filter)
+
+    def _overlaps(self, job):
+        # This tab's fetch button reflects jobs that fetch its channels (or that it would fetch)
+        mine = self.update_job()
+        return job.covers(mine) or mine.covers(job)
 
     def start_web_fetch(self):
-        self.fetch_btn.setEnabled(False)
-        self.fetch_btn.setText("取得中...")
-        self.progress.setVisible(True)
-        
-        from PySide6.QtCore import QThread, Signal
-        import asyncio
-        
-        class UpdateWorker(QThread):
-            finished = Signal()
-            
-            def __init__(self, manager, group_filter):
-                super().__init__()
-                self.manager = manager
-                self.group_filter = group_filter
-                
-            def run(self):
-                # Run async update in new loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.manager.update_recent_videos(self.group_filter))
-                loop.close()
-                self.finished.emit()
-        
-        self.worker = UpdateWorker(self.data_manager, self.group_filter)
-        self.worker.finished.connect(self.on_fetch_finished)
-        self.worker.start()
-        
-    def on_fetch_finished(self):
+        # While a job for these channels runs, the button stops it instead
+        running = self.updates.running
+        if running is not None and self._overlaps(running):
+            self.updates.cancel()
+            self.fetch_btn.setEnabled(False)
+            self.fetch_btn.setText("中止しています...")
+            return
+
+        # Merged into the running/queued job if that already covers this tab
+        self.requested = self.updates.request(self.update_job())
+        if self.requested is not self.updates.running:
+            self.fetch_btn.setEnabled(False)
+            self.fetch_btn.setText("⏳ 待機中...")
+
+    def on_update_started(self, job):
+        self.fetching = self._overlaps(job)
+        if not self.fetching:
+            return
         self.fetch_btn.setEnabled(True)
-        self.fetch_btn.setText("☁️ Webから最新取得")
-        self.progress.setVisible(False)
-        self.refresh_list()
-        from PySide6.QtWidgets import QMessageBox
-        QMessageBox.information(self, "完了", "最新データの取得が完了しました。")
+        self.fetch_btn.setText("⏹ 中止")
+        self.progress.setRange(0, 0)
+        self.progress.setVisible(True)
 
-    def refresh_list(self):
-        self.list_widget.clear()
-        
-        # Get videos based on group filter
-        if self.group_filter:
-            videos = self.data_manager.db.get_videos_by_group(self.group_filter, limit=50)
+    def on_fetch_progress(self, event):
+        if not self.fetching:
+            return
+        self.progress.setRange(0, event.total)
+        self.progress.setValue(event.done)
+        if self.fetch_btn.isEnabled():
+            self.fetch_btn.setText(f"⏹ 中止 ({event.done}/{event.total})")
+        if event.new_videos and not self.progress_refresh.isActive():
+            self.progress_refresh.start()
+        
+    def on_fetch_finished(self, job, result):
+        requested = self.requested is not None and job.covers(self.requested)
+        if requested:
+            self.requested = None
+        if self.fetching and self.updates.running is None:
+            # The job working on this tab's channels is done
+            self.fetching = False
+            self.progress_refresh.stop()
+            self.progress.setVisible(False)
+            self.refresh_list()
+        if self.fetching:
+            return
+        if self.requested is not None:
+            self.fetch_btn.setEnabled(False)
+            self.fetch_btn.setText("⏳ 待機中...")  # Still queued behind other work
         else:
-            videos = self.data_manager.db.get_videos(limit=50)
-        
-        for video in videos:
-            item = QListWidgetItem(self.list_widget)
-            item.setSizeHint(QSize(0, 110)) # Height for custom widget
-            
-            # Custom Widget
-            widget = self.create_video_widget(video)
-            self.list_widget.setItemWidget(item, widget)
-
-
-    def create_video_widget(self, video):
-        frame = QFrame()
-        layout = QHBoxLayout(frame)
-        layout.setContentsMargins(5, 5, 5, 5)
-        
-        # Thumbnail
-        thumb = AsyncImageLoader(video.thumbnail_url, 160, 90)
-        layout.addWidget(thumb)
-        
-        # Info
-        info_layout = QVBoxLayout()
-        
-        title = QLabel(video.title)
-        title.setFont(QFont("Arial", 11, QFont.Bold))
-        title.setWordWrap(True)
-        info_layout.addWidget(title)
-        
-        details = QLabel(f"{video.published_at.strftime('%Y-%m-%d %H:%M')}")
-        details.setStyleSheet("color: gray;")
-        info_layout.addWidget(details)
-        
-        layout.addLayout(info_layout)
-        layout.setStretch(1, 1) # Expand info part
-        
-        # Buttons
-        video_url = video.url
-        watch_btn = QPushButton("▶ YouTubeで視聴")
-        watch_btn.setCursor(Qt.PointingHandCursor)
-        watch_btn.setStyleSheet("""
-            QPushButton {
-                 background-color: #e94560; 
-                 color: white; 
-                 border-radius: 6px;
-                 padding: 8px 12px;
-                 font-weight: bold;
-            }
-            QPushButton:hover { background-color: #ff6b8a; }
-        """)
-        watch_btn.clicked.connect(lambda checked, url=video_url: QDesktopServices.openUrl(QUrl(url)))
-        
-        btn_layout = QVBoxLayout()
-        btn_layout.addWidget(watch_btn)
-        btn_layout.addStretch()
-        layout.addLayout(btn_layout)
-        
-        return frame
+            self.fetch_btn.setEnabled(True)
+            self.fetch_btn.setText("☁️ Webから最新取得")
+        if requested and self.updates.running is None and not (result is not None and result.cancelled):
+            from PySide6.QtWidgets import QMessageBox
+            QMessageBox.information(self, "完了", "最新データの取得が完了しました。")
+
+    def load_videos(self, limit=50, offset=0):
+        """Query the videos this tab shows; overridden by CollabsTab/FavoritesTab."""
+        if self.group_filter:
+            return self.data_manager.db.get_videos_by_group(self.group_filter, limit=limit, offset=offset)
+        return self.data_manager.db.get_videos(limit=limit, offset=offset)
+
+    def refresh_list(self):
+        self.model.refresh()
@@ -0,0 +1,147 @@
+"""
+Single-flight scheduling of update jobs for the GUI.
+"""
+
+import logging
+from datetime import datetime
+from PySide6.QtCore import QObject, QTimer, Signal
+from core.jobs import UpdateJob
+from core.lock import LockHeldError
+from models.progress import UpdateResult
+from ui.async_bridge import AsyncBridge
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateCoordinator(QObject):
+    """
+    The one place GUI updates are started from (menu, refresh button, the
+    hourly timer, API key changes, the tabs' fetch buttons).
+
+    - At most one job runs at a time, so there is a single DB writer.
+    - A request covered by the running job (see UpdateJob.covers) is merged
+      into it; one covered by a queued job is merged into that.
+    - Requests are debounced: a burst of triggers starts one job.
+    - A job queued behind a running one skips the channels that run fetched.
+
+    Jobs run on the shared AsyncService loop (through an AsyncBridge), which
+    also hosts the DataManager's HTTP session and its periodic housekeeping.
+
+    Shared per DataManager (for_manager), so every tab sees the same state.
+    """
+
+    DEBOUNCE_MS = 300
+    HOUSEKEEPING_INTERVAL = 600  # seconds
+
+    # UpdateJob that just started
+    started = Signal(object)
+    # ChannelProgress of the running job
+    progress = Signal(object)
+    # UpdateJob, UpdateResult (None if the update failed); also sent with a
+    # cancelled result for queued jobs dropped by cancel()
+    finished = Signal(object, object)
+
+    _instances = {}
+
+    @classmethod
+    def for_manager(cls, manager) -> "UpdateCoordinator":
+        coordinator = cls._instances.get(id(manager))
+        if coordinator is None:
+            coordinator = cls._instances[id(manager)] = cls(manager)
+        return coordinator
+
+    def __init__(self, manager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.bridge = AsyncBridge(self)
+        self.future = None  # concurrent.futures.Future of the running job
+        self._housekeeping = None  # Future of the periodic DataManager.housekeeping
+        self.running = None  # UpdateJob
+        self.pending = []  # UpdateJob, oldest first
+        self._started_at = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._start_next)
+
+    @property
+    def busy(self) -> bool:
+        return self.running is not None or bool(self.pending)
+
+    def request(self, job: UpdateJob, debounce_ms: int = None) -> UpdateJob:
+        """
+        Ask for ``job`` to run; returns the job that will do the work (the
+        running or a queued job it was merged into, or ``job`` itself).
+        """
+        if self.running is not None and not self.running.token.cancelled and self.running.covers(job):
+            logger.info(f"Update request {job.describe()} merged into running {self.running.describe()}")
+            return self.running
+        for queued in self.pending:
+            if queued.covers(job):
+                logger.info(f"Update request {job.describe()} merged into queued {queued.describe()}")
+                self._debounce(debounce_ms)
+                return queued
+
+        # The new job supersedes queued jobs it covers
+        self.pending = [queued for queued in self.pending if not job.covers(queued)]
+        if self.running is not None:
+            job.skip_fetched_since = self._started_at
+        self.pending.append(job)
+        self._debounce(debounce_ms)
+        return job
+
+    def _debounce(self, debounce_ms: int = None):
+        # (Re)start the countdown to the next job; while one runs, _on_job_done starts the next
+        if self.running is None:
+            self.timer.start(self.DEBOUNCE_MS if debounce_ms is None else debounce_ms)
+
+    def cancel(self):
+        """Stop the running job and drop the queued ones."""
+        self.timer.stop()
+        dropped, self.pending = self.pending, []
+        for job in dropped:
+            job.token.cancel()
+            self.finished.emit(job, UpdateResult(cancelled=True))
+        if self.running is not None:
+            self.running.token.cancel()
+
+    def shutdown(self, timeout: float = 10.0):
+        """Cancel everything, wait for the running job and release the shared HTTP session."""
+        self.cancel()
+        if self.future is not None:
+            try:
+                self.future.exception(timeout)
+            except Exception:
+                pass  # Cancelled or still unwinding; the app is going away anyway
+        if self._housekeeping is not None:
+            self._housekeeping.cancel()
+            self.bridge.service.run(self.manager.close_http_session(), timeout)
+
+    def _start_next(self):
+        if self.running is not None or not self.pending:
+            return
+        if self._housekeeping is None:
+            self._housekeeping = self.bridge.service.every(self.HOUSEKEEPING_INTERVAL, self.manager.housekeeping)
+        job = self.pending.pop(0)
+        self.running = job
+        self._started_at = datetime.now()
+        self.future = self.bridge.submit(self._run(job), on_done=self._on_job_done, on_error=self._on_job_failed)
+        self.started.emit(job)
+
+    async def _run(self, job):
+        # Runs on the service loop; progress is emitted from there and queued to the GUI thread
+        logger.info(f"Update started: {job.describe()}")
+        with self.manager.update_lock():
+            return await self.manager.run_job(job, progress=self.progress.emit)
+
+    def _on_job_failed(self, error):
+        if isinstance(error, LockHeldError):
+            logger.warning(f"Skipping update: {error}")
+        else:
+            logger.error(f"Error in data update: {error}", exc_info=error)
+        self._on_job_done(None)
+
+    def _on_job_done(self, result):
+        job, self.running, self.future = self.running, None, None
+        self.finished.emit(job, result)
+        # Queued work runs right away; it was debounced when requested
+        self._start_next()
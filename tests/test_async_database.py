@@ -0,0 +1,48 @@
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from core.async_database import AsyncDatabaseManager  # noqa: E402
+from models.member import Member  # noqa: E402
+
+
+def _member(channel_id, name="name"):
+    return Member(id=0, name=name, group_name="hololive", generation="0期生", channel_id=channel_id,
+                  youtube_url=f"https://www.youtube.com/channel/{channel_id}")
+
+
+class AsyncDatabaseRollbackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "app.db")
+        self.db = AsyncDatabaseManager(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_failed_upsert_releases_write_lock(self):
+        # NOT NULL fails inside the implicit BEGIN, before upsert_member's commit()
+        with self.assertRaises(sqlite3.IntegrityError):
+            asyncio.run(self.db.upsert_member(_member("UC_bad", name=None)))
+
+        other = sqlite3.connect(self.db_path, timeout=0.5)
+        try:
+            other.execute("INSERT INTO settings (key, value) VALUES ('probe', '1')")
+            other.commit()
+            self.assertEqual(other.execute("SELECT COUNT(*) FROM members").fetchone()[0], 0)
+        finally:
+            other.close()
+
+        # The shared connection keeps working afterwards
+        asyncio.run(self.db.upsert_member(_member("UC_ok")))
+        self.assertIsNotNone(asyncio.run(self.db.get_member("UC_ok")))
+
+
+if __name__ == "__main__":
+    unittest.main()
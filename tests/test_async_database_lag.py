@@ -0,0 +1,63 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from core.async_database import AsyncDatabaseManager  # noqa: E402
+from models.video import Video  # noqa: E402
+
+ROWS, BATCH = 50_000, 5_000
+# Each batch takes tens of milliseconds to commit; on the DB thread the loop must not notice
+MAX_LAG = 0.05
+TICK = 0.005
+
+
+def _batches():
+    base = datetime(2024, 1, 1)
+    videos = [Video(f"vid{i}", f"title {i}", f"https://youtu.be/vid{i}", "UCbench",
+                    base + timedelta(minutes=i), "https://i.ytimg.com/x.jpg", "desc") for i in range(ROWS)]
+    return [videos[i:i + BATCH] for i in range(0, ROWS, BATCH)]
+
+
+async def _ticker(lags, stop):
+    # How late a TICK sleep wakes up is how long something else held the loop
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+class AsyncDatabaseLoopLagTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = AsyncDatabaseManager(os.path.join(self.tmp.name, "app.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_bulk_write_does_not_stall_event_loop(self):
+        batches = _batches()
+
+        async def run():
+            lags, stop = [], asyncio.Event()
+            ticker = asyncio.create_task(_ticker(lags, stop))
+            for batch in batches:
+                await self.db.upsert_videos(batch)
+            stop.set()
+            await ticker
+            return lags
+
+        lags = asyncio.run(run())
+        self.assertTrue(lags)
+        self.assertLess(max(lags), MAX_LAG, f"worst event-loop lag {max(lags) * 1000:.1f} ms")
+        self.assertEqual(asyncio.run(self.db.count_videos()), ROWS)
+
+
+if __name__ == "__main__":
+    unittest.main()